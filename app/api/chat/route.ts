@@ -3,10 +3,7 @@ import { type NextRequest, NextResponse } from "next/server"
 export async function POST(request: NextRequest) {
   try {
     const body = await request.json()
-    const { message, userId, language = "english", conversationHistory } = body
-
-    // Simulate AI processing delay
-    await new Promise((resolve) => setTimeout(resolve, 1500))
+    const { message, userId, language = "english" } = body
 
     // Mock AI responses based on message content and language
     let response = ""
@@ -91,7 +91,6 @@ export default function ChatbotPage() {
           message: content,
           userId: user?.uid,
           language: language,
-          conversationHistory: messages.slice(-5),
         }),
       })
 
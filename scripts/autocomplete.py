@@ -0,0 +1,170 @@
+"""
+Typeahead index for CareerPro J&K names and phrases
+Sorted array of word-start keys answering prefix lookups by bisection, for English and Hindi alike
+"""
+
+from bisect import bisect_left
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from transliteration import prefix_keys, text_keys, token_key, tokenize
+
+# Candidates ranked per lookup are capped at this many times the requested limit
+CANDIDATE_FACTOR = 4
+
+# Keys per block whose best rank is precomputed, so long ranges only scan their best blocks
+BLOCK_SIZE = 64
+
+# Distinct (prefix, limit, kinds) lookups remembered; short prefixes are the hot ones
+LOOKUP_CACHE_SIZE = 4096
+
+
+def normalize(text: str) -> str:
+    """Lookup form of ``text``: the script-neutral keys of its words joined by single spaces"""
+    return " ".join(text_keys(text))
+
+
+def lookup_keys(prefix: str) -> List[str]:
+    """Lookup forms that the entries completing a typed ``prefix`` start with; its last word may be partial"""
+    words = tokenize(prefix)
+    if not words:
+        return []
+    head = " ".join(token_key(word) for word in words[:-1])
+    return [f"{head} {key}" if head else key for key in prefix_keys(words[-1])]
+
+
+class PrefixIndex:
+    """Completions for a typed prefix from a fixed set of (text, kind) entries.
+
+    Every entry is stored under each of its word starts ("Government
+    Medical College, Srinagar" also under "medical college srinagar",
+    "college srinagar" and "srinagar"), all in one sorted list, so the
+    matches for a prefix are one contiguous range found by bisection.
+    Entries seen several times (a course offered by many colleges) weigh
+    more; matches at the start of an entry rank above matches later in it.
+    A short prefix can match most of the index, so the best rank of every
+    block of keys is kept per kind: the top candidates of a long range can
+    only lie in its highest-ranked blocks, and only those are scanned.
+    Keys are ``transliteration.token_key`` match keys, so a Devanagari or
+    Romanized Hindi prefix completes entries in either script; a partly
+    typed last word is looked up under each of its ``prefix_keys``.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str]]):
+        counts: Counter = Counter()
+        display: Dict[Tuple[str, str], str] = {}
+        for text, kind in entries:
+            key = (normalize(text), kind)
+            if key[0]:
+                counts[key] += 1
+                display.setdefault(key, text.strip())
+
+        self.texts: List[str] = []
+        self.kinds: List[str] = []
+        weights: List[int] = []
+        keys: List[Tuple[str, int, bool]] = []
+        for (normalized, kind), count in counts.items():
+            entry = len(self.texts)
+            self.texts.append(display[normalized, kind])
+            self.kinds.append(kind)
+            weights.append(count)
+            words = normalized.split(" ")
+            for position in range(len(words)):
+                keys.append((" ".join(words[position:]), entry, position == 0))
+        keys.sort()
+
+        self._keys = [key for key, _, _ in keys]
+        self._entries = np.array([entry for _, entry, _ in keys], dtype=np.int32)
+        # Matching the start of an entry outranks any weight; equal ranks order
+        # alphabetically, which makes every key's score distinct
+        weights_array = np.array(weights, dtype=float)
+        bonus = weights_array.max() + 1 if len(weights_array) else 1.0
+        ranks = weights_array[self._entries] + bonus * np.array([start for _, _, start in keys], dtype=float)
+        self._scores = ranks * (len(keys) + 1) - np.arange(len(keys))
+
+        self._kind_codes = {kind: code for code, kind in enumerate(sorted(set(self.kinds)))}
+        entry_kinds = np.array([self._kind_codes[kind] for kind in self.kinds], dtype=np.int8)
+        self._key_kinds = entry_kinds[self._entries]
+        blocks = -(-len(keys) // BLOCK_SIZE)
+        padded = np.full((len(self._kind_codes), blocks * BLOCK_SIZE), -np.inf)
+        padded[self._key_kinds, np.arange(len(keys))] = self._scores
+        self._block_scores = padded.reshape(len(self._kind_codes), blocks, BLOCK_SIZE).max(axis=2)
+        self.complete = lru_cache(maxsize=LOOKUP_CACHE_SIZE)(self._complete)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def _complete(self, prefix: str, limit: int = 8, kinds: Optional[Tuple[str, ...]] = None) -> List[Tuple[str, str]]:
+        ranges = []
+        for key in lookup_keys(prefix):
+            start = bisect_left(self._keys, key)
+            ranges.append((start, bisect_left(self._keys, key + "\U0010ffff", start)))
+        if not ranges:
+            return []
+
+        codes = list(range(len(self._kind_codes)))
+        if kinds is not None:
+            codes = [self._kind_codes[kind] for kind in kinds if kind in self._kind_codes]
+
+        # An entry matches once per word starting with the prefix, so widen the
+        # candidate set until enough distinct entries are found
+        count = limit * CANDIDATE_FACTOR
+        while True:
+            positions = self._best_of(ranges, codes, count)
+            results: List[Tuple[str, str]] = []
+            seen = set()
+            for entry in self._entries[positions].tolist():
+                if entry not in seen:
+                    seen.add(entry)
+                    results.append((self.texts[entry], self.kinds[entry]))
+                    if len(results) == limit:
+                        return results
+            if len(positions) < count:
+                return results
+            count *= 2
+
+    def _best_of(self, ranges: List[Tuple[int, int]], codes: List[int], count: int) -> np.ndarray:
+        """Positions of the ``count`` best scored keys of the given kinds across disjoint key ranges, best first"""
+        if len(ranges) == 1:
+            return self._best(*ranges[0], codes, count)
+        positions = np.concatenate([self._best(start, end, codes, count) for start, end in ranges])
+        return positions[np.argsort(-self._scores[positions])][:count]
+
+    def _best(self, start: int, end: int, codes: List[int], count: int) -> np.ndarray:
+        """Positions of the ``count`` best scored keys of the given kinds in [start, end), best first"""
+        if start == end or not codes:
+            return np.arange(0)
+        first_block = -(-start // BLOCK_SIZE)
+        last_block = end // BLOCK_SIZE
+        if last_block - first_block <= count:
+            positions = np.arange(start, end)
+        else:
+            # The best keys can only lie in the best blocks
+            block_scores = self._block_scores[codes, first_block:last_block].max(axis=0)
+            blocks = first_block + np.argpartition(-block_scores, count - 1)[:count]
+            inner = (blocks[:, None] * BLOCK_SIZE + np.arange(BLOCK_SIZE)).ravel()
+            positions = np.concatenate((np.arange(start, first_block * BLOCK_SIZE), inner, np.arange(last_block * BLOCK_SIZE, end)))
+        if len(codes) < len(self._kind_codes):
+            positions = positions[np.isin(self._key_kinds[positions], codes)]
+        scores = self._scores[positions]
+        if len(positions) > count:
+            best = np.argpartition(-scores, count - 1)[:count]
+            positions, scores = positions[best], scores[best]
+        return positions[np.argsort(-scores)]
+
+
+def autocomplete_entries(knowledge_base: Mapping[str, Any], suggestions: Iterable[str] = ()) -> List[Tuple[str, str]]:
+    """(text, kind) pairs for college, course, district, scholarship and exam names plus chat suggestions"""
+    entries: List[Tuple[str, str]] = []
+    for college in knowledge_base.get("colleges", []):
+        entries.append((str(college["name"]), "college"))
+        if college.get("district"):
+            entries.append((str(college["district"]), "district"))
+        entries.extend((str(course), "course") for course in college.get("courses", []))
+    entries.extend((str(scholarship["name"]), "scholarship") for scholarship in knowledge_base.get("scholarships", []))
+    entries.extend((str(exam["name"]), "exam") for exam in knowledge_base.get("entrance_exams", []))
+    entries.extend((phrase, "suggestion") for phrase in suggestions)
+    return entries
@@ -0,0 +1,125 @@
+"""
+Compact catalog records for CareerPro J&K
+Slotted read-only records with interned categorical values and their JSON encoded once, for colleges, scholarships and exams
+"""
+
+import keyword
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, FrozenSet, Iterator, List, Tuple, Type
+
+from catalog_models import JKCollege, JKEntranceExam, JKScholarship
+from response_cache import PreEncoded, encode_json
+
+
+class CatalogRecord(PreEncoded, Mapping):
+    """One catalog record stored in slots instead of a dict.
+
+    Subclasses are built by ``record_class`` from a catalog model, one slot
+    per field. Values of the ``interned`` fields (the items, for list
+    fields) are interned so all records share one copy of each district,
+    type or course name; lists are stored as tuples; keys the model does
+    not know go to ``extra``. The record reads like the dict it was built
+    from, except that absent and null fields are skipped, and ``json``
+    holds exactly that view (``as_data``) encoded once, so responses splice
+    it in instead of re-encoding.
+    """
+
+    __slots__ = ("json", "extra")
+    fields: Tuple[Tuple[str, str], ...] = ()
+    interned: FrozenSet[str] = frozenset()
+    _slots: Dict[str, str] = {}
+
+    def __init__(self, data: Mapping[str, Any]):
+        for key, slot in self.fields:
+            value = data.get(key)
+            if key in self.interned and value is not None:
+                value = tuple(sys.intern(str(item)) for item in value) if isinstance(value, list) else sys.intern(str(value))
+            elif isinstance(value, list):
+                value = tuple(value)
+            object.__setattr__(self, slot, value)
+        extra = {key: value for key, value in data.items() if key not in self._slots and value is not None}
+        object.__setattr__(self, "extra", extra or None)
+        # orjson hands back its whole output buffer; a copy keeps only the encoded bytes alive
+        object.__setattr__(self, "json", bytes(memoryview(encode_json(self.as_data()))))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __getitem__(self, key: str) -> Any:
+        slot = self._slots.get(key)
+        if slot is not None:
+            value = getattr(self, slot)
+            if value is not None:
+                return value
+        elif self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for key, slot in self.fields:
+            if getattr(self, slot) is not None:
+                yield key
+        if self.extra is not None:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CatalogRecord):
+            return self.json == other.json or self.as_data() == other.as_data()
+        if isinstance(other, Mapping):
+            return self.as_data() == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.as_data()!r})"
+
+    def __reduce__(self):
+        return type(self), (self.as_data(),)
+
+    def as_data(self) -> Dict[str, Any]:
+        """The record as a plain dict, lists included"""
+        return {key: list(value) if isinstance(value, tuple) else value for key, value in self.items()}
+
+
+def record_class(name: str, model: Any, interned: Tuple[str, ...]) -> Type[CatalogRecord]:
+    """A CatalogRecord subclass with one slot per field of the pydantic ``model``"""
+    fields = tuple(
+        (field.alias or attribute, attribute + "_" if keyword.iskeyword(attribute) else attribute)
+        for attribute, field in model.model_fields.items()
+    )
+    return type(name, (CatalogRecord,), {
+        "__module__": __name__,
+        "__slots__": tuple(slot for _, slot in fields),
+        "fields": fields,
+        "interned": frozenset(interned),
+        "_slots": dict(fields),
+    })
+
+
+College = record_class("College", JKCollege, ("district", "type", "courses", "specialties"))
+Scholarship = record_class("Scholarship", JKScholarship, ("district", "courses"))
+EntranceExam = record_class("EntranceExam", JKEntranceExam, ("for", "district", "courses"))
+
+# Record class each catalog section is stored as once loaded
+SECTION_RECORDS: Dict[str, Type[CatalogRecord]] = {
+    "colleges": College,
+    "scholarships": Scholarship,
+    "entrance_exams": EntranceExam,
+}
+
+
+def compact_section(name: str, data: Any) -> Any:
+    """Convert the records of a catalog section to compact records; other sections are returned as they are"""
+    record = SECTION_RECORDS.get(name)
+    if record is None or not isinstance(data, list):
+        return data
+    records: List[Any] = []
+    for item in data:
+        records.append(record(item) if isinstance(item, dict) else item)
+    return records
+
@@ -0,0 +1,71 @@
+"""
+Catalog record models for CareerPro J&K
+Validation schemas for the colleges, scholarships and entrance exams held in the knowledge base
+"""
+
+from typing import Dict, List, Optional, Type
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from timeline_index import parse_date_range
+
+
+def _check_date(value: str) -> str:
+    if parse_date_range(value) is None:
+        raise ValueError(f"unrecognised date '{value}', expected e.g. 'January 15, 2025' or 'May 2025'")
+    return value
+
+
+class JKCollege(BaseModel):
+    name: str = Field(min_length=1)
+    location: Optional[str] = None
+    district: str
+    type: str
+    courses: List[str]
+    fees: str
+    rating: float = Field(ge=0, le=5)
+    website: str
+    phone: str
+    lat: Optional[float] = Field(None, ge=-90, le=90)
+    lng: Optional[float] = Field(None, ge=-180, le=180)
+    specialties: List[str] = []
+
+
+class JKScholarship(BaseModel):
+    name: str = Field(min_length=1)
+    eligibility: str
+    amount: str
+    deadline: str
+    website: str
+    district: Optional[str] = None
+    courses: Optional[List[str]] = None
+
+    @field_validator("deadline")
+    @classmethod
+    def check_deadline(cls, value: str) -> str:
+        return _check_date(value)
+
+
+class JKEntranceExam(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    name: str = Field(min_length=1)
+    for_: str = Field(alias="for")
+    registration_deadline: str
+    exam_date: str
+    website: str
+    district: Optional[str] = None
+    courses: Optional[List[str]] = None
+
+    @field_validator("registration_deadline", "exam_date")
+    @classmethod
+    def check_dates(cls, value: str) -> str:
+        return _check_date(value)
+
+
+# Model every record of a catalog section is validated against before it is stored
+SECTION_MODELS: Dict[str, Type[BaseModel]] = {
+    "colleges": JKCollege,
+    "scholarships": JKScholarship,
+    "entrance_exams": JKEntranceExam,
+}
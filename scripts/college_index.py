@@ -0,0 +1,247 @@
+"""
+In-memory college index for CareerPro J&K
+Answers district, course and rating/fee filters without scanning the college list, in English, Hindi or Romanized Hindi
+"""
+
+import base64
+import math
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from numeric_columns import RangeColumn, order_rows, parse_amount_range
+from transliteration import FuzzyIndex, text_keys
+
+# Course name keys are indexed by every substring up to this length
+GRAM_SIZE = 3
+
+# Distinct district and course filter values whose keys are remembered
+FILTER_CACHE_SIZE = 1024
+
+# Orders /colleges can return rows in; a leading "-" sorts descending
+SORT_KEYS = ("fee", "rating")
+
+
+def _grams(text: str, size: int) -> Set[str]:
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def parse_sort(sort: str) -> Tuple[str, bool]:
+    """Split "-rating" into ("rating", True), raising ValueError for an unknown key"""
+    key = sort[1:] if sort.startswith("-") else sort
+    if key not in SORT_KEYS:
+        raise ValueError(f"Unknown sort: {sort}. Expected one of: {', '.join(SORT_KEYS)}, optionally prefixed with -")
+    return key, sort.startswith("-")
+
+
+class SortedColumn:
+    """A numeric column by row plus its rows in value order, so range filters are one binary search"""
+
+    def __init__(self, values: np.ndarray):
+        self.values = values
+        # argsort puts NaN (no value) last; searches only look at the rows before them
+        self.rows = np.argsort(values, kind="stable")
+        self._present = int(np.count_nonzero(~np.isnan(values)))
+        self._sorted = values[self.rows[:self._present]]
+
+    def at_least(self, minimum: float) -> np.ndarray:
+        return self.rows[np.searchsorted(self._sorted, minimum, "left"):self._present]
+
+    def at_most(self, maximum: float) -> np.ndarray:
+        return self.rows[:np.searchsorted(self._sorted, maximum, "right")]
+
+    def count_at_least(self, minimum: float) -> int:
+        return self._present - int(np.searchsorted(self._sorted, minimum, "left"))
+
+    def count_at_most(self, maximum: float) -> int:
+        return int(np.searchsorted(self._sorted, maximum, "right"))
+
+
+class CollegeIndex:
+    """Hash, n-gram and sorted-column indexes over a list of college records.
+
+    Rows are identified by their position in ``colleges``, so results come
+    back in catalog order (or the requested sort) and a cursor is simply
+    the last row returned. Ratings and the fee range parsed from the
+    ``fees`` text are kept as arrays, so the filters on them are vectorized
+    over the candidate rows.
+
+    Districts and course names are compared by the match keys of their
+    words (``transliteration.token_key``), so श्रीनगर and "Shrinagar" find
+    Srinagar. A filter value that matches nothing as written has each word
+    corrected to the nearest district or course word and is tried again.
+    """
+
+    def __init__(self, colleges: Iterable[Dict[str, Any]]):
+        self.colleges: List[Dict[str, Any]] = list(colleges)
+        self.all_rows: List[int] = list(range(len(self.colleges)))
+        self._by_district: Dict[str, List[int]] = {}
+        self._district_codes: Dict[str, int] = {}
+        self._by_gram: Dict[str, Set[int]] = {}
+        # Course name keys per row, used to confirm n-gram candidates
+        self._course_text: List[str] = []
+        # Match key of each distinct district and course name; catalogs repeat them across rows
+        keys: Dict[str, str] = {}
+
+        district_codes = np.empty(len(self.colleges), dtype=np.int32)
+        for row, college in enumerate(self.colleges):
+            district = keys.get(college["district"])
+            if district is None:
+                district = keys[college["district"]] = " ".join(text_keys(college["district"]))
+            district_codes[row] = self._district_codes.setdefault(district, len(self._district_codes))
+            self._by_district.setdefault(district, []).append(row)
+            course_names = []
+            for name in college.get("courses", []):
+                key = keys.get(name)
+                if key is None:
+                    key = keys[name] = " ".join(text_keys(name))
+                course_names.append(key)
+            self._course_text.append("\n".join(course_names))
+            for name in course_names:
+                for size in range(1, GRAM_SIZE + 1):
+                    for gram in _grams(name, size):
+                        self._by_gram.setdefault(gram, set()).add(row)
+
+        self._district = district_codes
+        self._course_names = sorted({name for names in self._course_text for name in names.split("\n") if name})
+        self._district_words = FuzzyIndex(word for district in self._district_codes for word in district.split(" "))
+        self._course_words = FuzzyIndex(word for name in self._course_names for word in name.split(" "))
+        self.district_key = lru_cache(maxsize=FILTER_CACHE_SIZE)(self._district_key)
+        self.course_key = lru_cache(maxsize=FILTER_CACHE_SIZE)(self._course_key)
+        ratings = [college.get("rating") for college in self.colleges]
+        self.ratings = np.array([math.nan if rating is None else rating for rating in ratings], dtype=np.float64)
+        self.fees = RangeColumn((college.get("fees") for college in self.colleges), parse_amount_range)
+        self._rating = SortedColumn(self.ratings)
+        # A college is within a fee budget if its cheapest option is
+        self._fee = SortedColumn(self.fees.low)
+
+    def _district_key(self, district: str) -> str:
+        """Key of the district ``district`` names, as written or with misspelt words corrected"""
+        key = " ".join(text_keys(district))
+        if key in self._district_codes:
+            return key
+        return " ".join(self._district_words.correct(word) for word in key.split(" "))
+
+    def _course_key(self, course: str) -> str:
+        """Key to find ``course`` by in the course name keys, as written if it occurs there, else with misspelt words corrected"""
+        key = " ".join(text_keys(course))
+        if not key or any(key in name for name in self._course_names):
+            return key
+        return " ".join(self._course_words.correct(word) for word in key.split(" "))
+
+    def _course_postings(self, course: str) -> List[Set[int]]:
+        """Posting sets, smallest first, whose intersection covers every row offering ``course``"""
+        if len(course) <= GRAM_SIZE:
+            return [self._by_gram.get(course, set())]
+        return sorted((self._by_gram.get(gram, set()) for gram in _grams(course, GRAM_SIZE)), key=len)
+
+    def query(
+        self,
+        district: Optional[str] = None,
+        course: Optional[str] = None,
+        min_rating: Optional[float] = None,
+        max_fee: Optional[float] = None,
+        sort: Optional[str] = None,
+    ) -> List[int]:
+        """Return the rows matching every given filter, in catalog order unless ``sort`` is given.
+
+        Only the most selective filter is expanded into rows; the others are
+        checked against the candidates, so the cost follows the smallest
+        result set.
+        """
+        order = parse_sort(sort) if sort else None
+        district = self.district_key(district) if district else None
+        course = self.course_key(course) if course else None
+
+        # (estimated size, candidate rows) for each filter that can drive the lookup;
+        # column ranges are only sliced once chosen
+        drivers: List[Tuple[int, Callable[[], Iterable[int]]]] = []
+        if district:
+            district_rows = self._by_district.get(district, [])
+            drivers.append((len(district_rows), lambda: district_rows))
+        if course:
+            postings = self._course_postings(course)
+            drivers.append((len(postings[0]), lambda: postings[0].intersection(*postings[1:])))
+        if min_rating is not None:
+            drivers.append((self._rating.count_at_least(min_rating), lambda: self._rating.at_least(min_rating)))
+        if max_fee is not None:
+            drivers.append((self._fee.count_at_most(max_fee), lambda: self._fee.at_most(max_fee)))
+
+        if not drivers:
+            rows = np.arange(len(self.colleges))
+        else:
+            candidates = min(drivers, key=lambda driver: driver[0])[1]()
+            if isinstance(candidates, set):
+                candidates = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+            rows = np.sort(np.asarray(candidates, dtype=np.int64))
+
+            mask = np.ones(len(rows), dtype=bool)
+            if district:
+                mask &= self._district[rows] == self._district_codes.get(district, -1)
+            if min_rating is not None:
+                mask &= self.ratings[rows] >= min_rating
+            if max_fee is not None:
+                mask &= self.fees.low[rows] <= max_fee
+            rows = rows[mask]
+            if course:
+                rows = rows[[course in self._course_text[row] for row in rows.tolist()]]
+
+        if order is None:
+            return self.all_rows if not drivers else rows.tolist()
+        key, descending = order
+        return order_rows(rows, self._sort_values(key), descending).tolist()
+
+    def _sort_values(self, key: str) -> np.ndarray:
+        return self.fees.low if key == "fee" else self.ratings
+
+    def sort_key(self, sort: str) -> Callable[[int], Tuple[bool, float, int]]:
+        """Key of a row's position in rows returned by ``query(sort=sort)``: valued rows by value, then by row"""
+        key, descending = parse_sort(sort)
+        values = self._sort_values(key).tolist()
+        sign = -1.0 if descending else 1.0
+
+        def position(row: int) -> Tuple[bool, float, int]:
+            value = values[row]
+            # NaN (no value) sorts after every value, in either direction
+            return (True, 0.0, row) if value != value else (False, sign * value, row)
+
+        return position
+
+    def page(
+        self,
+        rows: List[int],
+        limit: Optional[int] = None,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        sort: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Slice ``rows``, as returned by ``query`` with the same ``sort``, into a page of colleges and the cursor for the next page"""
+        start = 0
+        if cursor:
+            after = decode_cursor(cursor)
+            if sort is None:
+                start = bisect_right(rows, after)
+            elif 0 <= after < len(self.colleges):
+                position = self.sort_key(sort)
+                start = bisect_right(rows, position(after), key=position)
+            else:
+                raise ValueError(f"Invalid cursor: {cursor}")
+        start += offset
+        end = len(rows) if limit is None else start + limit
+        selected = rows[start:end]
+        next_cursor = encode_cursor(selected[-1]) if selected and end < len(rows) else None
+        return [self.colleges[row] for row in selected], next_cursor
+
+
+def encode_cursor(row: int) -> str:
+    return base64.urlsafe_b64encode(str(row).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decode a pagination cursor, raising ValueError if it is malformed"""
+    try:
+        return int(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode())
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
@@ -0,0 +1,38 @@
+"""
+Shared pytest fixtures for CareerPro J&K backend tests
+The app runs in-process under FastAPI's TestClient, on the built-in knowledge base unless a test asks for SQLite
+"""
+
+from typing import Dict
+
+import pytest
+from fastapi.testclient import TestClient
+
+import fastapi_backend as backend
+from knowledge_base import BUILTIN_KNOWLEDGE_BASE, SQLiteSource, write_sqlite
+
+ADMIN_TOKEN = "test-admin-token"
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(backend.app) as client:
+        yield client
+
+
+@pytest.fixture
+def admin_headers(monkeypatch) -> Dict[str, str]:
+    """Configure an admin token for one test and return the headers that carry it"""
+    monkeypatch.setattr(backend, "ADMIN_TOKEN", ADMIN_TOKEN)
+    return {"Authorization": f"Bearer {ADMIN_TOKEN}"}
+
+
+@pytest.fixture
+def sqlite_knowledge_base(tmp_path, monkeypatch):
+    """Serve a SQLite copy of the built-in data for one test, then go back to the built-in data"""
+    path = str(tmp_path / "kb.db")
+    write_sqlite(path, BUILTIN_KNOWLEDGE_BASE)
+    monkeypatch.setattr(backend.JK_KNOWLEDGE_BASE, "source", SQLiteSource(path))
+    yield path
+    monkeypatch.undo()
+    backend.JK_KNOWLEDGE_BASE.reload(force=True)
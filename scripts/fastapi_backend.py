@@ -3,23 +3,53 @@ FastAPI Backend for CareerPro J&K
 Provides chat endpoint and J&K-specific career guidance APIs
 """
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, ValidationError
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator, Iterator, Union
+import asyncio
+import io
 import json
+import os
+import re
+import secrets
+import signal
+import tempfile
+import threading
 import uvicorn
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from autocomplete import PrefixIndex, autocomplete_entries
+from catalog import compact_section
+from catalog_models import SECTION_MODELS
+from college_index import CollegeIndex
+from geo_index import GeoIndex
+from ingest import FORMATS, ingest, read_rows
+from intent_classifier import IntentClassifier
+from knowledge_base import KnowledgeBase, SQLiteSource
+from metrics import PROMETHEUS_CONTENT_TYPE, MetricsMiddleware, MetricsRegistry
+from profiler import SamplingProfiler
+from quiz_scorer import QuizScorer
+from recommender import SORT_BY as RECOMMENDATION_SORTS, CareerScorer
+from response_cache import FastJSONResponse, ResponseCache, cache_key, encode_json
+from search_index import SearchIndex, knowledge_base_documents
+from session_store import ContextTooLarge, session_store_from_env
+from structured_logging import configure_logging
+from timeline_index import TimelineIndex, event_status, timeline_events
+from worker_pool import PoolSaturated, worker_pool_from_env
+
+# Configure logging: JSON lines written in batches off the request path (see structured_logging)
+LOG_HANDLER = configure_logging()
 logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="CareerPro J&K API",
     description="Career guidance API for Jammu & Kashmir students",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
 )
 
 # CORS middleware for Next.js frontend
@@ -31,6 +61,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-process metrics labelled by worker pid, served in Prometheus text format at /metrics
+METRICS = MetricsRegistry()
+REQUESTS_IN_FLIGHT = METRICS.gauge("careerpro_http_requests_in_flight", "HTTP requests currently being served", ["method"])
+REQUEST_LATENCY = METRICS.histogram(
+    "careerpro_http_request_duration_seconds", "HTTP request latency by route template", ["method", "route", "status"]
+)
+CHAT_INTENTS = METRICS.counter("careerpro_chat_intents_total", "Chat messages by language and detected intent", ["language", "intent"])
+app.add_middleware(MetricsMiddleware, requests_in_flight=REQUESTS_IN_FLIGHT, request_latency=REQUEST_LATENCY)
+
+# Opt-in sampling profiler (CAREERPRO_PROFILER=1): GET /debug/profile with the admin token, or SIGUSR2 to start and again to dump
+PROFILER = SamplingProfiler() if os.environ.get("CAREERPRO_PROFILER") == "1" else None
+if PROFILER is not None and threading.current_thread() is threading.main_thread():
+    PROFILER.install_signal_toggle(signal.SIGUSR2, tempfile.gettempdir())
+
 # Data Models
 class ChatMessage(BaseModel):
     message: str
@@ -44,16 +88,13 @@ class ChatResponse(BaseModel):
     resources: List[Dict[str, str]]
     timestamp: datetime
 
-class JKCollege(BaseModel):
-    name: str
-    location: str
-    district: str
-    type: str
-    courses: List[str]
-    fees: str
-    rating: float
-    website: str
-    phone: str
+class QuizSubmission(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    user_id: Optional[str] = Field(None, alias="userId")
+    answers: Dict[str, Union[int, str]]
+    skills: List[str] = []
+    top_k: Optional[StrictInt] = None
 
 class CareerRecommendation(BaseModel):
     title: str
@@ -63,94 +104,119 @@ class CareerRecommendation(BaseModel):
     salary_range: str
     growth_rate: str
 
-# J&K Specific Knowledge Base
-JK_KNOWLEDGE_BASE = {
-    "colleges": [
-        {
-            "name": "Government College for Women, Srinagar",
-            "district": "Srinagar",
-            "type": "Government",
-            "courses": ["B.A.", "B.Sc.", "B.Com", "M.A.", "M.Sc."],
-            "fees": "₹8,000 - ₹15,000 per year",
-            "rating": 4.2,
-            "website": "https://gcwsrinagar.edu.in",
-            "phone": "+91-194-2452789",
-            "specialties": ["Women's Education", "Arts", "Science", "Commerce"]
-        },
-        {
-            "name": "Government College of Engineering & Technology, Jammu",
-            "district": "Jammu",
-            "type": "Government",
-            "courses": ["B.Tech CSE", "B.Tech ECE", "B.Tech ME", "B.Tech CE"],
-            "fees": "₹45,000 - ₹65,000 per year",
-            "rating": 4.3,
-            "website": "https://gcetjammu.ac.in",
-            "phone": "+91-191-2434567",
-            "specialties": ["Engineering", "Technology", "Placement Cell"]
-        },
-        {
-            "name": "Government Medical College, Srinagar",
-            "district": "Srinagar",
-            "type": "Government",
-            "courses": ["MBBS", "MD", "MS", "Diploma Courses"],
-            "fees": "₹25,000 - ₹35,000 per year",
-            "rating": 4.5,
-            "website": "https://gmcsrinagar.edu.in",
-            "phone": "+91-194-2401234",
-            "specialties": ["Medical Education", "Healthcare", "Research"]
-        }
-    ],
-    "scholarships": [
-        {
-            "name": "J&K Merit Scholarship",
-            "eligibility": "Students with 80%+ marks in 12th",
-            "amount": "₹50,000 per year",
-            "deadline": "January 15, 2025",
-            "website": "https://jkscholarships.gov.in"
-        },
-        {
-            "name": "Chief Minister's Scholarship",
-            "eligibility": "Economically weaker sections",
-            "amount": "₹25,000 per year",
-            "deadline": "February 28, 2025",
-            "website": "https://jkscholarships.gov.in"
-        }
-    ],
-    "entrance_exams": [
-        {
-            "name": "JEE Main",
-            "for": "Engineering Admissions",
-            "registration_deadline": "December 15, 2024",
-            "exam_date": "January 2025",
-            "website": "https://jeemain.nta.nic.in"
-        },
-        {
-            "name": "NEET",
-            "for": "Medical Admissions",
-            "registration_deadline": "December 20, 2024",
-            "exam_date": "May 2025",
-            "website": "https://neet.nta.nic.in"
-        }
-    ],
-    "career_paths": {
-        "engineering": {
-            "opportunities": ["Software Developer", "Civil Engineer", "Government Jobs"],
-            "salary_range": "₹3.5 - 8 LPA",
-            "growth_prospects": "High demand in J&K IT sector and infrastructure development"
-        },
-        "medical": {
-            "opportunities": ["Doctor", "Medical Officer", "Specialist"],
-            "salary_range": "₹6 - 15 LPA",
-            "growth_prospects": "High demand in J&K healthcare sector"
-        },
-        "arts": {
-            "opportunities": ["Teacher", "Civil Services", "Content Writer"],
-            "salary_range": "₹2.5 - 6 LPA",
-            "growth_prospects": "Government jobs and education sector opportunities"
-        }
-    }
+# J&K Specific Knowledge Base, read from CAREERPRO_KB_PATH when set, catalog sections held as compact records
+JK_KNOWLEDGE_BASE = KnowledgeBase.from_env(prepare=compact_section)
+
+# Indexes over the knowledge base, built once at load time
+CAREER_SCORER = CareerScorer(JK_KNOWLEDGE_BASE["careers"], JK_KNOWLEDGE_BASE["career_paths"])
+
+def build_geo_index(colleges: List[Dict[str, Any]]) -> GeoIndex:
+    """Spatial index over the colleges that have coordinates, keyed by catalog row"""
+    return GeoIndex(
+        (row, college["lat"], college["lng"])
+        for row, college in enumerate(colleges)
+        if college.get("lat") is not None and college.get("lng") is not None
+    )
+
+def build_college_indexes() -> Tuple[CollegeIndex, GeoIndex]:
+    """Filter and spatial indexes over one snapshot of the colleges; the spatial one refers to rows of the other"""
+    college_index = CollegeIndex(JK_KNOWLEDGE_BASE["colleges"])
+    return college_index, build_geo_index(college_index.colleges)
+
+# Swapped as one tuple on reload; read it once per request so both halves come from the same catalog
+COLLEGE_INDEXES = build_college_indexes()
+TIMELINE_INDEX = TimelineIndex(timeline_events(JK_KNOWLEDGE_BASE))
+QUIZ_SCORER = QuizScorer(JK_KNOWLEDGE_BASE.get("quiz_questions", []))
+SEARCH_INDEX = SearchIndex(knowledge_base_documents(JK_KNOWLEDGE_BASE))
+
+def rebuild_indexes():
+    """Rebuild the indexes over the knowledge-base sections that changed in a hot reload"""
+    global COLLEGE_INDEXES, CAREER_SCORER, TIMELINE_INDEX, QUIZ_SCORER, SEARCH_INDEX, AUTOCOMPLETE_INDEX
+    changed = JK_KNOWLEDGE_BASE.changed_sections
+
+    def stale(*sections: str) -> bool:
+        return changed is None or not changed.isdisjoint(sections)
+
+    if stale("colleges"):
+        COLLEGE_INDEXES = build_college_indexes()
+    if stale("careers", "career_paths"):
+        CAREER_SCORER = CareerScorer(JK_KNOWLEDGE_BASE["careers"], JK_KNOWLEDGE_BASE["career_paths"])
+    if stale("scholarships", "entrance_exams"):
+        TIMELINE_INDEX = TimelineIndex(timeline_events(JK_KNOWLEDGE_BASE))
+    if stale("quiz_questions"):
+        QUIZ_SCORER = QuizScorer(JK_KNOWLEDGE_BASE.get("quiz_questions", []))
+    if stale("colleges", "scholarships", "entrance_exams"):
+        AUTOCOMPLETE_INDEX = build_autocomplete_index()
+    # Every section is searchable
+    if changed is None or changed:
+        SEARCH_INDEX = SearchIndex(knowledge_base_documents(JK_KNOWLEDGE_BASE))
+
+JK_KNOWLEDGE_BASE.on_reload(rebuild_indexes)
+
+# Encoded catalog responses, invalidated whenever the knowledge base version changes
+RESPONSE_CACHE = ResponseCache(version=lambda: JK_KNOWLEDGE_BASE.version)
+JK_KNOWLEDGE_BASE.on_reload(RESPONSE_CACHE.clear)
+
+# Server-side conversation history, keyed by user_id
+SESSION_STORE = session_store_from_env()
+
+# Bearer token for the /admin endpoints and session inspection, which answer 404 while it is unset
+ADMIN_TOKEN = os.environ.get("CAREERPRO_ADMIN_TOKEN")
+
+def require_admin_token(request: Request) -> None:
+    """Reject the request unless it carries the admin bearer token"""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not secrets.compare_digest(token.encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Invalid admin token", headers={"WWW-Authenticate": "Bearer"})
+
+# Bounded pools for CPU-heavy handlers, sized per endpoint with CAREERPRO_POOL_<NAME>_WORKERS,
+# _QUEUE and _KIND (thread or process); cheap and cached handlers stay on the event loop
+WORKER_POOLS = {
+    "recommendations": worker_pool_from_env("recommendations", workers=4, queue_size=32),
+    "nearby": worker_pool_from_env("nearby", workers=2, queue_size=16),
+    # One ingestion at a time, always off the event loop; another arriving meanwhile is told to retry
+    "ingest": worker_pool_from_env("ingest", workers=1, queue_size=0, inline_ms=0),
 }
 
+@app.exception_handler(PoolSaturated)
+async def pool_saturated_handler(request: Request, exc: PoolSaturated):
+    logger.warning(f"Rejecting {request.url.path}: worker pool '{exc.pool.name}' is saturated")
+    return JSONResponse(
+        status_code=exc.pool.status_code,
+        content={"detail": "Server is busy, please retry shortly"},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+@app.exception_handler(ContextTooLarge)
+async def context_too_large_handler(request: Request, exc: ContextTooLarge):
+    return JSONResponse(status_code=413, content={"detail": str(exc)})
+
+# Number of careers returned by /recommendations unless the request sets top_k
+DEFAULT_RECOMMENDATIONS = 5
+MAX_RECOMMENDATIONS = 50
+
+# Results returned by /search unless the request sets limit
+DEFAULT_SEARCH_RESULTS = 10
+MAX_SEARCH_RESULTS = 100
+MAX_SEARCH_QUERY_LENGTH = 200
+
+# Completions returned by /autocomplete unless the request sets limit
+DEFAULT_COMPLETIONS = 8
+MAX_COMPLETIONS = 50
+AUTOCOMPLETE_KINDS = ("college", "course", "district", "scholarship", "exam", "suggestion")
+
+# Profiles scored together per matrix product by /recommendations/batch
+RECOMMENDATION_BATCH_SIZE = 512
+
+# Largest /recommendations/batch body and cohort accepted
+MAX_BATCH_BODY_BYTES = 16 * 1024 * 1024
+MAX_BATCH_PROFILES = 50_000
+
+# Pause before offering the next batch of an accepted cohort to a saturated pool again
+BATCH_RETRY_SECONDS = 0.05
+
 # Chat Response Templates
 CHAT_RESPONSES = {
     "english": {
@@ -171,89 +237,220 @@ CHAT_RESPONSES = {
     }
 }
 
-def get_chat_response(message: str, language: str = "english") -> ChatResponse:
-    """Generate AI response for J&K-specific career queries"""
-    message_lower = message.lower()
-    responses = CHAT_RESPONSES.get(language, CHAT_RESPONSES["english"])
-    
-    # Determine intent and generate response
-    if any(word in message_lower for word in ["hello", "hi", "namaste", "नमस्ते"]):
-        response_text = responses["greeting"]
-        suggestions = [
+# Intent keywords, in priority order: the first intent with a matching keyword wins.
+# Devanagari keywords also match their Romanized spellings ("chhatravritti", "naukri")
+INTENT_KEYWORDS = {
+    "greeting": ["hello", "hi", "namaste", "नमस्ते", "नमस्कार"],
+    "college_info": ["college", "कॉलेज", "university", "विश्वविद्यालय"],
+    "scholarship_info": ["scholarship", "छात्रवृत्ति", "वज़ीफ़ा", "financial aid"],
+    "exam_info": ["exam", "परीक्षा", "entrance", "प्रवेश"],
+    "career_guidance": ["career", "करियर", "job", "नौकरी", "रोज़गार"],
+}
+
+# Built once at startup and shared by every request
+INTENT_CLASSIFIER = IntentClassifier(INTENT_KEYWORDS)
+
+# Follow-up suggestions offered for each intent, per response language
+CHAT_SUGGESTIONS = {
+    "english": {
+        "greeting": [
             "Tell me about J&K government colleges",
             "What scholarships are available?",
             "Entrance exam information",
             "Career opportunities in J&K"
-        ]
-        resources = []
-        
-    elif any(word in message_lower for word in ["college", "कॉलेज", "university", "विश्वविद्यालय"]):
-        response_text = responses["college_info"]
-        suggestions = [
+        ],
+        "college_info": [
             "Engineering colleges in J&K",
             "Medical colleges in J&K",
             "Arts colleges in Srinagar",
             "Admission process"
-        ]
-        resources = [
-            {"title": college["name"], "url": college["website"], "type": "college"}
-            for college in JK_KNOWLEDGE_BASE["colleges"][:3]
-        ]
-        
-    elif any(word in message_lower for word in ["scholarship", "छात्रवृत्ति", "financial aid"]):
-        response_text = responses["scholarship_info"]
-        suggestions = [
+        ],
+        "scholarship_info": [
             "Merit-based scholarships",
             "Need-based scholarships",
             "Application deadlines",
             "Eligibility criteria"
-        ]
-        resources = [
-            {"title": scholarship["name"], "url": scholarship["website"], "type": "scholarship"}
-            for scholarship in JK_KNOWLEDGE_BASE["scholarships"]
-        ]
-        
-    elif any(word in message_lower for word in ["exam", "परीक्षा", "entrance", "प्रवेश"]):
-        response_text = responses["exam_info"]
-        suggestions = [
+        ],
+        "exam_info": [
             "JEE Main registration",
             "NEET application",
             "Exam dates",
             "Preparation tips"
-        ]
-        resources = [
-            {"title": exam["name"], "url": exam["website"], "type": "exam"}
-            for exam in JK_KNOWLEDGE_BASE["entrance_exams"]
-        ]
-        
-    elif any(word in message_lower for word in ["career", "करियर", "job", "नौकरी"]):
-        response_text = responses["career_guidance"]
-        suggestions = [
+        ],
+        "career_guidance": [
             "Engineering careers",
             "Medical careers",
             "Government jobs",
             "Private sector opportunities"
-        ]
-        resources = [
-            {"title": "J&K Career Opportunities", "url": "#", "type": "career"},
-            {"title": "Government Job Portal", "url": "#", "type": "job"}
-        ]
-        
-    else:
-        response_text = responses["default"]
-        suggestions = [
+        ],
+        "default": [
             "Show me J&K colleges",
             "Available scholarships",
             "Entrance exam dates",
             "Career guidance"
         ]
-        resources = []
+    },
+    "hindi": {
+        "greeting": [
+            "जम्मू-कश्मीर के सरकारी कॉलेजों के बारे में बताएं",
+            "कौन सी छात्रवृत्तियां उपलब्ध हैं?",
+            "प्रवेश परीक्षा की जानकारी",
+            "जम्मू-कश्मीर में करियर के अवसर"
+        ],
+        "college_info": [
+            "जम्मू-कश्मीर के इंजीनियरिंग कॉलेज",
+            "जम्मू-कश्मीर के मेडिकल कॉलेज",
+            "श्रीनगर के आर्ट्स कॉलेज",
+            "प्रवेश प्रक्रिया"
+        ],
+        "scholarship_info": [
+            "मेरिट आधारित छात्रवृत्तियां",
+            "आवश्यकता आधारित छात्रवृत्तियां",
+            "आवेदन की अंतिम तिथि",
+            "पात्रता मानदंड"
+        ],
+        "exam_info": [
+            "जेईई मेन पंजीकरण",
+            "नीट आवेदन",
+            "परीक्षा की तिथियां",
+            "तैयारी के सुझाव"
+        ],
+        "career_guidance": [
+            "इंजीनियरिंग करियर",
+            "मेडिकल करियर",
+            "सरकारी नौकरियां",
+            "निजी क्षेत्र के अवसर"
+        ],
+        "default": [
+            "जम्मू-कश्मीर के कॉलेज दिखाएं",
+            "उपलब्ध छात्रवृत्तियां",
+            "प्रवेश परीक्षा की तिथियां",
+            "करियर मार्गदर्शन"
+        ]
+    }
+}
+
+# Sentence and clause ends in English and Hindi (the danda), where response templates are cut into phrases
+_PHRASE_END = re.compile(r"[.!?:।]+(?:\s+|$)")
+
+def chat_phrases() -> List[str]:
+    """Chat suggestions and the sentences of the response templates, in every language"""
+    phrases = []
+    for language in CHAT_RESPONSES:
+        phrases.extend(phrase for suggestions in CHAT_SUGGESTIONS[language].values() for phrase in suggestions)
+        for response in CHAT_RESPONSES[language].values():
+            phrases.extend(phrase for phrase in _PHRASE_END.split(response) if phrase)
+    return phrases
+
+def build_autocomplete_index() -> PrefixIndex:
+    """Typeahead over catalog names, courses, districts and the chat phrases of both languages"""
+    return PrefixIndex(autocomplete_entries(JK_KNOWLEDGE_BASE, chat_phrases()))
+
+AUTOCOMPLETE_INDEX = build_autocomplete_index()
+
+# Distinct (language, intent, knowledge-base version) payloads kept in memory
+CHAT_PAYLOAD_CACHE_SIZE = 256
+
+def get_chat_resources(intent: str) -> List[Dict[str, str]]:
+    """Knowledge-base links attached to a chat response"""
+    if intent == "college_info":
+        return [
+            {"title": college["name"], "url": college["website"], "type": "college"}
+            for college in JK_KNOWLEDGE_BASE["colleges"][:3]
+        ]
+    if intent == "scholarship_info":
+        return [
+            {"title": scholarship["name"], "url": scholarship["website"], "type": "scholarship"}
+            for scholarship in JK_KNOWLEDGE_BASE["scholarships"]
+        ]
+    if intent == "exam_info":
+        return [
+            {"title": exam["name"], "url": exam["website"], "type": "exam"}
+            for exam in JK_KNOWLEDGE_BASE["entrance_exams"]
+        ]
+    if intent == "career_guidance":
+        return [
+            {"title": "J&K Career Opportunities", "url": "#", "type": "career"},
+            {"title": "Government Job Portal", "url": "#", "type": "job"}
+        ]
+    return []
+
+@lru_cache(maxsize=CHAT_PAYLOAD_CACHE_SIZE)
+def get_chat_payload(language: str, intent: str, kb_version: int) -> Tuple[Dict[str, Any], bytes]:
+    """
+    Build the timestamp-free part of a chat response once per language and intent.
     
-    return ChatResponse(
-        response=response_text,
-        suggestions=suggestions,
-        resources=resources,
-        timestamp=datetime.now()
+    Returns the payload fields and their JSON encoding, left open so the
+    timestamp can be appended without re-encoding the rest.
+    """
+    payload = {
+        "response": CHAT_RESPONSES[language][intent],
+        "suggestions": CHAT_SUGGESTIONS[language][intent],
+        "resources": get_chat_resources(intent)
+    }
+    return payload, encode_json(payload)[:-1] + b',"timestamp":'
+
+JK_KNOWLEDGE_BASE.on_reload(get_chat_payload.cache_clear)
+
+def classify_chat_message(message: str, language: str = "english") -> Tuple[str, str]:
+    """Resolve the (language, intent) pair that determines a chat response"""
+    if language not in CHAT_RESPONSES:
+        language = "english"
+    intent = INTENT_CLASSIFIER.classify(message)
+    CHAT_INTENTS.inc(language, intent)
+    return language, intent
+
+def get_chat_response(message: str, language: str = "english") -> ChatResponse:
+    """Generate AI response for J&K-specific career queries"""
+    language, intent = classify_chat_message(message, language)
+    JK_KNOWLEDGE_BASE.maybe_reload()
+    payload, _ = get_chat_payload(language, intent, JK_KNOWLEDGE_BASE.version)
+    
+    # Payloads come from our own templates, so skip re-validating them
+    return ChatResponse.model_construct(**payload, timestamp=datetime.now())
+
+def render_chat_body(language: str, intent: str) -> bytes:
+    """Encoded ChatResponse JSON, stitched from the cached payload and the current time"""
+    JK_KNOWLEDGE_BASE.maybe_reload()
+    _, prefix = get_chat_payload(language, intent, JK_KNOWLEDGE_BASE.version)
+    return prefix + b'"' + datetime.now().isoformat().encode() + b'"}'
+
+def render_chat_response(message: str, language: str = "english") -> bytes:
+    """Encoded JSON body of get_chat_response"""
+    return render_chat_body(*classify_chat_message(message, language))
+
+def remember_chat_turn(chat_message: ChatMessage, language: str, intent: str) -> None:
+    """Record an exchange in the user's session so clients need not resend history"""
+    if chat_message.context:
+        SESSION_STORE.update_context(chat_message.user_id, chat_message.context)
+    # Assistant replies are templates, so the intent alone identifies them
+    SESSION_STORE.append_turns(chat_message.user_id, [
+        ("user", chat_message.message, None),
+        ("assistant", None, f"{language}:{intent}")
+    ])
+
+def iter_chat_events(language: str, intent: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Parts of a chat response as (event, data) pairs, in the order they become available"""
+    yield "response", {"response": CHAT_RESPONSES[language][intent]}
+    yield "suggestions", {"suggestions": CHAT_SUGGESTIONS[language][intent]}
+    
+    # Resources are the only part that needs the knowledge base
+    JK_KNOWLEDGE_BASE.maybe_reload()
+    payload, _ = get_chat_payload(language, intent, JK_KNOWLEDGE_BASE.version)
+    yield "resources", {"resources": payload["resources"]}
+    yield "done", {"timestamp": datetime.now().isoformat()}
+
+async def stream_chat_sse(language: str, intent: str) -> AsyncIterator[bytes]:
+    for event, data in iter_chat_events(language, intent):
+        yield b"event: " + event.encode() + b"\ndata: " + encode_json(data) + b"\n\n"
+
+def chat_sse_response(chat_message: ChatMessage) -> StreamingResponse:
+    language, intent = classify_chat_message(chat_message.message, chat_message.language)
+    remember_chat_turn(chat_message, language, intent)
+    return StreamingResponse(
+        stream_chat_sse(language, intent),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
 
 # API Endpoints
@@ -267,94 +464,602 @@ async def chat_endpoint(chat_message: ChatMessage):
     Main chat endpoint for J&K career guidance
     """
     try:
-        logger.info(f"Chat request from user {chat_message.user_id}: {chat_message.message}")
+        language, intent = classify_chat_message(chat_message.message, chat_message.language)
+        body = render_chat_body(language, intent)
+        remember_chat_turn(chat_message, language, intent)
         
-        response = get_chat_response(chat_message.message, chat_message.language)
-        
-        logger.info(f"Generated response for user {chat_message.user_id}")
-        return response
+        return Response(content=body, media_type="application/json")
         
+    except ContextTooLarge:
+        raise
     except Exception as e:
         logger.error(f"Error in chat endpoint: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@app.post("/chat/stream")
+async def chat_stream_endpoint(chat_message: ChatMessage):
+    """
+    Streaming chat over Server-Sent Events
+    
+    Emits `response`, `suggestions` and `resources` events as each part is
+    ready, then a `done` event carrying the timestamp.
+    """
+    return chat_sse_response(chat_message)
+
+@app.get("/chat/stream")
+async def chat_stream_get_endpoint(message: str, user_id: str, language: str = "english"):
+    """
+    Streaming chat over Server-Sent Events, for EventSource clients
+    """
+    return chat_sse_response(ChatMessage(message=message, user_id=user_id, language=language))
+
+@app.websocket("/chat/ws")
+async def chat_websocket(websocket: WebSocket):
+    """
+    Chat over a WebSocket: send many ChatMessage JSON objects on one connection
+    
+    Each message is answered with `{"event": ..., "data": ...}` frames in the
+    same order as /chat/stream, ending with a `done` frame.
+    """
+    await websocket.accept()
+    try:
+        while True:
+            text = await websocket.receive_text()
+            try:
+                chat_message = ChatMessage.model_validate_json(text)
+            except ValidationError as e:
+                await websocket.send_text(json.dumps({"event": "error", "data": {"detail": e.errors(include_url=False)}}, default=str))
+                continue
+            
+            language, intent = classify_chat_message(chat_message.message, chat_message.language)
+            try:
+                remember_chat_turn(chat_message, language, intent)
+            except ContextTooLarge as e:
+                await websocket.send_text(json.dumps({"event": "error", "data": {"detail": str(e)}}))
+                continue
+            for event, data in iter_chat_events(language, intent):
+                await websocket.send_text(encode_json({"event": event, "data": data}).decode())
+    except WebSocketDisconnect:
+        pass
+
+@app.get("/chat/sessions/{user_id}", include_in_schema=False, dependencies=[Depends(require_admin_token)])
+async def get_chat_session(user_id: str):
+    """
+    Recent conversation turns and stored context for a user, for support staff holding the admin token
+    """
+    session = SESSION_STORE.get(user_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="No active session for this user")
+    
+    for turn in session["turns"]:
+        if turn["role"] == "assistant" and turn["text"] is None:
+            language, _, intent = turn["intent"].partition(":")
+            turn["text"] = CHAT_RESPONSES[language][intent]
+            turn["intent"] = intent
+    return {"user_id": user_id, **session}
+
+@app.delete("/chat/sessions/{user_id}", include_in_schema=False, dependencies=[Depends(require_admin_token)])
+async def delete_chat_session(user_id: str):
+    """
+    Forget a user's conversation history and context, for support staff holding the admin token
+    """
+    return {"deleted": SESSION_STORE.clear(user_id)}
+
 @app.get("/colleges", response_model=List[Dict[str, Any]])
-async def get_jk_colleges(district: Optional[str] = None, course: Optional[str] = None):
+async def get_jk_colleges(
+    request: Request,
+    district: Optional[str] = None,
+    course: Optional[str] = None,
+    min_rating: Optional[float] = Query(None, ge=0, le=5),
+    max_fee: Optional[float] = Query(None, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
+    sort: Optional[str] = None
+):
     """
-    Get J&K government colleges with optional filtering
+    Get J&K government colleges with optional filtering, sorting by fee or rating, and pagination
     """
-    colleges = JK_KNOWLEDGE_BASE["colleges"]
+    def build():
+        college_index, _ = COLLEGE_INDEXES
+        try:
+            rows = college_index.query(district=district, course=course, min_rating=min_rating, max_fee=max_fee, sort=sort)
+            colleges, next_cursor = college_index.page(rows, limit=limit, offset=offset, cursor=cursor, sort=sort)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        headers = {"X-Total-Count": str(len(rows))}
+        if next_cursor:
+            headers["X-Next-Cursor"] = next_cursor
+        return colleges, headers
     
-    if district:
-        colleges = [c for c in colleges if c["district"].lower() == district.lower()]
+    JK_KNOWLEDGE_BASE.maybe_reload()
+    return RESPONSE_CACHE.respond(request, build)
+
+def find_nearby_colleges(
+    lat: float,
+    lng: float,
+    k: int,
+    radius_km: Optional[float] = None,
+    district: Optional[str] = None,
+    course: Optional[str] = None,
+    min_rating: Optional[float] = None,
+    max_fee: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """Closest ``k`` colleges matching the filters, optionally within ``radius_km``"""
+    JK_KNOWLEDGE_BASE.maybe_reload()
+    college_index, geo_index = COLLEGE_INDEXES
+    
+    allowed = None
+    if district or course or min_rating is not None or max_fee is not None:
+        allowed = set(college_index.query(district=district, course=course, min_rating=min_rating, max_fee=max_fee))
     
-    if course:
-        colleges = [c for c in colleges if any(course.lower() in course_name.lower() for course_name in c["courses"])]
+    if radius_km is not None:
+        matches = geo_index.within(lat, lng, radius_km, allowed=allowed)[:k]
+    else:
+        matches = geo_index.nearest(lat, lng, k, allowed=allowed)
     
-    return colleges
+    return [
+        {**college_index.colleges[row], "distance": round(distance, 2)}
+        for row, distance in matches
+    ]
+
+# Colleges returned by /colleges/nearby unless the request sets k
+DEFAULT_NEARBY_COLLEGES = 10
+MAX_NEARBY_COLLEGES = 200
+
+@app.get("/colleges/nearby", response_model=List[Dict[str, Any]])
+async def get_nearby_colleges(
+    lat: float = Query(..., ge=-90, le=90),
+    lng: float = Query(..., ge=-180, le=180),
+    k: int = Query(DEFAULT_NEARBY_COLLEGES, ge=1, le=MAX_NEARBY_COLLEGES),
+    radius_km: Optional[float] = Query(None, gt=0),
+    district: Optional[str] = None,
+    course: Optional[str] = None,
+    min_rating: Optional[float] = Query(None, ge=0, le=5),
+    max_fee: Optional[float] = Query(None, ge=0)
+):
+    """
+    Get the colleges closest to a location, nearest first, with their distance in km
+    """
+    colleges = await WORKER_POOLS["nearby"].run(
+        find_nearby_colleges, lat, lng, k, radius_km, district, course, min_rating, max_fee
+    )
+    return FastJSONResponse(colleges)
 
 @app.get("/scholarships", response_model=List[Dict[str, Any]])
-async def get_jk_scholarships():
+async def get_jk_scholarships(request: Request):
     """
     Get available scholarships for J&K students
     """
-    return JK_KNOWLEDGE_BASE["scholarships"]
+    JK_KNOWLEDGE_BASE.maybe_reload()
+    return RESPONSE_CACHE.respond(request, lambda: (JK_KNOWLEDGE_BASE["scholarships"], None))
 
 @app.get("/entrance-exams", response_model=List[Dict[str, Any]])
-async def get_entrance_exams():
+async def get_entrance_exams(request: Request):
     """
     Get entrance exam information for J&K students
     """
-    return JK_KNOWLEDGE_BASE["entrance_exams"]
+    JK_KNOWLEDGE_BASE.maybe_reload()
+    return RESPONSE_CACHE.respond(request, lambda: (JK_KNOWLEDGE_BASE["entrance_exams"], None))
+
+@app.get("/timeline", response_model=List[Dict[str, Any]])
+async def get_timeline(
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    type: Optional[List[str]] = Query(None),
+    eligibility: Optional[str] = None
+):
+    """
+    Get scholarship deadlines and entrance exam dates falling between start and end
+    """
+    if start and end and start > end:
+        raise HTTPException(status_code=400, detail="start must not be after end")
+    
+    JK_KNOWLEDGE_BASE.maybe_reload()
+    today = date.today()
+    events = TIMELINE_INDEX.query(start=start, end=end, types=type, eligibility=eligibility)
+    return FastJSONResponse([{**event, "status": event_status(event, today)} for event in events])
+
+@app.get("/search", response_model=List[Dict[str, Any]])
+async def search_knowledge_base(
+    q: str = Query(..., min_length=1, max_length=MAX_SEARCH_QUERY_LENGTH),
+    section: Optional[List[str]] = Query(None),
+    limit: int = Query(DEFAULT_SEARCH_RESULTS, ge=1, le=MAX_SEARCH_RESULTS),
+    prefix: bool = True
+):
+    """
+    Search colleges, scholarships, exams, careers and career paths in English or Hindi
+    
+    Results are ranked by BM25 over names, specialties, eligibility and
+    descriptions. With prefix=true the last word also matches longer words
+    it starts, for search-as-you-type.
+    """
+    JK_KNOWLEDGE_BASE.maybe_reload()
+    search_index = SEARCH_INDEX
+    # Checked against the index snapshot, not the knowledge base, which may have to ask its source
+    unknown = sorted(set(section or ()).difference(search_index.sections))
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown section(s): {', '.join(unknown)}. Expected one of: {', '.join(search_index.sections)}"
+        )
+    
+    results = []
+    for doc, score in search_index.search(q, limit=limit, sections=section, prefix=prefix):
+        results.append({**search_index.documents[doc], "score": round(score, 4)})
+    return FastJSONResponse(results)
+
+@app.get("/autocomplete", response_model=List[Dict[str, str]])
+async def autocomplete(
+    q: str = Query(..., min_length=1, max_length=MAX_SEARCH_QUERY_LENGTH),
+    type: Optional[List[str]] = Query(None),
+    limit: int = Query(DEFAULT_COMPLETIONS, ge=1, le=MAX_COMPLETIONS)
+):
+    """
+    Complete partially typed college, course, district, scholarship and exam names and chat questions
+    
+    Any word of an entry can be completed, not just the first, and entries
+    that start with the typed text come first.
+    """
+    unknown = sorted(set(type or ()) - set(AUTOCOMPLETE_KINDS))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown type(s): {', '.join(unknown)}")
+    
+    JK_KNOWLEDGE_BASE.maybe_reload()
+    kinds = tuple(sorted(set(type))) if type else None
+    return FastJSONResponse([
+        {"text": text, "type": kind} for text, kind in AUTOCOMPLETE_INDEX.complete(q, limit, kinds)
+    ])
+
+def get_profile_terms(user_data: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    """Interests and skills of a student profile, as lists of strings"""
+    terms = []
+    for field in ("interests", "skills"):
+        value = user_data.get(field) or []
+        if isinstance(value, str):
+            value = [value]
+        if not isinstance(value, list):
+            raise ValueError(f"{field} must be a string or a list of strings")
+        terms.append([str(item) for item in value])
+    return terms[0], terms[1]
+
+def recommend_careers(
+    interests: List[str], skills: List[str], top_k: int, min_salary: Optional[float] = None, sort_by: str = "match"
+) -> List[Dict[str, Any]]:
+    JK_KNOWLEDGE_BASE.maybe_reload()
+    return CAREER_SCORER.recommend(interests, skills, k=top_k, min_salary=min_salary, sort_by=sort_by)
 
 @app.post("/recommendations")
 async def get_career_recommendations(user_data: Dict[str, Any]):
     """
     Get personalized career recommendations for J&K students
     """
-    # Mock recommendation logic based on user interests
-    interests = user_data.get("interests", [])
+    top_k = user_data.get("top_k", DEFAULT_RECOMMENDATIONS)
+    if isinstance(top_k, bool) or not isinstance(top_k, int) or not 1 <= top_k <= MAX_RECOMMENDATIONS:
+        raise HTTPException(status_code=422, detail=f"top_k must be an integer between 1 and {MAX_RECOMMENDATIONS}")
+    # Rupees per year; careers whose salary range reaches it are kept
+    min_salary = user_data.get("min_salary")
+    if min_salary is not None and (isinstance(min_salary, bool) or not isinstance(min_salary, (int, float)) or min_salary < 0):
+        raise HTTPException(status_code=422, detail="min_salary must be a non-negative number of rupees per year")
+    sort_by = user_data.get("sort_by", "match")
+    if sort_by not in RECOMMENDATION_SORTS:
+        raise HTTPException(status_code=422, detail=f"sort_by must be one of: {', '.join(RECOMMENDATION_SORTS)}")
+    try:
+        interests, skills = get_profile_terms(user_data)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    
+    recommendations = await WORKER_POOLS["recommendations"].run(
+        recommend_careers, interests, skills, top_k, min_salary, sort_by
+    )
+    
+    return FastJSONResponse({"recommendations": recommendations})
+
+def score_quiz(
+    answers: Dict[str, Union[int, str]], skills: List[str], top_k: int
+) -> Tuple[Dict[str, float], List[Dict[str, Any]], int]:
+    """Trait scores, recommended careers and question count for one quiz submission"""
+    JK_KNOWLEDGE_BASE.maybe_reload()
+    quiz_scorer, career_scorer = QUIZ_SCORER, CAREER_SCORER
+    traits = quiz_scorer.score(answers)
+    vector = career_scorer.vectorize_traits(traits, skills)
+    return traits, career_scorer.top_k(career_scorer.scores(vector), top_k), len(quiz_scorer)
+
+@app.post("/quiz/submit")
+async def submit_quiz(submission: QuizSubmission):
+    """
+    Score career quiz answers into traits and recommend careers from them in one call
+    """
+    top_k = DEFAULT_RECOMMENDATIONS if submission.top_k is None else submission.top_k
+    if not 1 <= top_k <= MAX_RECOMMENDATIONS:
+        raise HTTPException(status_code=422, detail=f"top_k must be an integer between 1 and {MAX_RECOMMENDATIONS}")
+    
+    try:
+        traits, recommendations, total_questions = await WORKER_POOLS["recommendations"].run(
+            score_quiz, submission.answers, submission.skills, top_k
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
     
-    recommendations = []
+    if submission.user_id:
+        SESSION_STORE.update_context(submission.user_id, {"quiz_traits": traits})
     
-    if "technology" in interests or "engineering" in interests:
-        recommendations.append({
-            "title": "Software Developer",
-            "match_percentage": 92,
-            "description": "Develop software solutions for J&K government and private sector",
-            "skills": ["Programming", "Problem Solving", "Database Management"],
-            "salary_range": "₹4.5 - 8 LPA",
-            "growth_rate": "15% annually"
-        })
+    return FastJSONResponse({
+        "success": True,
+        "userId": submission.user_id,
+        "submittedAt": datetime.now().isoformat(),
+        "totalQuestions": total_questions,
+        "answeredQuestions": len(submission.answers),
+        "traits": traits,
+        "recommendations": recommendations
+    })
+
+async def read_capped(chunks: AsyncIterator[bytes], max_bytes: int) -> AsyncIterator[bytes]:
+    """Pass a request body through, answering 413 once it grows past ``max_bytes``"""
+    received = 0
+    async for chunk in chunks:
+        received += len(chunk)
+        if received > max_bytes:
+            raise HTTPException(status_code=413, detail=f"Body must not exceed {max_bytes} bytes")
+        yield chunk
+
+async def read_ndjson(chunks: AsyncIterator[bytes]) -> List[Any]:
+    """Parse an NDJSON byte stream as it arrives; malformed lines become ValueError items"""
+    items = []
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        items.extend(parse_ndjson_line(line) for line in lines if line.strip())
+    if buffer.strip():
+        items.append(parse_ndjson_line(buffer))
+    return items
+
+def parse_ndjson_line(line: bytes) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError as e:
+        return ValueError(f"Invalid JSON: {e}")
+
+def score_profile_batch(scorer: CareerScorer, profiles: List[Any], start: int, top_k: int) -> bytes:
+    """One NDJSON line per profile, numbered from ``start``, scored together in one matrix product"""
+    batch = []
+    for index, profile in enumerate(profiles, start):
+        user_id = profile.get("user_id") if isinstance(profile, dict) else None
+        try:
+            if isinstance(profile, Exception):
+                raise profile
+            if not isinstance(profile, dict):
+                raise ValueError("Each profile must be a JSON object")
+            batch.append((index, user_id, scorer.vectorize(*get_profile_terms(profile)), None))
+        except ValueError as e:
+            batch.append((index, user_id, None, str(e)))
+    if not batch:
+        return b""
     
-    if "medical" in interests or "healthcare" in interests:
-        recommendations.append({
-            "title": "Medical Officer",
-            "match_percentage": 88,
-            "description": "Serve in J&K healthcare system as a medical professional",
-            "skills": ["Medical Knowledge", "Patient Care", "Emergency Response"],
-            "salary_range": "₹6 - 12 LPA",
-            "growth_rate": "10% annually"
-        })
+    vectors = [vector for _, _, vector, _ in batch if vector is not None]
+    results = iter(scorer.batch_top_k(scorer.batch_scores(vectors), top_k)) if vectors else iter(())
+    lines = []
+    for index, user_id, vector, error in batch:
+        if vector is None:
+            record = {"index": index, "user_id": user_id, "error": error}
+        else:
+            record = {"index": index, "user_id": user_id, "recommendations": next(results)}
+        lines.append(encode_json(record))
+    return b"\n".join(lines) + b"\n"
+
+async def stream_batch_recommendations(scorer: CareerScorer, profiles: List[Any], top_k: int, first: bytes) -> AsyncIterator[bytes]:
+    """Yield the already scored first batch, then score the rest RECOMMENDATION_BATCH_SIZE at a time in the pool"""
+    yield first
+    pool = WORKER_POOLS["recommendations"]
+    for start in range(RECOMMENDATION_BATCH_SIZE, len(profiles), RECOMMENDATION_BATCH_SIZE):
+        chunk = profiles[start:start + RECOMMENDATION_BATCH_SIZE]
+        while True:
+            try:
+                lines = await pool.run(score_profile_batch, scorer, chunk, start, top_k)
+                break
+            except PoolSaturated:
+                # The cohort was accepted, so wait for a slot rather than cut the stream short
+                await asyncio.sleep(BATCH_RETRY_SECONDS)
+        yield lines
+
+@app.post("/recommendations/batch")
+async def get_batch_recommendations(
+    request: Request,
+    top_k: int = Query(DEFAULT_RECOMMENDATIONS, ge=1, le=MAX_RECOMMENDATIONS)
+):
+    """
+    Score a whole cohort of student profiles, streaming NDJSON results
     
-    if "teaching" in interests or "education" in interests:
-        recommendations.append({
-            "title": "Government Teacher",
-            "match_percentage": 85,
-            "description": "Teach in J&K government schools and colleges",
-            "skills": ["Subject Expertise", "Communication", "Classroom Management"],
-            "salary_range": "₹3 - 6 LPA",
-            "growth_rate": "8% annually"
-        })
+    The body is a JSON array of profiles, or NDJSON (one profile per line)
+    when sent as application/x-ndjson. Each output line carries the
+    profile's index and user_id, and either its recommendations or an error.
+    Bodies over MAX_BATCH_BODY_BYTES or cohorts over MAX_BATCH_PROFILES are
+    refused with 413.
+    """
+    # The body has to be read before the response starts streaming
+    body = read_capped(request.stream(), MAX_BATCH_BODY_BYTES)
+    content_type = request.headers.get("content-type", "")
+    if "ndjson" in content_type or "jsonl" in content_type:
+        profiles = await read_ndjson(body)
+    else:
+        try:
+            profiles = json.loads(b"".join([chunk async for chunk in body]))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+        if not isinstance(profiles, list):
+            raise HTTPException(status_code=400, detail="Body must be a JSON array of profiles")
+    if len(profiles) > MAX_BATCH_PROFILES:
+        raise HTTPException(status_code=413, detail=f"A batch may hold at most {MAX_BATCH_PROFILES} profiles")
     
-    return {"recommendations": recommendations}
+    # Score the whole request against one snapshot of the career catalog, in the
+    # bounded pool; the first batch is scored before responding, so a saturated
+    # pool is a 503 with Retry-After instead of a stream cut short
+    JK_KNOWLEDGE_BASE.maybe_reload()
+    scorer = CAREER_SCORER
+    first = await WORKER_POOLS["recommendations"].run(
+        score_profile_batch, scorer, profiles[:RECOMMENDATION_BATCH_SIZE], 0, top_k
+    )
+    return StreamingResponse(
+        stream_batch_recommendations(scorer, profiles, top_k, first),
+        media_type="application/x-ndjson"
+    )
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "timestamp": datetime.now()}
 
+# Readiness, separate from liveness: set once caches are warm, cleared when draining
+SERVER_STATE = {"ready": False, "draining": False}
+
+def warm_caches():
+    """Load every knowledge-base section and prime the caches and code paths requests hit first"""
+    if SERVER_STATE["ready"]:
+        return
+    for section in JK_KNOWLEDGE_BASE:
+        JK_KNOWLEDGE_BASE[section]
+    for language, responses in CHAT_RESPONSES.items():
+        for intent in responses:
+            get_chat_payload(language, intent, JK_KNOWLEDGE_BASE.version)
+    for path, section in (("/scholarships", "scholarships"), ("/entrance-exams", "entrance_exams")):
+        RESPONSE_CACHE.get(cache_key(path), lambda section=section: (JK_KNOWLEDGE_BASE[section], None))
+    INTENT_CLASSIFIER.classify("hello")
+    college_index, geo_index = COLLEGE_INDEXES
+    college_index.query(district="Srinagar", course="B.Tech", min_rating=4.0)
+    geo_index.nearest(34.08, 74.80, 1)
+    TIMELINE_INDEX.query(start=date.today())
+    CAREER_SCORER.recommend(["technology"], ["programming"])
+    QUIZ_SCORER.score({})
+    SEARCH_INDEX.search("engineering colleges")
+    AUTOCOMPLETE_INDEX.complete("e")
+    SERVER_STATE["ready"] = True
+    logger.info("Caches warm, ready to serve")
+
+def shutdown_worker_pools():
+    """Let in-flight offloaded work finish before the process exits"""
+    SERVER_STATE["draining"] = True
+    for pool in WORKER_POOLS.values():
+        pool.shutdown(wait=True)
+
+# serve.py warms in the parent before forking; this covers plain `uvicorn fastapi_backend:app`
+app.add_event_handler("startup", warm_caches)
+app.add_event_handler("shutdown", shutdown_worker_pools)
+
+def cache_samples(field: str):
+    caches = {"response": RESPONSE_CACHE, "chat_payload": get_chat_payload.cache_info()}
+    for name, cache in caches.items():
+        hits, misses = cache.hits, cache.misses
+        value = {"hits": hits, "misses": misses, "hit_ratio": hits / (hits + misses) if hits + misses else 0.0}[field]
+        yield {"cache": name}, value
+
+METRICS.collector("careerpro_cache_hits_total", "Cache lookups answered from the cache", "counter", lambda: cache_samples("hits"))
+METRICS.collector("careerpro_cache_misses_total", "Cache lookups that had to build the entry", "counter", lambda: cache_samples("misses"))
+METRICS.collector("careerpro_cache_hit_ratio", "Share of cache lookups that were hits", "gauge", lambda: cache_samples("hit_ratio"))
+METRICS.collector(
+    "careerpro_worker_pool_pending", "Tasks running or queued in each worker pool", "gauge",
+    lambda: (({"pool": name}, pool.pending) for name, pool in WORKER_POOLS.items())
+)
+METRICS.collector(
+    "careerpro_worker_pool_tasks_total", "Worker pool tasks by outcome", "counter",
+    lambda: (
+        ({"pool": name, "outcome": outcome}, getattr(pool, outcome))
+        for name, pool in WORKER_POOLS.items()
+        for outcome in ("completed", "rejected")
+    )
+)
+METRICS.collector(
+    "careerpro_log_records_total", "Log records written or dropped by the async log writer", "counter",
+    lambda: [({"outcome": "written"}, LOG_HANDLER.written), ({"outcome": "dropped"}, LOG_HANDLER.dropped)]
+)
+METRICS.collector(
+    "careerpro_session_store", "Session store size and evictions", "gauge",
+    lambda: (({"stat": stat}, value) for stat, value in SESSION_STORE.stats().items())
+)
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint():
+    """Prometheus metrics for this worker process"""
+    return Response(content=METRICS.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+@app.get("/debug/profile", include_in_schema=False, dependencies=[Depends(require_admin_token)])
+async def profile_endpoint(
+    seconds: float = Query(10.0, gt=0, le=300),
+    interval_ms: float = Query(5.0, ge=1, le=1000)
+):
+    """
+    Sample this process's stacks for a while and return them as folded stacks
+    """
+    if PROFILER is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if PROFILER.running:
+        raise HTTPException(status_code=409, detail="Profiler is already running")
+    PROFILER.interval = interval_ms / 1000
+    PROFILER.start()
+    await asyncio.sleep(seconds)
+    folded = await asyncio.to_thread(PROFILER.stop)
+    return Response(content=folded, media_type="text/plain")
+
+# Uploads larger than this are spooled to a temporary file instead of memory
+INGEST_SPOOL_SIZE = 8 * 1024 * 1024
+
+def ingest_upload(upload: Any, section: str, fmt: str) -> Dict[str, Any]:
+    """Ingest an uploaded file, then swap in the changed sections and rebuild the indexes over them"""
+    with io.TextIOWrapper(upload, encoding="utf-8-sig", newline="") as stream:
+        report = ingest(JK_KNOWLEDGE_BASE.source, section, read_rows(stream, fmt, SECTION_MODELS[section]))
+    JK_KNOWLEDGE_BASE.reload()
+    report["version"] = JK_KNOWLEDGE_BASE.version
+    return report
+
+@app.post("/admin/ingest", include_in_schema=False, dependencies=[Depends(require_admin_token)])
+async def admin_ingest(
+    request: Request,
+    section: str = Query(...),
+    fmt: str = Query("csv", alias="format")
+):
+    """
+    Load colleges, scholarships or entrance exams from a CSV or NDJSON request body
+    
+    Needs a SQLite knowledge base (CAREERPRO_KB_PATH): every worker process
+    picks the change up from the shared file and it survives restarts. The
+    built-in data lives in each worker's memory, so ingesting into it would
+    change only the worker that took the request, until it restarts; that is
+    refused with 409.
+    """
+    if not isinstance(JK_KNOWLEDGE_BASE.source, SQLiteSource):
+        raise HTTPException(status_code=409, detail="Ingestion needs a SQLite knowledge base; set CAREERPRO_KB_PATH")
+    if section not in SECTION_MODELS:
+        raise HTTPException(status_code=400, detail=f"Unknown section: {section}. Expected one of: {', '.join(SECTION_MODELS)}")
+    if fmt not in FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown format: {fmt}. Expected one of: {', '.join(FORMATS)}")
+    
+    upload = tempfile.SpooledTemporaryFile(max_size=INGEST_SPOOL_SIZE)
+    try:
+        async for chunk in request.stream():
+            upload.write(chunk)
+        upload.seek(0)
+    except BaseException:
+        upload.close()
+        raise
+    try:
+        # The worker owns the upload from here and closes it when done
+        report = await WORKER_POOLS["ingest"].run(ingest_upload, upload, section, fmt)
+    except PoolSaturated:
+        upload.close()
+        raise
+    return FastJSONResponse(report)
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness check: 200 once caches are warm, 503 while starting or draining"""
+    if SERVER_STATE["ready"] and not SERVER_STATE["draining"]:
+        return {"status": "ready"}
+    status = "draining" if SERVER_STATE["draining"] else "starting"
+    return JSONResponse(status_code=503, content={"status": status})
+
 if __name__ == "__main__":
+    # Development server with auto-reload; use serve.py for multi-worker production runs
     print("Starting CareerPro J&K FastAPI Backend...")
     print("API Documentation available at: http://localhost:8000/docs")
     print("Chat endpoint: http://localhost:8000/chat")
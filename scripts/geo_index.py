@@ -0,0 +1,150 @@
+"""
+Spatial index for CareerPro J&K college search
+KD-tree over points on the unit sphere for k-nearest and radius queries by great-circle distance
+"""
+
+import heapq
+from typing import Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Points per leaf; leaves are scanned with one vectorized distance computation
+LEAF_SIZE = 16
+
+
+def to_unit_vectors(lat: np.ndarray, lng: np.ndarray) -> np.ndarray:
+    """Latitude/longitude in degrees to 3D points on the unit sphere"""
+    lat, lng = np.radians(lat), np.radians(lng)
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lng), cos_lat * np.sin(lng), np.sin(lat)))
+
+
+def chord_to_km(chord: np.ndarray) -> np.ndarray:
+    """Straight-line distance between unit vectors to great-circle (haversine) kilometres"""
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord / 2, 0, 1))
+
+
+def km_to_chord(km: float) -> float:
+    return 2 * np.sin(min(km / EARTH_RADIUS_KM, np.pi) / 2)
+
+
+class GeoIndex:
+    """Static KD-tree over (row, lat, lng) points.
+
+    Points are mapped onto the unit sphere, where straight-line (chord)
+    distance grows monotonically with great-circle distance. Searching in 3D
+    therefore needs no special handling for the antimeridian or the poles,
+    and both k-nearest and radius queries visit O(log n) nodes for compact
+    result sets. Distances are converted to kilometres only for the results.
+    """
+
+    def __init__(self, points: Iterable[Tuple[int, float, float]]):
+        points = list(points)
+        self.rows = np.array([row for row, _, _ in points], dtype=np.int64)
+        lat = np.array([lat for _, lat, _ in points], dtype=np.float64)
+        lng = np.array([lng for _, _, lng in points], dtype=np.float64)
+        self.xyz = to_unit_vectors(lat, lng).reshape(-1, 3)
+
+        # Node arrays: internal nodes split on (dim, value); leaves cover order[start:end]
+        self._dim: List[int] = []
+        self._value: List[float] = []
+        self._left: List[int] = []
+        self._right: List[int] = []
+        self._start: List[int] = []
+        self._end: List[int] = []
+        self._order = np.arange(len(points))
+        if len(points):
+            self._build(0, len(points))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _build(self, start: int, end: int) -> int:
+        node = len(self._dim)
+        self._dim.append(-1)
+        self._value.append(0.0)
+        self._left.append(-1)
+        self._right.append(-1)
+        self._start.append(start)
+        self._end.append(end)
+        if end - start <= LEAF_SIZE:
+            return node
+
+        segment = self._order[start:end]
+        coords = self.xyz[segment]
+        dim = int(np.argmax(coords.max(axis=0) - coords.min(axis=0)))
+        middle = (end - start) // 2
+        partition = np.argpartition(coords[:, dim], middle)
+        self._order[start:end] = segment[partition]
+
+        self._dim[node] = dim
+        self._value[node] = float(self.xyz[self._order[start + middle], dim])
+        self._left[node] = self._build(start, start + middle)
+        self._right[node] = self._build(start + middle, end)
+        return node
+
+    def _leaf(self, node: int, query: np.ndarray, allowed: Optional[Set[int]]) -> Tuple[np.ndarray, np.ndarray]:
+        points = self._order[self._start[node]:self._end[node]]
+        if allowed is not None:
+            points = points[[int(self.rows[point]) in allowed for point in points]]
+        return points, np.linalg.norm(self.xyz[points] - query, axis=1)
+
+    def nearest(self, lat: float, lng: float, k: int, allowed: Optional[Set[int]] = None) -> List[Tuple[int, float]]:
+        """The ``k`` closest (row, distance_km) pairs, nearest first, optionally limited to ``allowed`` rows"""
+        if not len(self.rows) or k <= 0:
+            return []
+        query = to_unit_vectors(np.array([lat]), np.array([lng]))[0]
+        # Max-heap of (-chord, point) holding the best k so far
+        best: List[Tuple[float, int]] = []
+
+        def visit(node: int) -> None:
+            dim = self._dim[node]
+            if dim < 0:
+                points, chords = self._leaf(node, query, allowed)
+                for point, chord in zip(points.tolist(), chords.tolist()):
+                    if len(best) < k:
+                        heapq.heappush(best, (-chord, point))
+                    elif chord < -best[0][0]:
+                        heapq.heapreplace(best, (-chord, point))
+                return
+            diff = query[dim] - self._value[node]
+            near, far = (self._left[node], self._right[node]) if diff < 0 else (self._right[node], self._left[node])
+            visit(near)
+            if len(best) < k or diff * diff < best[0][0] * best[0][0]:
+                visit(far)
+
+        visit(0)
+        best.sort(reverse=True)
+        chords = np.array([-chord for chord, _ in best])
+        return list(zip(self.rows[[point for _, point in best]].tolist(), chord_to_km(chords).tolist()))
+
+    def within(self, lat: float, lng: float, radius_km: float, allowed: Optional[Set[int]] = None) -> List[Tuple[int, float]]:
+        """All (row, distance_km) pairs within ``radius_km``, nearest first"""
+        if not len(self.rows):
+            return []
+        query = to_unit_vectors(np.array([lat]), np.array([lng]))[0]
+        limit = km_to_chord(radius_km)
+        found_points: List[np.ndarray] = []
+        found_chords: List[np.ndarray] = []
+
+        def visit(node: int) -> None:
+            dim = self._dim[node]
+            if dim < 0:
+                points, chords = self._leaf(node, query, allowed)
+                inside = chords <= limit
+                found_points.append(points[inside])
+                found_chords.append(chords[inside])
+                return
+            diff = query[dim] - self._value[node]
+            if diff < limit:
+                visit(self._left[node])
+            if diff > -limit:
+                visit(self._right[node])
+
+        visit(0)
+        points = np.concatenate(found_points) if found_points else np.array([], dtype=np.int64)
+        chords = np.concatenate(found_chords) if found_chords else np.array([])
+        order = np.argsort(chords, kind="stable")
+        return list(zip(self.rows[points[order]].tolist(), chord_to_km(chords[order]).tolist()))
@@ -0,0 +1,175 @@
+"""
+Bulk catalog ingestion for CareerPro J&K
+Streams CSV or NDJSON rows of colleges, scholarships or exams into the knowledge base, validating and upserting them in chunks
+
+Run from the scripts directory: python ingest.py colleges.csv --section colleges --kb knowledge_base.db
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import typing
+from typing import IO, Any, Dict, Iterable, Iterator, List, Tuple, Type, Union
+
+from pydantic import BaseModel, ValidationError
+
+from catalog_models import SECTION_MODELS
+from knowledge_base import BUILTIN_KNOWLEDGE_BASE, SQLiteSource, write_sqlite
+from transliteration import tokenize
+
+logger = logging.getLogger(__name__)
+
+# Rows validated and written together; memory use is bounded by this, not by the file size
+CHUNK_SIZE = 1000
+
+# Row errors listed in a report; the rest are only counted
+MAX_REPORTED_ERRORS = 100
+
+# CSV cells holding a list separate its items with this character
+CSV_LIST_SEPARATOR = ";"
+
+FORMATS = ("csv", "ndjson")
+
+# A row as read from the file: a dict of CSV cells, or one NDJSON line left for the model to parse
+Row = Union[Dict[str, Any], str]
+
+
+def dedupe_key(record: Dict[str, Any]) -> str:
+    """Identity of a record: names differing only in case, Unicode composition or punctuation are the same"""
+    return " ".join(tokenize(record["name"]))
+
+
+def _list_fields(model: Type[BaseModel]) -> List[str]:
+    fields = []
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        if typing.get_origin(annotation) is Union:
+            annotation = next(arg for arg in typing.get_args(annotation) if arg is not type(None))
+        if typing.get_origin(annotation) is list:
+            fields.append(field.alias or name)
+    return fields
+
+
+def read_csv(stream: IO[str], model: Type[BaseModel]) -> Iterator[Tuple[int, Row]]:
+    """(line number, cells) per CSV row; empty cells are left out and list cells split on ";" """
+    reader = csv.reader(stream)
+    header = [name.strip() for name in next(reader, [])]
+    list_fields = [name for name in _list_fields(model) if name in header]
+    for cells in reader:
+        row = {name: value for name, value in zip(header, map(str.strip, cells)) if value and name}
+        for name in list_fields:
+            if name in row:
+                row[name] = [item for item in map(str.strip, row[name].split(CSV_LIST_SEPARATOR)) if item]
+        yield reader.line_num, row
+
+
+def read_ndjson(stream: IO[str]) -> Iterator[Tuple[int, Row]]:
+    """(line number, line) per non-blank NDJSON line"""
+    for number, line in enumerate(stream, 1):
+        if line.strip():
+            yield number, line
+
+
+def read_rows(stream: IO[str], fmt: str, model: Type[BaseModel]) -> Iterator[Tuple[int, Row]]:
+    if fmt == "csv":
+        return read_csv(stream, model)
+    if fmt == "ndjson":
+        return read_ndjson(stream)
+    raise ValueError(f"Unknown format: {fmt}")
+
+
+def _validate(model: Type[BaseModel], row: Row) -> Dict[str, Any]:
+    record = model.model_validate_json(row) if isinstance(row, str) else model.model_validate(row)
+    return record.model_dump(by_alias=True, exclude_none=True)
+
+
+def _describe(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, detail['loc'])) or 'row'}: {detail['msg']}" for detail in error.errors(include_url=False)
+    )
+
+
+def ingest(source: Any, section: str, rows: Iterable[Tuple[int, Row]], chunk_size: int = CHUNK_SIZE) -> Dict[str, Any]:
+    """Validate ``rows`` against the section's model and upsert them into ``source`` by normalized name.
+
+    Rows are validated and written ``chunk_size`` at a time within one
+    transaction, so either every valid row lands or none does. A row whose
+    name was already seen in the file replaces the earlier one and counts
+    as a duplicate; a row naming an existing record updates it.
+    """
+    model = SECTION_MODELS.get(section)
+    if model is None:
+        raise ValueError(f"Unknown section: {section}. Expected one of: {', '.join(SECTION_MODELS)}")
+
+    report: Dict[str, Any] = {"section": section, "rows": 0, "inserted": 0, "updated": 0, "duplicates": 0, "invalid": 0, "errors": []}
+    seen = set()
+    chunk: List[Tuple[str, Dict[str, Any]]] = []
+    with source.writer(section, dedupe_key) as writer:
+
+        def flush() -> None:
+            inserted, updated = writer.upsert(chunk)
+            report["inserted"] += inserted
+            report["updated"] += updated
+            chunk.clear()
+
+        for number, row in rows:
+            report["rows"] += 1
+            try:
+                record = _validate(model, row)
+                key = dedupe_key(record)
+                if not key:
+                    raise ValueError("name has no letters or digits")
+            except (ValidationError, ValueError) as e:
+                report["invalid"] += 1
+                if len(report["errors"]) < MAX_REPORTED_ERRORS:
+                    report["errors"].append({"line": number, "error": _describe(e) if isinstance(e, ValidationError) else str(e)})
+                continue
+            if key in seen:
+                report["duplicates"] += 1
+            seen.add(key)
+            chunk.append((key, record))
+            if len(chunk) >= chunk_size:
+                flush()
+        flush()
+
+    # Rows repeated within the file were counted as updates of their first occurrence
+    report["updated"] -= report["duplicates"]
+    logger.info(
+        f"Ingested {report['rows']} {section} rows: {report['inserted']} inserted, {report['updated']} updated, "
+        f"{report['duplicates']} duplicates, {report['invalid']} invalid"
+    )
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load CareerPro J&K catalog records from CSV or NDJSON")
+    parser.add_argument("file", help="CSV or NDJSON file, or - for stdin")
+    parser.add_argument("--section", required=True, choices=sorted(SECTION_MODELS))
+    parser.add_argument("--kb", default=os.environ.get("CAREERPRO_KB_PATH"), help="SQLite knowledge base (default: CAREERPRO_KB_PATH)")
+    parser.add_argument("--format", choices=FORMATS, help="file format (default: from the file extension)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    if not args.kb:
+        parser.error("--kb or CAREERPRO_KB_PATH is required")
+    fmt = args.format or ("ndjson" if args.file.endswith((".ndjson", ".jsonl")) else "csv")
+
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+    if not os.path.exists(args.kb):
+        write_sqlite(args.kb, BUILTIN_KNOWLEDGE_BASE)
+        print(f"Created {args.kb} from the built-in data", file=sys.stderr)
+    stream = sys.stdin if args.file == "-" else open(args.file, encoding="utf-8-sig", newline="")
+    try:
+        report = ingest(SQLiteSource(args.kb), args.section, read_rows(stream, fmt, SECTION_MODELS[args.section]), args.chunk_size)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if report["invalid"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Intent classifier for CareerPro J&K chat
+Matches every intent keyword in a single pass using an Aho-Corasick automaton over script-neutral word keys
+"""
+
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from transliteration import TOKEN_CACHE_SIZE, FuzzyIndex, text_keys, token_key, tokenize
+
+# (match key, best intent rank or -1, starts a multi-word keyword) for one token
+WordMatch = Tuple[str, int, bool]
+
+# Keywords with keys shorter than this must be whole words; longer ones also match the start of a word
+WHOLE_WORD_LENGTH = 3
+
+
+class IntentClassifier:
+    """Classify a message by the highest-priority intent whose keyword it contains.
+
+    Intents are ranked by the order of the ``keywords`` mapping, which mirrors
+    the old ``if/elif`` chain: the first intent listed wins when a message
+    contains keywords for several intents.
+
+    Message and keywords are both reduced to the match keys of their words
+    (``transliteration.token_key``), so नमस्ते, "namaste" and "Namastey"
+    agree, and message words within a few edits of a keyword word are
+    corrected to it first. A keyword then matches at the start of a word
+    ("college" in "colleges", कॉलेज in कॉलेजों), and a very short one only
+    as a whole word, so "hi" no longer matches inside "scholarships".
+
+    Each whitespace-separated word of a message is keyed, corrected and run
+    through the automaton once, and the result cached, so a message costs a
+    split and one cache lookup per word whatever the size of the keyword
+    set. Only a message containing the first word of a multi-word keyword
+    ("financial aid") is scanned again as a whole.
+    """
+
+    def __init__(self, keywords: Dict[str, List[str]], default: str = "default"):
+        self.default = default
+        self.intents: List[str] = list(keywords)
+        self.keyword_count = 0
+
+        # Trie transitions, one dict per state; state 0 is the root
+        self._goto: List[Dict[str, int]] = [{}]
+        # Best (lowest) intent rank reachable from each state, -1 for none
+        self._rank: List[int] = [-1]
+        self._fail: List[int] = [0]
+
+        patterns = [(text_keys(word), rank) for rank, intent in enumerate(self.intents) for word in keywords[intent]]
+        self.vocabulary = FuzzyIndex(key for keys, _ in patterns for key in keys)
+        # First words of multi-word keywords, and the best rank any of those keywords has
+        self._phrase_starts = {keys[0] for keys, _ in patterns if len(keys) > 1}
+        self._phrase_rank = min((rank for keys, rank in patterns if len(keys) > 1), default=-1)
+        for keys, rank in patterns:
+            key = " ".join(keys)
+            if key:
+                self._add(" " + key + " " if len(key) < WHOLE_WORD_LENGTH else " " + key, rank)
+        self._build()
+        self._match = lru_cache(maxsize=TOKEN_CACHE_SIZE)(self._match_word)
+
+    def _add(self, word: str, rank: int) -> None:
+        if not word:
+            return
+        state = 0
+        for char in word:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._rank.append(-1)
+                self._fail.append(0)
+            state = next_state
+        if self._rank[state] == -1 or rank < self._rank[state]:
+            self._rank[state] = rank
+        self.keyword_count += 1
+
+    def _build(self) -> None:
+        """Compute failure links and fold matches from suffix states into each state"""
+        # Depth-one states keep the root as their failure link
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                inherited = self._rank[self._fail[child]]
+                if inherited != -1 and (self._rank[child] == -1 or inherited < self._rank[child]):
+                    self._rank[child] = inherited
+                queue.append(child)
+
+    def _scan(self, text: str) -> int:
+        """Best (lowest) rank of the keywords in ``text``, -1 for none"""
+        goto, fail, ranks = self._goto, self._fail, self._rank
+        best = -1
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            rank = ranks[state]
+            if rank != -1 and (best == -1 or rank < best):
+                best = rank
+                if best == 0:
+                    break
+        return best
+
+    def _match_word(self, word: str) -> Tuple[WordMatch, ...]:
+        """Match of each token in one whitespace-separated word ("colleges," or कॉलेजों)"""
+        matches = []
+        for token in tokenize(word):
+            key = self.vocabulary.correct(token_key(token))
+            matches.append((key, self._scan(" " + key + " "), key in self._phrase_starts))
+        return tuple(matches)
+
+    def normalize(self, message: str) -> str:
+        """The match keys of ``message``, misspelt keywords corrected, joined and surrounded by spaces"""
+        return " " + " ".join(key for word in message.split() for key, _, _ in self._match(word)) + " "
+
+    def classify(self, message: str) -> str:
+        """Return the intent for ``message``, or the default intent if nothing matches"""
+        best = -1
+        phrase = False
+        for word in message.split():
+            for _, rank, starts_phrase in self._match(word):
+                if rank != -1 and (best == -1 or rank < best):
+                    best = rank
+                phrase = phrase or starts_phrase
+        # Multi-word keywords span tokens, so only a scan of the whole message finds them
+        if phrase and (best == -1 or best > self._phrase_rank):
+            rank = self._scan(self.normalize(message))
+            if rank != -1 and (best == -1 or rank < best):
+                best = rank
+        return self.default if best == -1 else self.intents[best]
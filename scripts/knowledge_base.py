@@ -0,0 +1,616 @@
+"""
+Knowledge base loader for CareerPro J&K
+Reads reference data from a pluggable source, one section at a time on first access
+"""
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from response_cache import encode_json
+
+logger = logging.getLogger(__name__)
+
+# Default SQLite memory-map size: reads go straight to the OS page cache,
+# so every worker opening the same file shares one copy of its pages
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+
+# Per-section revision counters, bumped by every write so readers can tell which sections changed
+SECTIONS_TABLE = "CREATE TABLE IF NOT EXISTS sections (section TEXT PRIMARY KEY, revision INTEGER NOT NULL)"
+
+# Data shipped with the code, used when no knowledge-base file is configured
+BUILTIN_KNOWLEDGE_BASE: Dict[str, Any] = {
+    "colleges": [
+        {
+            "name": "Government College for Women, Srinagar",
+            "district": "Srinagar",
+            "type": "Government",
+            "courses": ["B.A.", "B.Sc.", "B.Com", "M.A.", "M.Sc."],
+            "fees": "₹8,000 - ₹15,000 per year",
+            "rating": 4.2,
+            "website": "https://gcwsrinagar.edu.in",
+            "phone": "+91-194-2452789",
+            "lat": 34.0740,
+            "lng": 74.8165,
+            "specialties": ["Women's Education", "Arts", "Science", "Commerce"]
+        },
+        {
+            "name": "Government College of Engineering & Technology, Jammu",
+            "district": "Jammu",
+            "type": "Government",
+            "courses": ["B.Tech CSE", "B.Tech ECE", "B.Tech ME", "B.Tech CE"],
+            "fees": "₹45,000 - ₹65,000 per year",
+            "rating": 4.3,
+            "website": "https://gcetjammu.ac.in",
+            "phone": "+91-191-2434567",
+            "lat": 32.8018,
+            "lng": 74.8937,
+            "specialties": ["Engineering", "Technology", "Placement Cell"]
+        },
+        {
+            "name": "Government Medical College, Srinagar",
+            "district": "Srinagar",
+            "type": "Government",
+            "courses": ["MBBS", "MD", "MS", "Diploma Courses"],
+            "fees": "₹25,000 - ₹35,000 per year",
+            "rating": 4.5,
+            "website": "https://gmcsrinagar.edu.in",
+            "phone": "+91-194-2401234",
+            "lat": 34.0837,
+            "lng": 74.7973,
+            "specialties": ["Medical Education", "Healthcare", "Research"]
+        }
+    ],
+    "scholarships": [
+        {
+            "name": "J&K Merit Scholarship",
+            "eligibility": "Students with 80%+ marks in 12th",
+            "amount": "₹50,000 per year",
+            "deadline": "January 15, 2025",
+            "website": "https://jkscholarships.gov.in"
+        },
+        {
+            "name": "Chief Minister's Scholarship",
+            "eligibility": "Economically weaker sections",
+            "amount": "₹25,000 per year",
+            "deadline": "February 28, 2025",
+            "website": "https://jkscholarships.gov.in"
+        }
+    ],
+    "entrance_exams": [
+        {
+            "name": "JEE Main",
+            "for": "Engineering Admissions",
+            "registration_deadline": "December 15, 2024",
+            "exam_date": "January 2025",
+            "website": "https://jeemain.nta.nic.in"
+        },
+        {
+            "name": "NEET",
+            "for": "Medical Admissions",
+            "registration_deadline": "December 20, 2024",
+            "exam_date": "May 2025",
+            "website": "https://neet.nta.nic.in"
+        }
+    ],
+    "careers": [
+        {
+            "title": "Software Developer",
+            "path": "engineering",
+            "interests": ["technology", "engineering"],
+            "description": "Develop software solutions for J&K government and private sector",
+            "skills": ["Programming", "Problem Solving", "Database Management"],
+            "salary_range": "₹4.5 - 8 LPA",
+            "growth_rate": "15% annually"
+        },
+        {
+            "title": "Medical Officer",
+            "path": "medical",
+            "interests": ["medical", "healthcare"],
+            "description": "Serve in J&K healthcare system as a medical professional",
+            "skills": ["Medical Knowledge", "Patient Care", "Emergency Response"],
+            "salary_range": "₹6 - 12 LPA",
+            "growth_rate": "10% annually"
+        },
+        {
+            "title": "Government Teacher",
+            "path": "arts",
+            "interests": ["teaching", "education"],
+            "description": "Teach in J&K government schools and colleges",
+            "skills": ["Subject Expertise", "Communication", "Classroom Management"],
+            "salary_range": "₹3 - 6 LPA",
+            "growth_rate": "8% annually"
+        }
+    ],
+    "career_paths": {
+        "engineering": {
+            "opportunities": ["Software Developer", "Civil Engineer", "Government Jobs"],
+            "salary_range": "₹3.5 - 8 LPA",
+            "growth_prospects": "High demand in J&K IT sector and infrastructure development"
+        },
+        "medical": {
+            "opportunities": ["Doctor", "Medical Officer", "Specialist"],
+            "salary_range": "₹6 - 15 LPA",
+            "growth_prospects": "High demand in J&K healthcare sector"
+        },
+        "arts": {
+            "opportunities": ["Teacher", "Civil Services", "Content Writer"],
+            "salary_range": "₹2.5 - 6 LPA",
+            "growth_prospects": "Government jobs and education sector opportunities"
+        }
+    },
+    # Career quiz shown at /quiz; each option scales the question's trait weights
+    # (first option x1.0 down to last option x-1.0), and traits are career terms
+    "quiz_questions": [
+        {
+            "id": 1,
+            "question": "Do you enjoy solving complex mathematical problems?",
+            "options": ["Strongly Agree", "Agree", "Neutral", "Disagree", "Strongly Disagree"],
+            "category": "aptitude",
+            "traits": {"engineering": 1.0, "technology": 0.6, "problem": 0.5}
+        },
+        {
+            "id": 2,
+            "question": "Are you comfortable working with technology and computers?",
+            "options": ["Very Comfortable", "Comfortable", "Somewhat", "Not Very", "Not At All"],
+            "category": "aptitude",
+            "traits": {"technology": 1.0, "programming": 0.8, "engineering": 0.4}
+        },
+        {
+            "id": 3,
+            "question": "Do you prefer working with people or working independently?",
+            "options": ["Strongly Prefer People", "Prefer People", "No Preference", "Prefer Independent", "Strongly Prefer Independent"],
+            "category": "interest",
+            "traits": {"teaching": 0.8, "healthcare": 0.6, "communication": 0.6, "programming": -0.5}
+        },
+        {
+            "id": 4,
+            "question": "How much do you enjoy creative activities like writing, art, or design?",
+            "options": ["Love It", "Enjoy It", "It's Okay", "Not Much", "Dislike It"],
+            "category": "interest",
+            "traits": {"arts": 1.0, "writer": 0.6}
+        },
+        {
+            "id": 5,
+            "question": "Are you interested in helping others solve their problems?",
+            "options": ["Very Interested", "Interested", "Somewhat", "Not Very", "Not At All"],
+            "category": "interest",
+            "traits": {"healthcare": 0.8, "patient": 0.6, "teaching": 0.6, "education": 0.4}
+        },
+        {
+            "id": 6,
+            "question": "Do you enjoy analyzing data and finding patterns?",
+            "options": ["Love It", "Enjoy It", "It's Okay", "Not Much", "Dislike It"],
+            "category": "aptitude",
+            "traits": {"database": 0.8, "technology": 0.6, "problem": 0.6}
+        },
+        {
+            "id": 7,
+            "question": "How comfortable are you with public speaking and presentations?",
+            "options": ["Very Comfortable", "Comfortable", "Somewhat", "Uncomfortable", "Very Uncomfortable"],
+            "category": "aptitude",
+            "traits": {"communication": 1.0, "teaching": 0.8, "classroom": 0.4}
+        },
+        {
+            "id": 8,
+            "question": "Do you prefer structured environments or flexible work settings?",
+            "options": ["Highly Structured", "Somewhat Structured", "No Preference", "Somewhat Flexible", "Highly Flexible"],
+            "category": "interest",
+            "traits": {"government": 0.8, "services": 0.4, "arts": -0.4, "writer": -0.4}
+        },
+        {
+            "id": 9,
+            "question": "Are you interested in business and entrepreneurship?",
+            "options": ["Very Interested", "Interested", "Somewhat", "Not Very", "Not At All"],
+            "category": "interest",
+            "traits": {"business": 1.0, "management": 0.6}
+        },
+        {
+            "id": 10,
+            "question": "Do you enjoy learning about science and how things work?",
+            "options": ["Love It", "Enjoy It", "It's Okay", "Not Much", "Dislike It"],
+            "category": "interest",
+            "traits": {"medical": 0.8, "engineering": 0.6, "research": 0.6}
+        }
+    ]
+}
+
+
+class _SectionWriter:
+    """Upserts records into one list section by key; ``key`` gives the key of each existing record.
+
+    Use as a context manager: changes are published together when the block
+    exits without an exception, and discarded otherwise.
+    """
+
+    def __init__(self, section: str, key: Callable[[Dict[str, Any]], str]):
+        self.section = section
+        self.key = key
+        self.written = 0
+        self._positions: Dict[str, int] = {}
+
+    def _index(self, records: Iterable[Tuple[int, Any]]) -> int:
+        """Remember the position of every existing record; return the next free position"""
+        next_position = 0
+        for position, record in records:
+            self._positions[self.key(record)] = position
+            next_position = position + 1
+        return next_position
+
+    def _place(self, key: str) -> Tuple[int, bool]:
+        """Position to store the record with ``key`` at, and whether it replaces an existing record"""
+        self.written += 1
+        position = self._positions.get(key)
+        if position is not None:
+            return position, True
+        position = self._positions[key] = self._next_position
+        self._next_position += 1
+        return position, False
+
+
+class _DictSectionWriter(_SectionWriter):
+    def __init__(self, source: "DictSource", section: str, key: Callable[[Dict[str, Any]], str]):
+        super().__init__(section, key)
+        self.source = source
+
+    def __enter__(self) -> "_DictSectionWriter":
+        existing = self.source.data.get(self.section, [])
+        if not isinstance(existing, list):
+            raise ValueError(f"Section '{self.section}' is not a list of records")
+        # Work on a copy so readers keep the current list until the writer commits
+        self.records = list(existing)
+        self._next_position = self._index(enumerate(self.records))
+        return self
+
+    def upsert(self, records: Iterable[Tuple[str, Dict[str, Any]]]) -> Tuple[int, int]:
+        """Store (key, record) pairs, returning (inserted, updated) counts"""
+        inserted = updated = 0
+        for key, record in records:
+            position, replaces = self._place(key)
+            if replaces:
+                self.records[position] = record
+                updated += 1
+            else:
+                self.records.append(record)
+                inserted += 1
+        return inserted, updated
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None and self.written:
+            self.source.data = {**self.source.data, self.section: self.records}
+            self.source.revisions[self.section] = self.source.revisions.get(self.section, 0) + 1
+
+
+class _SQLiteSectionWriter(_SectionWriter):
+    def __init__(self, path: str, section: str, key: Callable[[Dict[str, Any]], str]):
+        super().__init__(section, key)
+        self.path = path
+
+    def __enter__(self) -> "_SQLiteSectionWriter":
+        self._conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            self._conn.execute(SECTIONS_TABLE)
+            # Take the write lock up front; readers carry on until the commit
+            self._conn.execute("BEGIN IMMEDIATE")
+            rows = self._conn.execute(
+                "SELECT position, key, data FROM records WHERE section = ? ORDER BY position", (self.section,)
+            )
+            self._next_position = self._index(self._existing(rows))
+        except BaseException:
+            self._conn.close()
+            raise
+        return self
+
+    def _existing(self, rows: Iterable[Tuple[int, Optional[str], str]]) -> Iterator[Tuple[int, Any]]:
+        for position, key, data in rows:
+            if key is not None:
+                raise ValueError(f"Section '{self.section}' is not a list of records")
+            yield position, json.loads(data)
+
+    def upsert(self, records: Iterable[Tuple[str, Dict[str, Any]]]) -> Tuple[int, int]:
+        """Store (key, record) pairs, returning (inserted, updated) counts"""
+        rows = []
+        updated = 0
+        for key, record in records:
+            position, replaces = self._place(key)
+            updated += replaces
+            rows.append((self.section, position, encode_json(record).decode()))
+        self._conn.executemany("INSERT OR REPLACE INTO records (section, position, key, data) VALUES (?, ?, NULL, ?)", rows)
+        return len(rows) - updated, updated
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None and self.written:
+                self._conn.execute(
+                    "INSERT INTO sections (section, revision) VALUES (?, 1) "
+                    "ON CONFLICT (section) DO UPDATE SET revision = revision + 1",
+                    (self.section,),
+                )
+                self._conn.execute("COMMIT")
+            else:
+                self._conn.execute("ROLLBACK")
+        finally:
+            self._conn.close()
+
+
+class DictSource:
+    """Serve sections from an in-process dict; changes only through ``writer``"""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.revisions: Dict[str, int] = {}
+
+    def sections(self) -> List[str]:
+        return list(self.data)
+
+    def load_section(self, name: str) -> Any:
+        return self.data[name]
+
+    def fingerprint(self) -> Hashable:
+        return tuple(sorted(self.revisions.items()))
+
+    def section_revisions(self) -> Optional[Dict[str, Hashable]]:
+        return dict(self.revisions)
+
+    def writer(self, section: str, key: Callable[[Dict[str, Any]], str]) -> _DictSectionWriter:
+        """Upsert records into ``section`` of this process's copy of the data"""
+        return _DictSectionWriter(self, section, key)
+
+
+class SQLiteSource:
+    """Serve sections from a SQLite file, one row per record.
+
+    The file is opened read-only with memory-mapped I/O. To publish new data,
+    write a fresh file and rename it over the old one (``write_sqlite`` does
+    this), or upsert records of one section in place through ``writer``;
+    either change is picked up on the next fingerprint check.
+    """
+
+    def __init__(self, path: str, mmap_size: int = DEFAULT_MMAP_SIZE):
+        self.path = path
+        self.mmap_size = mmap_size
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._inode: Optional[int] = None
+        self._pid: Optional[int] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        inode = os.stat(self.path).st_ino
+        if self._pid != os.getpid():
+            # A connection inherited across fork() must not be used (or closed) by the child
+            self._conn = None
+        if self._conn is None or inode != self._inode:
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            self._conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+            self._inode = inode
+            self._pid = os.getpid()
+        return self._conn
+
+    def sections(self) -> List[str]:
+        with self._lock:
+            rows = self._connection().execute("SELECT DISTINCT section FROM records").fetchall()
+        return [section for (section,) in rows]
+
+    def load_section(self, name: str) -> Any:
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT key, data FROM records WHERE section = ? ORDER BY position", (name,)
+            ).fetchall()
+        if not rows:
+            raise KeyError(name)
+        # List sections are stored without keys, mapping sections with one
+        if rows[0][0] is None:
+            return [json.loads(data) for _, data in rows]
+        return {key: json.loads(data) for key, data in rows}
+
+    def fingerprint(self) -> Hashable:
+        stat = os.stat(self.path)
+        with self._lock:
+            (data_version,) = self._connection().execute("PRAGMA data_version").fetchone()
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size, data_version
+
+    def section_revisions(self) -> Optional[Dict[str, Hashable]]:
+        """Revision of every section, or None for files written before revisions were tracked"""
+        with self._lock:
+            try:
+                rows = self._connection().execute("SELECT section, revision FROM sections").fetchall()
+            except sqlite3.OperationalError:
+                return None
+            # A replaced file restarts its counters, so the file identity is part of each revision
+            return {section: (self._inode, revision) for section, revision in rows}
+
+    def writer(self, section: str, key: Callable[[Dict[str, Any]], str]) -> _SQLiteSectionWriter:
+        """Upsert records into ``section`` of the file in a single transaction"""
+        return _SQLiteSectionWriter(self.path, section, key)
+
+
+def write_sqlite(path: str, data: Mapping[str, Any]) -> None:
+    """Atomically write ``data`` to a SQLite knowledge-base file at ``path``"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(suffix=".db", dir=directory)
+    os.close(fd)
+    try:
+        conn = sqlite3.connect(tmp_path)
+        with conn:
+            conn.execute(
+                "CREATE TABLE records ("
+                "section TEXT NOT NULL, position INTEGER NOT NULL, key TEXT, data TEXT NOT NULL, "
+                "PRIMARY KEY (section, position))"
+            )
+            conn.execute(SECTIONS_TABLE)
+            conn.executemany("INSERT INTO sections (section, revision) VALUES (?, 0)", ((section,) for section in data))
+            for section, value in data.items():
+                items = enumerate(value) if isinstance(value, list) else enumerate(value.items())
+                conn.executemany(
+                    "INSERT INTO records (section, position, key, data) VALUES (?, ?, ?, ?)",
+                    (
+                        (section, position, None, json.dumps(item, ensure_ascii=False))
+                        if isinstance(value, list)
+                        else (section, position, item[0], json.dumps(item[1], ensure_ascii=False))
+                        for position, item in items
+                    ),
+                )
+        conn.close()
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class KnowledgeBase(Mapping[str, Any]):
+    """Read-only mapping of section name to data, loaded lazily from a source.
+
+    Each section is fetched from the source the first time it is accessed.
+    At most every ``reload_interval`` seconds an access also checks the
+    source's fingerprint, on a background thread so the access itself never
+    waits. ``prepare(name, data)``, if given, turns each section as loaded
+    into the form it is served in. If the data changed, the loaded sections whose revision changed
+    are fetched again and swapped in together, ``changed_sections`` names
+    them (None when the source cannot tell, meaning all), the ``on_reload``
+    callbacks run so dependent indexes and caches can rebuild, and finally
+    ``version`` is bumped.
+
+    Sections are decoded into Python objects in every process that reads
+    them. ``serve.py`` loads all of them in the parent before forking, so
+    workers share those pages copy-on-write and memory stays flat as
+    workers are added. A section reloaded after a change (or first read
+    after the fork) is a private copy in each worker, so memory grows with
+    the worker count again until the workers are restarted. The SQLite
+    source's file pages sit in the OS page cache and are always shared.
+    """
+
+    def __init__(self, source: Any, reload_interval: float = 0.0, prepare: Optional[Callable[[str, Any], Any]] = None):
+        self.source = source
+        self.reload_interval = reload_interval
+        self.prepare = prepare
+        self.version = 0
+        self.changed_sections: Optional[FrozenSet[str]] = None
+        self._sections: Dict[str, Any] = {}
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = threading.RLock()
+        self._fingerprint = source.fingerprint()
+        self._revisions = source.section_revisions()
+        self._next_check = time.monotonic() + reload_interval
+        self._reloader: Optional[threading.Thread] = None
+        self._reloader_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, prepare: Optional[Callable[[str, Any], Any]] = None) -> "KnowledgeBase":
+        """Use CAREERPRO_KB_PATH if set, otherwise the built-in data"""
+        path = os.environ.get("CAREERPRO_KB_PATH")
+        reload_interval = float(os.environ.get("CAREERPRO_KB_RELOAD_INTERVAL", "5"))
+        if path:
+            logger.info(f"Loading knowledge base from {path}")
+            return cls(SQLiteSource(path), reload_interval=reload_interval, prepare=prepare)
+        return cls(DictSource(BUILTIN_KNOWLEDGE_BASE), prepare=prepare)
+
+    def _load(self, name: str) -> Any:
+        data = self.source.load_section(name)
+        return self.prepare(name, data) if self.prepare is not None else data
+
+    def __getitem__(self, name: str) -> Any:
+        self.maybe_reload()
+        try:
+            return self._sections[name]
+        except KeyError:
+            pass
+        with self._lock:
+            if name not in self._sections:
+                self._sections[name] = self._load(name)
+            return self._sections[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.source.sections())
+
+    def __len__(self) -> int:
+        return len(self.source.sections())
+
+    def on_reload(self, callback: Callable[[], None]) -> None:
+        """Register ``callback`` to run after the data has been reloaded"""
+        self._callbacks.append(callback)
+
+    def maybe_reload(self) -> None:
+        """Start a background check of the source if the reload interval has elapsed"""
+        if not self.reload_interval or time.monotonic() < self._next_check:
+            return
+        with self._reloader_lock:
+            if self._reloader is not None and self._reloader.is_alive():
+                return
+            self._next_check = time.monotonic() + self.reload_interval
+            # Callers keep reading the current sections and indexes until the reload swaps them
+            self._reloader = threading.Thread(target=self._reload_in_background, name="careerpro-kb-reload", daemon=True)
+            self._reloader.start()
+
+    def _reload_in_background(self) -> None:
+        try:
+            self.reload()
+        except Exception:
+            logger.exception("Knowledge base reload failed")
+
+    def reload(self, force: bool = False) -> bool:
+        """Refresh changed sections if the source changed (or all of them if ``force``); return whether it did"""
+        with self._lock:
+            self._next_check = time.monotonic() + self.reload_interval
+            fingerprint = self.source.fingerprint()
+            if not force and fingerprint == self._fingerprint:
+                return False
+            revisions = self.source.section_revisions()
+            changed: Optional[FrozenSet[str]] = None
+            if not force and revisions is not None and self._revisions is not None:
+                changed = frozenset(
+                    section
+                    for section in set(revisions) | set(self._revisions)
+                    if revisions.get(section) != self._revisions.get(section)
+                )
+            self._fingerprint = fingerprint
+            self._revisions = revisions
+
+            # Fetch the new data before swapping, so readers never see a half-reloaded knowledge base
+            sections = {}
+            for name, data in self._sections.items():
+                if changed is not None and name not in changed:
+                    sections[name] = data
+                    continue
+                try:
+                    sections[name] = self._load(name)
+                except KeyError:
+                    pass
+            self._sections = sections
+            self.changed_sections = changed
+            try:
+                for callback in self._callbacks:
+                    callback()
+            finally:
+                # Bumped last, so nothing computed from the previous data is cached under the new version
+                self.version += 1
+            logger.info(
+                f"Knowledge base reloaded (version {self.version}, "
+                f"sections: {', '.join(sorted(changed)) if changed is not None else 'all'})"
+            )
+            return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CareerPro J&K knowledge base tools")
+    parser.add_argument("output", help="SQLite file to write, e.g. knowledge_base.db")
+    parser.add_argument("--from-json", help="JSON file with the sections to export (default: built-in data)")
+    args = parser.parse_args()
+
+    data = BUILTIN_KNOWLEDGE_BASE
+    if args.from_json:
+        with open(args.from_json, encoding="utf-8") as f:
+            data = json.load(f)
+    write_sqlite(args.output, data)
+    print(f"Wrote {', '.join(data)} to {args.output}")
+    print(f"Serve it with: CAREERPRO_KB_PATH={args.output} python fastapi_backend.py")
+
+if __name__ == "__main__":
+    main()
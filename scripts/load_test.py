@@ -0,0 +1,249 @@
+"""
+Load test and latency benchmark for CareerPro J&K FastAPI backend
+Drives the API concurrently and reports throughput and latency percentiles as JSON
+
+Run in-process (no server needed):   python load_test.py --requests 5000 --concurrency 50
+Run against a live server:           python load_test.py --base-url http://localhost:8000
+Compare with an earlier run:         python load_test.py --output new.json --compare old.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+# One message per intent and language, so every chat branch is exercised
+CHAT_MESSAGES = {
+    "english": [
+        "Hello, I need help with career guidance",
+        "Tell me about engineering colleges in J&K",
+        "What scholarship options are there?",
+        "When is the entrance exam?",
+        "What career should I choose?",
+        "Something completely unrelated",
+    ],
+    "hindi": [
+        "नमस्ते",
+        "मुझे जम्मू-कश्मीर के कॉलेजों के बारे में बताएं",
+        "छात्रवृत्ति की जानकारी दें",
+        "प्रवेश परीक्षा कब है?",
+        "मुझे नौकरी चाहिए",
+        "कुछ और",
+    ],
+}
+
+COLLEGE_QUERIES = [
+    {},
+    {"district": "Srinagar"},
+    {"course": "B.Tech"},
+    {"district": "Jammu", "course": "tech", "min_rating": 4.0},
+    {"limit": 1},
+]
+
+INTEREST_SETS = [
+    ["technology", "engineering"],
+    ["medical"],
+    ["teaching", "education"],
+    ["medical", "technology"],
+]
+
+DEFAULT_MIX = "chat=5,colleges=2,recommendations=2,scholarships=1,entrance-exams=1"
+
+# A scenario builds one (method, url, kwargs) request from a random generator
+Scenario = Callable[[random.Random, List[str]], Tuple[str, str, Dict[str, Any]]]
+
+def chat_request(rng: random.Random, languages: List[str]) -> Tuple[str, str, Dict[str, Any]]:
+    language = rng.choice(languages)
+    return "POST", "/chat", {"json": {
+        "message": rng.choice(CHAT_MESSAGES[language]),
+        "user_id": f"load_user_{rng.randrange(1000)}",
+        "language": language,
+    }}
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "chat": chat_request,
+    "colleges": lambda rng, languages: ("GET", "/colleges", {"params": rng.choice(COLLEGE_QUERIES)}),
+    "recommendations": lambda rng, languages: (
+        "POST", "/recommendations", {"json": {"interests": rng.choice(INTEREST_SETS)}}
+    ),
+    "scholarships": lambda rng, languages: ("GET", "/scholarships", {}),
+    "entrance-exams": lambda rng, languages: ("GET", "/entrance-exams", {}),
+}
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario '{name}', choose from: {', '.join(SCENARIOS)}")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    values = sorted(latencies)
+    return {
+        "requests": len(values),
+        "errors": errors,
+        "rps": round(len(values) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(sum(values) / len(values) * 1000, 3) if values else 0.0,
+        "p50_ms": round(percentile(values, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(values, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(values, 0.99) * 1000, 3),
+        "max_ms": round(values[-1] * 1000, 3) if values else 0.0,
+    }
+
+
+def current_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    mix: Dict[str, float],
+    languages: List[str],
+    concurrency: int,
+    total_requests: Optional[int],
+    duration: Optional[float],
+    seed: int,
+) -> Dict[str, Any]:
+    """Issue requests from ``concurrency`` workers until the request count or duration is reached"""
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    latencies: Dict[str, List[float]] = {name: [] for name in names}
+    errors: Dict[str, int] = {name: 0 for name in names}
+    issued = 0
+    start = time.perf_counter()
+    deadline = start + duration if duration else None
+
+    async def worker(worker_id: int) -> None:
+        nonlocal issued
+        rng = random.Random(seed + worker_id)
+        while True:
+            if total_requests is not None and issued >= total_requests:
+                return
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            issued += 1
+            name = rng.choices(names, weights)[0]
+            method, url, kwargs = SCENARIOS[name](rng, languages)
+            began = time.perf_counter()
+            try:
+                response = await client.request(method, url, **kwargs)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            latencies[name].append(time.perf_counter() - began)
+            errors[name] += failed
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    all_latencies = [value for values in latencies.values() for value in values]
+    return {
+        "commit": current_commit(),
+        "concurrency": concurrency,
+        "languages": languages,
+        "mix": mix,
+        "elapsed_s": round(elapsed, 3),
+        "overall": summarize(all_latencies, sum(errors.values()), elapsed),
+        "endpoints": {name: summarize(latencies[name], errors[name], elapsed) for name in names if latencies[name]},
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """Relative change (new / old - 1) of throughput and latency percentiles per endpoint"""
+    changes = {}
+    sections = [("overall", report["overall"], baseline.get("overall", {}))]
+    sections += [(name, stats, baseline.get("endpoints", {}).get(name, {})) for name, stats in report["endpoints"].items()]
+    for name, new, old in sections:
+        changes[name] = {
+            metric: round(new[metric] / old[metric] - 1, 4)
+            for metric in ("rps", "p50_ms", "p95_ms", "p99_ms")
+            if old.get(metric)
+        }
+    return changes
+
+
+async def main_async(args: argparse.Namespace) -> Dict[str, Any]:
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout)
+    else:
+        from fastapi_backend import app
+
+        # Importing the app sets the root logger to INFO; keep httpx from logging every request inside the timed loop
+        for name in ("httpx", "httpcore"):
+            logging.getLogger(name).setLevel(logging.WARNING)
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://loadtest", timeout=args.timeout)
+
+    async with client:
+        if args.warmup:
+            await run_load(client, parse_mix(args.mix), args.languages, args.concurrency, args.warmup, None, args.seed)
+        return await run_load(
+            client, parse_mix(args.mix), args.languages, args.concurrency, args.requests, args.duration, args.seed
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CareerPro J&K backend load test")
+    parser.add_argument("--base-url", help="server to test; omit to run the app in-process over ASGI")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--requests", type=int, help="total requests (default 2000 unless --duration is set)")
+    parser.add_argument("--duration", type=float, help="run for this many seconds instead of a fixed count")
+    parser.add_argument("--warmup", type=int, default=100, help="requests sent before measuring")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"weighted scenarios (default: {DEFAULT_MIX})")
+    parser.add_argument("--languages", default="english,hindi", type=lambda value: value.split(","))
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    parser.add_argument("--compare", help="earlier JSON report to compare against")
+    args = parser.parse_args()
+
+    if args.requests is None and args.duration is None:
+        args.requests = 2000
+    unknown = [language for language in args.languages if language not in CHAT_MESSAGES]
+    if unknown:
+        parser.error(f"unknown language(s): {', '.join(unknown)}")
+    try:
+        parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    report = asyncio.run(main_async(args))
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            report["change_vs_baseline"] = compare(report, json.load(f))
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    print(output)
+    if report["overall"]["errors"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
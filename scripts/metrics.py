@@ -0,0 +1,218 @@
+"""
+Metrics for CareerPro J&K FastAPI backend
+Counters, gauges and latency histograms rendered in the Prometheus text exposition format
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Request latency buckets in seconds, from sub-millisecond cache hits to slow batch jobs
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
+# (labels, value) samples produced by a collector at scrape time
+Sample = Tuple[Dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+    def _labels(self, values: Tuple[str, ...], constant: Dict[str, str]) -> Dict[str, str]:
+        return {**dict(zip(self.labelnames, values)), **constant}
+
+
+class Counter(_Metric):
+    """Monotonic count per label combination"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self, constant: Dict[str, str]) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self._labels(key, constant))} {_format_value(value)}" for key, value in values
+        ]
+
+
+class Gauge(Counter):
+    """Value that can go up and down, per label combination"""
+
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    """Cumulative bucket counts, sum and count of observations per label combination"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label combination: [count per bucket (+Inf last), sum]
+        self._values: Dict[Tuple[str, ...], List[Any]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def render(self, constant: Dict[str, str]) -> List[str]:
+        with self._lock:
+            values = [(key, list(counts), total) for key, (counts, total) in self._values.items()]
+        lines = self.header()
+        for key, counts, total in values:
+            labels = self._labels(key, constant)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels({**labels, 'le': _format_value(bound)})} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+class _Collected(_Metric):
+    def __init__(self, name: str, help_text: str, kind: str, collect: Callable[[], Iterable[Sample]]):
+        super().__init__(name, help_text)
+        self.kind = kind
+        self.collect = collect
+
+    def render(self, constant: Dict[str, str]) -> List[str]:
+        return self.header() + [
+            f"{self.name}{_format_labels({**labels, **constant})} {_format_value(value)}" for labels, value in self.collect()
+        ]
+
+
+class MetricsRegistry:
+    """Named metrics plus collectors that read other components' counters at scrape time.
+
+    Metrics live in the process that records them. Under the prefork server
+    (serve.py) each scrape reaches whichever worker accepts it, so every
+    sample is labelled with that worker's pid (``worker_label``); each
+    worker's counters then stay monotonic series of their own, and
+    ``sum without (worker)`` gives the server-wide figure.
+    """
+
+    def __init__(self, worker_label: Optional[str] = "worker"):
+        self.worker_label = worker_label
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _add(self, metric: _Metric) -> Any:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._add(Counter(name, help_text, labelnames))
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._add(Gauge(name, help_text, labelnames))
+
+    def histogram(self, name: str, help_text: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, help_text, labelnames, buckets))
+
+    def collector(self, name: str, help_text: str, kind: str, collect: Callable[[], Iterable[Sample]]) -> None:
+        """Register a metric whose samples are produced by ``collect`` on every scrape"""
+        self._add(_Collected(name, help_text, kind, collect))
+
+    def render(self) -> str:
+        # Read at scrape time: workers are forked after the registry is created
+        constant = {self.worker_label: str(os.getpid())} if self.worker_label else {}
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render(constant))
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording in-flight requests and latency per route template and status.
+
+    Routes are labelled by their path template (``/chat/sessions/{user_id}``),
+    never the raw path, so label cardinality stays bounded. Latency covers
+    the whole response, including streamed bodies.
+    """
+
+    def __init__(self, app: Callable, requests_in_flight: Gauge, request_latency: Histogram):
+        self.app = app
+        self.requests_in_flight = requests_in_flight
+        self.request_latency = request_latency
+        self._route_paths: Optional[Dict[Any, str]] = None
+
+    def _route_path(self, scope: Dict[str, Any]) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        if self._route_paths is None:
+            # The router records the matched endpoint in the scope; map it back to its template once
+            router = scope["app"].router
+            self._route_paths = {route.endpoint: route.path for route in router.routes if hasattr(route, "endpoint")}
+        return self._route_paths.get(endpoint, "unmatched")
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = ["500"]
+
+        async def send_with_status(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                status[0] = str(message["status"])
+            await send(message)
+
+        method = scope["method"]
+        self.requests_in_flight.inc(method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.requests_in_flight.dec(method)
+            self.request_latency.observe(time.perf_counter() - started, method, self._route_path(scope), status[0])
@@ -0,0 +1,513 @@
+"""
+Microbenchmarks for CareerPro J&K backend hot paths
+Run from the scripts directory: python microbench.py [benchmark ...]
+"""
+
+import argparse
+import csv
+import io
+import json
+import random
+import string
+import sys
+import timeit
+from typing import Callable, Dict, List, Tuple
+
+from autocomplete import PrefixIndex, autocomplete_entries
+from catalog import CatalogRecord, compact_section
+from catalog_models import JKCollege
+from college_index import CollegeIndex
+from geo_index import GeoIndex, chord_to_km, to_unit_vectors
+from ingest import ingest, read_rows
+from intent_classifier import IntentClassifier
+from knowledge_base import DictSource
+from notification_scheduler import SubscriberIndex
+from numeric_columns import parse_amount_range
+from recommender import CareerScorer
+from response_cache import encode_json
+from search_index import SearchIndex, knowledge_base_documents
+from transliteration import token_key
+
+SAMPLE_MESSAGES = [
+    "Hello, I need help with career guidance",
+    "Tell me about engineering colleges in J&K",
+    "What scholarships are available for students?",
+    "When is the JEE Main registration deadline?",
+    "मुझे जम्मू-कश्मीर के कॉलेजों के बारे में बताएं",
+    "Something completely unrelated to anything we know about",
+]
+
+def _time_per_call(func: Callable[[], object], number: int) -> float:
+    """Best-of-five microseconds per call"""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+def _synthetic_keywords(base: Dict[str, List[str]], total: int, seed: int = 7) -> Dict[str, List[str]]:
+    """Pad the intent keyword table with random terms until it holds ``total`` keywords"""
+    rng = random.Random(seed)
+    keywords = {intent: list(words) for intent, words in base.items()}
+    intents = list(keywords)
+    count = sum(len(words) for words in keywords.values())
+    while count < total:
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(6, 12)))
+        keywords[rng.choice(intents)].append("zq" + word)
+        count += 1
+    return keywords
+
+def bench_intent_classifier(number: int = 2000) -> List[Dict[str, float]]:
+    """Per-message classification cost as the keyword set grows"""
+    from fastapi_backend import INTENT_KEYWORDS
+
+    results = []
+    for total in (20, 200, 2000, 5000):
+        keywords = _synthetic_keywords(INTENT_KEYWORDS, total)
+        classifier = IntentClassifier(keywords)
+
+        def classify_all():
+            for message in SAMPLE_MESSAGES:
+                classifier.classify(message)
+
+        def any_chain():
+            # The previous implementation: one substring scan per keyword
+            for message in SAMPLE_MESSAGES:
+                message_lower = message.lower()
+                for words in keywords.values():
+                    if any(word in message_lower for word in words):
+                        break
+
+        results.append({
+            "keywords": total,
+            "automaton_us_per_message": round(_time_per_call(classify_all, number) / len(SAMPLE_MESSAGES), 3),
+            "any_chain_us_per_message": round(_time_per_call(any_chain, max(1, number // 10)) / len(SAMPLE_MESSAGES), 3),
+        })
+    return results
+
+# Ways students write each intent's topic: English, Devanagari, Romanized Hindi and inflected forms
+MIXED_SCRIPT_TOPICS = {
+    "greeting": ["hello", "namaste", "नमस्ते", "namastey", "नमस्कार"],
+    "college_info": ["college", "colleges", "कॉलेज", "कालेज", "kolej", "विश्वविद्यालय", "vishwavidyalaya"],
+    "scholarship_info": ["scholarship", "छात्रवृत्ति", "छात्रवृत्तियां", "chhatravritti", "chatravriti", "wazifa"],
+    "exam_info": ["exam", "परीक्षा", "pariksha", "pravesh pariksha", "प्रवेश परीक्षाएं"],
+    "career_guidance": ["career", "करियर", "naukri", "नौकरी", "rozgar", "jobs"],
+}
+MIXED_SCRIPT_FILLERS = ["kaha hai", "chahiye", "ke baare mein batao", "के बारे में बताएं", "in Srinagar", "जम्मू में", "kab hai", "for students"]
+
+def _mixed_script_messages(total: int, seed: int = 7) -> List[Tuple[str, str]]:
+    """(message, intent) pairs mixing scripts and fillers, a third with a typo in the topic word"""
+    rng = random.Random(seed)
+    intents = list(MIXED_SCRIPT_TOPICS)
+    messages = []
+    for _ in range(total):
+        intent = rng.choice(intents)
+        topic = rng.choice(MIXED_SCRIPT_TOPICS[intent])
+        if rng.random() < 0.33 and len(topic) >= 6:
+            i = rng.randrange(1, len(topic) - 1)
+            topic = topic[:i] + topic[i + 1:] if rng.random() < 0.5 else topic[:i - 1] + topic[i] + topic[i - 1] + topic[i + 1:]
+        words = [topic] + rng.sample(MIXED_SCRIPT_FILLERS, rng.randint(1, 2))
+        rng.shuffle(words)
+        messages.append((" ".join(words), intent))
+    return messages
+
+def bench_normalization(number: int = 5) -> List[Dict[str, float]]:
+    """Classifying mixed-script chat messages through the token keys, cold and warm caches, against raw substring checks"""
+    from fastapi_backend import INTENT_KEYWORDS
+
+    classifier = IntentClassifier(INTENT_KEYWORDS)
+    results = []
+    for total in (1000, 10000):
+        labelled = _mixed_script_messages(total)
+        messages = [message for message, _ in labelled]
+
+        def cold():
+            token_key.cache_clear()
+            classifier.vocabulary.correct.cache_clear()
+            classifier._match.cache_clear()
+            for message in messages:
+                classifier.classify(message)
+
+        def substring(message: str) -> str:
+            # The previous matching: keywords as substrings of the lowercased message
+            message_lower = message.lower()
+            for intent, words in INTENT_KEYWORDS.items():
+                if any(word in message_lower for word in words):
+                    return intent
+            return "default"
+
+        results.append({
+            "messages": total,
+            "cold_us_per_message": round(_time_per_call(cold, number) / total, 3),
+            "warm_us_per_message": round(_time_per_call(lambda: [classifier.classify(m) for m in messages], number) / total, 3),
+            "substring_us_per_message": round(_time_per_call(lambda: [substring(m) for m in messages], number) / total, 3),
+            "accuracy": round(sum(classifier.classify(m) == intent for m, intent in labelled) / total, 3),
+            "substring_accuracy": round(sum(substring(m) == intent for m, intent in labelled) / total, 3),
+        })
+    return results
+
+def _synthetic_colleges(base: List[Dict[str, object]], total: int, seed: int = 7) -> List[Dict[str, object]]:
+    """Clone the seed colleges across made-up districts until there are ``total`` records"""
+    rng = random.Random(seed)
+    districts = [f"District {i}" for i in range(20)]
+    colleges = []
+    for i in range(total):
+        college = dict(rng.choice(base))
+        college["name"] = f"{college['name']} #{i}"
+        college["district"] = rng.choice(districts)
+        college["rating"] = round(rng.uniform(3.0, 5.0), 1)
+        colleges.append(college)
+    return colleges
+
+def bench_college_index(number: int = 200) -> List[Dict[str, float]]:
+    """Combined district+course+rating filter: index lookup against list comprehensions"""
+    from fastapi_backend import JK_KNOWLEDGE_BASE
+
+    results = []
+    for total in (100, 1000, 10000):
+        colleges = _synthetic_colleges(JK_KNOWLEDGE_BASE["colleges"], total)
+        index = CollegeIndex(colleges)
+
+        def indexed():
+            index.query(district="District 3", course="b.tech", min_rating=4.0)
+
+        def scanned():
+            matches = [c for c in colleges if c["district"].lower() == "district 3"]
+            matches = [c for c in matches if any("b.tech" in name.lower() for name in c["courses"])]
+            [c for c in matches if c["rating"] >= 4.0]
+
+        results.append({
+            "colleges": total,
+            "index_us_per_query": round(_time_per_call(indexed, number), 3),
+            "scan_us_per_query": round(_time_per_call(scanned, number), 3),
+        })
+    return results
+
+def bench_chat_payload(number: int = 2000) -> Dict[str, float]:
+    """Chat response body: memoized payload + timestamp against a freshly built model"""
+    import fastapi_backend as backend
+    from datetime import datetime
+
+    def rebuilt():
+        for message in SAMPLE_MESSAGES:
+            language, intent = backend.classify_chat_message(message)
+            payload = {
+                "response": backend.CHAT_RESPONSES[language][intent],
+                "suggestions": list(backend.CHAT_SUGGESTIONS[language][intent]),
+                "resources": backend.get_chat_resources(intent),
+            }
+            backend.ChatResponse(**payload, timestamp=datetime.now()).model_dump_json()
+
+    def memoized():
+        for message in SAMPLE_MESSAGES:
+            backend.render_chat_response(message)
+
+    return {
+        "rebuilt_us_per_message": round(_time_per_call(rebuilt, number) / len(SAMPLE_MESSAGES), 3),
+        "memoized_us_per_message": round(_time_per_call(memoized, number) / len(SAMPLE_MESSAGES), 3),
+    }
+
+def bench_fee_filters(number: int = 50) -> List[Dict[str, float]]:
+    """Colleges within a fee budget, cheapest first: parsed fee columns against reparsing the fee text per request"""
+    from fastapi_backend import JK_KNOWLEDGE_BASE
+
+    results = []
+    for total in (1000, 10000, 100000):
+        colleges = _synthetic_colleges(JK_KNOWLEDGE_BASE["colleges"], total)
+        index = CollegeIndex(colleges)
+
+        def indexed():
+            index.query(max_fee=20000, sort="fee")
+
+        def reparsed():
+            fees = [(parse_amount_range(college["fees"]), row) for row, college in enumerate(colleges)]
+            sorted((parsed[0], row) for parsed, row in fees if parsed and parsed[0] <= 20000)
+
+        results.append({
+            "colleges": total,
+            "columns_us_per_query": round(_time_per_call(indexed, number), 3),
+            "reparse_us_per_query": round(_time_per_call(reparsed, max(1, number // 10)), 3),
+        })
+    return results
+
+def _synthetic_careers(base: List[Dict[str, object]], total: int, seed: int = 7) -> List[Dict[str, object]]:
+    """Clone the seed careers with random extra interest tags until there are ``total`` records"""
+    rng = random.Random(seed)
+    tags = ["tag%d" % i for i in range(500)]
+    careers = []
+    for i in range(total):
+        career = dict(rng.choice(base))
+        career["title"] = f"{career['title']} {i}"
+        career["interests"] = list(career["interests"]) + rng.sample(tags, 3)
+        careers.append(career)
+    return careers
+
+def bench_recommendations(number: int = 200) -> List[Dict[str, float]]:
+    """Scoring and ranking every career for one student profile"""
+    from fastapi_backend import JK_KNOWLEDGE_BASE
+
+    results = []
+    for total in (100, 1000, 5000):
+        scorer = CareerScorer(_synthetic_careers(JK_KNOWLEDGE_BASE["careers"], total), JK_KNOWLEDGE_BASE["career_paths"])
+        results.append({
+            "careers": total,
+            "vocabulary": len(scorer.vocabulary),
+            "us_per_profile": round(_time_per_call(lambda: scorer.recommend(["technology", "tag7"], ["programming"]), number), 3),
+        })
+    return results
+
+def bench_geo_index(number: int = 200) -> List[Dict[str, float]]:
+    """Ten nearest colleges to a point: KD-tree against a vectorized full scan"""
+    import numpy as np
+
+    rng = np.random.default_rng(7)
+    results = []
+    for total in (1000, 10000, 100000):
+        # Random points over the J&K bounding box
+        lat = rng.uniform(32.3, 37.0, total)
+        lng = rng.uniform(73.0, 80.3, total)
+        index = GeoIndex(zip(range(total), lat.tolist(), lng.tolist()))
+        xyz = to_unit_vectors(lat, lng)
+        query = to_unit_vectors(np.array([34.08]), np.array([74.80]))[0]
+
+        def scanned():
+            chords = np.linalg.norm(xyz - query, axis=1)
+            best = np.argpartition(chords, 9)[:10]
+            chord_to_km(chords[best[np.argsort(chords[best])]])
+
+        results.append({
+            "colleges": total,
+            "kd_tree_us_per_query": round(_time_per_call(lambda: index.nearest(34.08, 74.80, 10), number), 3),
+            "radius_10km_us_per_query": round(_time_per_call(lambda: index.within(34.08, 74.80, 10.0), number), 3),
+            "scan_us_per_query": round(_time_per_call(scanned, number), 3),
+        })
+    return results
+
+SAMPLE_SEARCHES = ["engineering srinagar", "medical col", "merit scholarship", "छात्रवृत्ति", "b.tech cse", "gov"]
+
+def bench_search(number: int = 200) -> List[Dict[str, float]]:
+    """Full-text query over the whole knowledge base: BM25 index against a substring scan"""
+    from fastapi_backend import JK_KNOWLEDGE_BASE
+
+    results = []
+    for total in (1000, 10000, 50000):
+        knowledge_base = {
+            **{section: JK_KNOWLEDGE_BASE[section] for section in JK_KNOWLEDGE_BASE},
+            "colleges": _synthetic_colleges(JK_KNOWLEDGE_BASE["colleges"], total // 2),
+            "careers": _synthetic_careers(JK_KNOWLEDGE_BASE["careers"], total // 2),
+        }
+        knowledge_base["scholarships"] = knowledge_base["scholarships"] + [
+            {"name": f"छात्रवृत्ति योजना {i}", "eligibility": "मेधावी छात्र", "amount": "₹10,000"} for i in range(50)
+        ]
+        documents = knowledge_base_documents(knowledge_base)
+        started = timeit.default_timer()
+        index = SearchIndex(documents)
+        build_seconds = timeit.default_timer() - started
+        texts = [encode_json(document["record"]).decode().lower() for document in documents]
+
+        def indexed():
+            for query in SAMPLE_SEARCHES:
+                index.search(query)
+
+        def scanned():
+            for query in SAMPLE_SEARCHES:
+                words = query.split()
+                [i for i, text in enumerate(texts) if all(word in text for word in words)]
+
+        results.append({
+            "documents": len(documents),
+            "terms": len(index.terms),
+            "build_ms": round(build_seconds * 1000, 1),
+            "index_us_per_query": round(_time_per_call(indexed, number) / len(SAMPLE_SEARCHES), 3),
+            "scan_us_per_query": round(_time_per_call(scanned, max(1, number // 20)) / len(SAMPLE_SEARCHES), 3),
+        })
+    return results
+
+def bench_autocomplete(number: int = 200) -> List[Dict[str, float]]:
+    """Completions per keystroke while typing a college name, uncached, as the catalog grows"""
+    from fastapi_backend import JK_KNOWLEDGE_BASE, chat_phrases
+
+    phrases = chat_phrases()
+    typed = "government medical college srinagar"
+    keystrokes = [typed[:end] for end in range(1, len(typed) + 1)] + ["छा", "छात्रवृत्ति"]
+    results = []
+    for total in (1000, 10000, 100000):
+        knowledge_base = {**{section: JK_KNOWLEDGE_BASE[section] for section in JK_KNOWLEDGE_BASE}}
+        knowledge_base["colleges"] = _synthetic_colleges(JK_KNOWLEDGE_BASE["colleges"], total)
+        knowledge_base["scholarships"] = [{"name": f"छात्रवृत्ति योजना {i}"} for i in range(100)]
+        index = PrefixIndex(autocomplete_entries(knowledge_base, phrases))
+
+        def complete_all():
+            for prefix in keystrokes:
+                index._complete(prefix)
+
+        results.append({
+            "entries": len(index),
+            "us_per_keystroke": round(_time_per_call(complete_all, max(1, number // 10)) / len(keystrokes), 3),
+            "cached_us_per_keystroke": round(_time_per_call(lambda: [index.complete(p) for p in keystrokes], number) / len(keystrokes), 3),
+        })
+    return results
+
+def bench_notifications(number: int = 5) -> List[Dict[str, float]]:
+    """Audience of one district- and course-specific deadline: preference index against a per-subscriber scan"""
+    rng = random.Random(7)
+    types = ["admission", "scholarship", "exam", "counseling", "document"]
+    districts = [f"District {i}" for i in range(20)]
+    courses = ["B.Tech", "MBBS", "B.Sc.", "B.A.", "B.Com"]
+    results = []
+    for total in (10000, 100000, 300000):
+        subscribers = SubscriberIndex()
+        profiles = []
+        for i in range(total):
+            profile = (
+                rng.sample(types, rng.randint(1, 3)) if rng.random() < 0.7 else [],
+                rng.sample(districts, rng.randint(1, 2)) if rng.random() < 0.5 else [],
+                rng.sample(courses, 1) if rng.random() < 0.3 else [],
+            )
+            subscribers.subscribe(f"user-{i}", *profile)
+            profiles.append((f"user-{i}", profile))
+
+        def scanned():
+            [
+                user_id for user_id, (kinds, places, studies) in profiles
+                if (not kinds or "counseling" in kinds)
+                and (not places or "District 3" in places)
+                and (not studies or "B.Tech" in studies)
+            ]
+
+        results.append({
+            "subscribers": total,
+            "index_ms_per_event": round(_time_per_call(lambda: subscribers.match("counseling", "District 3", ["B.Tech"]), number) / 1000, 3),
+            "scan_ms_per_event": round(_time_per_call(scanned, number) / 1000, 3),
+        })
+    return results
+
+def bench_ingest(number: int = 1) -> List[Dict[str, float]]:
+    """Bulk load of a catalog file: validation, dedupe and upsert per row, CSV and NDJSON"""
+    from fastapi_backend import JK_KNOWLEDGE_BASE
+
+    results = []
+    for total in (1000, 10000, 100000):
+        colleges = _synthetic_colleges(JK_KNOWLEDGE_BASE["colleges"], total)
+        fields = list(colleges[0])
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fields)
+        writer.writeheader()
+        writer.writerows({**college, "courses": ";".join(college["courses"]), "specialties": ";".join(college["specialties"])} for college in colleges)
+        csv_text = buffer.getvalue()
+        ndjson_text = "".join(json.dumps(college, ensure_ascii=False) + "\n" for college in colleges)
+
+        def load(text: str, fmt: str):
+            ingest(DictSource({"colleges": []}), "colleges", read_rows(io.StringIO(text), fmt, JKCollege))
+
+        results.append({
+            "rows": total,
+            "csv_us_per_row": round(_time_per_call(lambda: load(csv_text, "csv"), number) / total, 3),
+            "ndjson_us_per_row": round(_time_per_call(lambda: load(ndjson_text, "ndjson"), number) / total, 3),
+        })
+    return results
+
+def _memory_per_record(records: List[object]) -> float:
+    """Bytes per record, counting every distinct object reachable from the records once"""
+    seen = set()
+    total = 0
+    stack = list(records)
+    while stack:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        total += sys.getsizeof(value)
+        if isinstance(value, CatalogRecord):
+            stack.extend(getattr(value, slot) for _, slot in value.fields)
+            stack.extend([value.json, value.extra])
+        elif isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return total / len(records)
+
+def bench_catalog(number: int = 5) -> List[Dict[str, float]]:
+    """Memory per college and /colleges body encoding: compact records against plain dicts"""
+    from fastapi_backend import JK_KNOWLEDGE_BASE
+
+    results = []
+    for total in (1000, 10000, 100000):
+        # Round-trip through JSON, as records arrive from the SQLite source
+        dicts = json.loads(json.dumps(_synthetic_colleges(JK_KNOWLEDGE_BASE["colleges"], total)))
+        records = compact_section("colleges", dicts)
+        results.append({
+            "colleges": total,
+            "record_bytes": round(_memory_per_record(records)),
+            "dict_bytes": round(_memory_per_record(dicts)),
+            "record_encode_us_per_row": round(_time_per_call(lambda: encode_json(records), number) / total, 4),
+            "dict_encode_us_per_row": round(_time_per_call(lambda: encode_json(dicts), number) / total, 4),
+        })
+    return results
+
+def bench_serialization(number: int = 200) -> List[Dict[str, float]]:
+    """Response body per endpoint: FastAPI's validate + serialize + JSONResponse against FastJSONResponse"""
+    from datetime import date
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+    import fastapi_backend as backend
+    from response_cache import FastJSONResponse
+
+    routes = {route.path: route for route in backend.app.routes if hasattr(route, "response_field")}
+    payloads = {
+        "/colleges": backend.COLLEGE_INDEXES[0].colleges,
+        "/colleges/nearby": backend.find_nearby_colleges(34.08, 74.80, backend.MAX_NEARBY_COLLEGES),
+        "/scholarships": backend.JK_KNOWLEDGE_BASE["scholarships"],
+        "/entrance-exams": backend.JK_KNOWLEDGE_BASE["entrance_exams"],
+        "/timeline": [
+            {**event, "status": backend.event_status(event, date.today())}
+            for event in backend.TIMELINE_INDEX.query()
+        ],
+        "/recommendations": {"recommendations": backend.recommend_careers(["technology"], ["programming"], backend.MAX_RECOMMENDATIONS)},
+    }
+
+    results = []
+    for path, payload in payloads.items():
+        field = routes[path].response_field
+
+        def validated():
+            # What fastapi.routing.serialize_response does for a returned value
+            if field is None:
+                return JSONResponse(jsonable_encoder(payload))
+            value, _ = field.validate(payload, {}, loc=("response",))
+            return JSONResponse(field.serialize(value, by_alias=True))
+
+        results.append({
+            "endpoint": path,
+            "bytes": len(FastJSONResponse(payload).body),
+            "validated_us_per_response": round(_time_per_call(validated, number), 3),
+            "fast_us_per_response": round(_time_per_call(lambda: FastJSONResponse(payload), number), 3),
+        })
+    return results
+
+BENCHMARKS = {
+    "intent": bench_intent_classifier,
+    "normalization": bench_normalization,
+    "colleges": bench_college_index,
+    "fees": bench_fee_filters,
+    "chat": bench_chat_payload,
+    "recommendations": bench_recommendations,
+    "geo": bench_geo_index,
+    "serialization": bench_serialization,
+    "search": bench_search,
+    "autocomplete": bench_autocomplete,
+    "notifications": bench_notifications,
+    "ingest": bench_ingest,
+    "catalog": bench_catalog,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="CareerPro J&K backend microbenchmarks")
+    parser.add_argument("benchmarks", nargs="*", help=f"benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    args = parser.parse_args()
+
+    names = args.benchmarks or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+    print(json.dumps({name: BENCHMARKS[name]() for name in names}, indent=2, ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
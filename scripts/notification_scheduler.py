@@ -0,0 +1,357 @@
+"""
+Deadline notification scheduler for CareerPro J&K students
+Matches upcoming deadlines to subscribers through preference indexes and fans reminders out in batches to a sink
+
+Run once a day, e.g. from cron: python notification_scheduler.py subscribers.ndjson --output notifications.ndjson
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import sys
+from abc import ABC, abstractmethod
+from collections import Counter, defaultdict
+from datetime import date, timedelta
+from typing import IO, Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+from knowledge_base import KnowledgeBase
+from response_cache import encode_json
+from timeline_index import TimelineIndex, timeline_events
+
+logger = logging.getLogger(__name__)
+
+# Reminders go out this many days before a deadline, as in lib/notifications.ts
+REMINDER_DAYS = (7, 3, 1)
+
+# Recipients handed to the sink per call
+BATCH_SIZE = 1000
+
+# Server-side copy of jkNotificationTemplates in lib/notifications.ts
+NOTIFICATION_TEMPLATES = {
+    "admission": {"title": "J&K College Admission Alert", "body": "Admission deadline approaching for {college}", "priority": "high"},
+    "scholarship": {"title": "J&K Scholarship Available", "body": "New scholarship opportunity: {scholarshipName}", "priority": "normal"},
+    "exam": {"title": "Entrance Exam Reminder", "body": "{examName} registration deadline: {deadline}", "priority": "high"},
+    "counseling": {"title": "J&K Counseling Schedule", "body": "Counseling for {course} starts on {date}", "priority": "high"},
+    "document": {"title": "Document Verification", "body": "Document verification for {college} on {date}", "priority": "high"},
+}
+
+# Timeline event types that are deadlines, and the notification type each is sent as
+DEADLINE_TYPES = {"scholarship": "scholarship", "deadline": "exam"}
+
+# Preference attributes subscribers are indexed by; ANY files those without a preference
+ATTRIBUTES = ("type", "district", "course")
+ANY = "*"
+
+_EMPTY: FrozenSet[int] = frozenset()
+
+
+def _normalize(value: Any) -> str:
+    return str(value).strip().casefold()
+
+
+class _Fields(dict):
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+def render_notification(event: Dict[str, Any], kind: str, days_left: int, deadline: date) -> Dict[str, Any]:
+    """One reminder for ``event``, shaped like JKNotification and tagged like the client's local reminders"""
+    template = NOTIFICATION_TEMPLATES[kind]
+    name = event.get("name", event["title"])
+    courses = event.get("courses") or []
+    fields = _Fields(
+        scholarshipName=name,
+        examName=name,
+        college=name,
+        course=", ".join(courses),
+        deadline=f"{deadline:%B} {deadline.day}, {deadline.year}",
+        date=f"{deadline:%B} {deadline.day}, {deadline.year}",
+    )
+    notification = {
+        "id": f"{event['id']}-{days_left}days",
+        "title": f"{template['title']} - {days_left} day{'s' if days_left > 1 else ''} left!",
+        "body": template["body"].format_map(fields),
+        "type": kind,
+        "priority": template["priority"],
+        "deadline": deadline.isoformat(),
+        "actionUrl": event.get("link"),
+    }
+    if event.get("district"):
+        notification["district"] = event["district"]
+    return notification
+
+
+class SubscriberIndex:
+    """Subscribers filed under every value of each preference attribute.
+
+    A subscriber without a preference for an attribute (no districts
+    listed) is filed under ANY for it. The audience of an event is, across
+    the attributes the event restricts, the intersection of "wants one of
+    its values or has no preference". That is computed distributively, as
+    the union of the intersections of every choice of value set or ANY set
+    per attribute, each intersection starting from its smallest set, so the
+    large ANY sets are probed rather than copied. All of it is set
+    arithmetic in C, with no per-subscriber Python work. Subscribers are
+    stored as integer rows to keep the sets compact.
+    """
+
+    def __init__(self):
+        self.user_ids: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._preferences: List[Dict[str, Tuple[str, ...]]] = []
+        self._index: Dict[str, Dict[str, Set[int]]] = {attribute: defaultdict(set) for attribute in ATTRIBUTES}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def subscribe(
+        self, user_id: str, types: Iterable[str] = (), districts: Iterable[str] = (), courses: Iterable[str] = ()
+    ) -> None:
+        """Add a subscriber, or replace their preferences; empty preferences mean everything"""
+        self.unsubscribe(user_id)
+        row = len(self.user_ids)
+        preferences = {
+            "type": tuple({_normalize(value) for value in types}) or (ANY,),
+            "district": tuple({_normalize(value) for value in districts}) or (ANY,),
+            "course": tuple({_normalize(value) for value in courses}) or (ANY,),
+        }
+        self.user_ids.append(user_id)
+        self._preferences.append(preferences)
+        self._rows[user_id] = row
+        for attribute, values in preferences.items():
+            for value in values:
+                self._index[attribute][value].add(row)
+
+    def unsubscribe(self, user_id: str) -> bool:
+        row = self._rows.pop(user_id, None)
+        if row is None:
+            return False
+        for attribute, values in self._preferences[row].items():
+            for value in values:
+                self._index[attribute][value].discard(row)
+        self.user_ids[row] = None
+        self._preferences[row] = {}
+        return True
+
+    def match(self, kind: str, district: Optional[str] = None, courses: Sequence[str] = ()) -> Set[int]:
+        """Rows of subscribers who want ``kind`` notifications for this district and these courses"""
+        restrictions = [("type", [kind])]
+        if district:
+            restrictions.append(("district", [district]))
+        if courses:
+            restrictions.append(("course", courses))
+
+        choices = []
+        for attribute, values in restrictions:
+            index = self._index[attribute]
+            wanted = [index[value] for value in {_normalize(value) for value in values} if value in index]
+            if len(wanted) > 1:
+                wanted = [set().union(*wanted)]
+            choices.append([index.get(ANY, _EMPTY)] + wanted)
+
+        audience: Set[int] = set()
+        for sets in itertools.product(*choices):
+            smallest, *others = sorted(sets, key=len)
+            audience |= smallest.intersection(*others)
+        return audience
+
+
+class NotificationSink(ABC):
+    """Destination for rendered reminders; each call carries one notification and a batch of recipients"""
+
+    @abstractmethod
+    def send(self, notification: Dict[str, Any], user_ids: List[str]) -> None:
+        ...
+
+    def close(self) -> None:
+        pass
+
+
+class FileSink(NotificationSink):
+    """Write one NDJSON line per recipient, encoding the shared notification once per batch"""
+
+    def __init__(self, stream: IO[bytes]):
+        self.stream = stream
+
+    def send(self, notification: Dict[str, Any], user_ids: List[str]) -> None:
+        body = b"," + encode_json(notification)[1:] + b"\n"
+        self.stream.write(b"".join(b'{"userId":' + encode_json(user_id) + body for user_id in user_ids))
+
+    def close(self) -> None:
+        self.stream.flush()
+
+
+class MemorySink(NotificationSink):
+    """Keep every batch in memory, for dry runs and tests"""
+
+    def __init__(self):
+        self.batches: List[Tuple[Dict[str, Any], List[str]]] = []
+
+    def send(self, notification: Dict[str, Any], user_ids: List[str]) -> None:
+        self.batches.append((notification, user_ids))
+
+
+class NotificationScheduler:
+    """Sends each subscriber a reminder ``reminder_days`` days before every deadline they care about.
+
+    ``tick`` finds the deadlines due for a reminder today with one timeline
+    window query, matches each to its audience in the subscriber index and
+    hands the recipients to the sink ``batch_size`` at a time. Reminders
+    are remembered by tag, with their deadline, in ``sent`` once sending
+    starts; while one is only partly sent, ``delivered`` holds the users its
+    batches have reached, updated after every batch. Pass both from earlier
+    runs (``load_sent``) and a run that failed halfway resumes with the
+    users it missed, so no batch that went out is sent twice.
+    """
+
+    def __init__(
+        self,
+        timeline: TimelineIndex,
+        subscribers: SubscriberIndex,
+        sink: NotificationSink,
+        reminder_days: Sequence[int] = REMINDER_DAYS,
+        batch_size: int = BATCH_SIZE,
+        sent: Optional[Dict[str, str]] = None,
+        delivered: Optional[Dict[str, Set[str]]] = None,
+    ):
+        self.timeline = timeline
+        self.subscribers = subscribers
+        self.sink = sink
+        self.reminder_days = frozenset(reminder_days)
+        self.batch_size = batch_size
+        # Tag of every reminder sent -> ISO date of its deadline
+        self.sent: Dict[str, str] = dict(sent or {})
+        # Tag of every reminder still being sent -> users its batches have reached
+        self.delivered: Dict[str, Set[str]] = {tag: set(users) for tag, users in (delivered or {}).items()}
+
+    def due(self, today: date) -> List[Tuple[Dict[str, Any], int, date]]:
+        """(event, days left, deadline) for every deadline owed a reminder on ``today``"""
+        horizon = today + timedelta(days=max(self.reminder_days))
+        due = []
+        for event in self.timeline.query(start=today, end=horizon, types=DEADLINE_TYPES):
+            # A month-only deadline ("January 2025") falls on the month's last day
+            deadline = date.fromisoformat(event.get("endDate", event["date"]))
+            days_left = (deadline - today).days
+            if days_left in self.reminder_days:
+                due.append((event, days_left, deadline))
+        return due
+
+    def tick(self, today: Optional[date] = None) -> Dict[str, int]:
+        """Send today's reminders and return counts of events, notifications and batches"""
+        today = today or date.today()
+        stats: Counter = Counter()
+        for event, days_left, deadline in self.due(today):
+            kind = DEADLINE_TYPES[event["type"]]
+            notification = render_notification(event, kind, days_left, deadline)
+            tag = notification["id"]
+            if tag in self.sent and tag not in self.delivered:
+                continue
+            self.sent[tag] = deadline.isoformat()
+            delivered = self.delivered.setdefault(tag, set())
+            rows = sorted(self.subscribers.match(kind, event.get("district"), event.get("courses") or ()))
+            recipients = [self.subscribers.user_ids[row] for row in rows]
+            recipients = [user_id for user_id in recipients if user_id not in delivered]
+            for start in range(0, len(recipients), self.batch_size):
+                batch = recipients[start:start + self.batch_size]
+                self.sink.send(notification, batch)
+                delivered.update(batch)
+                stats["batches"] += 1
+            del self.delivered[tag]
+            stats["events"] += 1
+            stats["notifications"] += len(recipients)
+            logger.info(f"Sent {tag} to {len(recipients)} subscribers")
+        return {"events": stats["events"], "notifications": stats["notifications"], "batches": stats["batches"]}
+
+
+def load_subscribers(lines: Iterable[str]) -> SubscriberIndex:
+    """Index NDJSON subscriber records: userId, enabled, and types, districts and courses lists"""
+    subscribers = SubscriberIndex()
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            if record.get("enabled", True):
+                subscribers.subscribe(
+                    str(record.get("userId") or record["user_id"]),
+                    types=record.get("types") or (),
+                    districts=record.get("districts") or (),
+                    courses=record.get("courses") or (),
+                )
+        except (ValueError, KeyError, AttributeError) as e:
+            logger.warning(f"Skipping subscriber on line {number}: {e}")
+    return subscribers
+
+
+def load_sent(path: str, today: date) -> Tuple[Dict[str, str], Dict[str, Set[str]]]:
+    """Reminder tags recorded by earlier runs and the users of partly sent ones, dropping past deadlines"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return {}, {}
+    # State files written before partial sends were tracked hold only the tags
+    if "sent" not in state:
+        state = {"sent": state}
+    # Tags do not carry the year, so a past deadline's tags must not block next year's reminders
+    sent = {tag: deadline for tag, deadline in state["sent"].items() if deadline >= today.isoformat()}
+    delivered = {tag: set(users) for tag, users in state.get("delivered", {}).items() if tag in sent}
+    return sent, delivered
+
+
+def save_sent(path: str, sent: Dict[str, str], delivered: Optional[Dict[str, Set[str]]] = None) -> None:
+    """Replace the state file with ``sent`` and ``delivered`` atomically, so a crash never leaves it half written"""
+    state = {"sent": sent, "delivered": {tag: sorted(users) for tag, users in (delivered or {}).items()}}
+    temporary = path + ".tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        json.dump(state, f, sort_keys=True)
+    os.replace(temporary, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Send CareerPro J&K deadline reminders")
+    parser.add_argument("subscribers", help="NDJSON file of subscriber preferences")
+    parser.add_argument("--output", help="NDJSON file to append notifications to (default: stdout)")
+    parser.add_argument("--date", type=date.fromisoformat, help="run as of this day (default: today)")
+    parser.add_argument("--reminder-days", default=",".join(map(str, REMINDER_DAYS)), help="days before a deadline to remind")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument(
+        "--state", help="JSON file of reminders already sent, read and updated each run (default: OUTPUT.sent)"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+    with open(args.subscribers, encoding="utf-8") as f:
+        subscribers = load_subscribers(f)
+    today = args.date or date.today()
+    state = args.state or (args.output + ".sent" if args.output else None)
+    if state is None:
+        logger.warning("No --state or --output given; reminders sent by this run will be sent again next run")
+    sent, delivered = load_sent(state, today) if state else ({}, {})
+    knowledge_base = KnowledgeBase.from_env()
+    output = open(args.output, "ab") if args.output else sys.stdout.buffer
+    sink = FileSink(output)
+    scheduler = NotificationScheduler(
+        TimelineIndex(timeline_events(knowledge_base)),
+        subscribers,
+        sink,
+        reminder_days=[int(days) for days in args.reminder_days.split(",")],
+        batch_size=args.batch_size,
+        sent=sent,
+        delivered=delivered,
+    )
+    try:
+        stats = scheduler.tick(today)
+    finally:
+        sink.close()
+        if args.output:
+            output.close()
+        # Saved even after a failure, so the batches that did go out are not sent again
+        if state:
+            save_sent(state, scheduler.sent, scheduler.delivered)
+    print(json.dumps({"subscribers": len(subscribers), **stats}), file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Numeric columns for CareerPro J&K catalog fields shown as text
+Parses fee, salary and growth strings once into min/max arrays that filters and sorts compare in bulk
+"""
+
+import math
+import re
+from typing import Callable, Iterable, Optional, Tuple
+
+import numpy as np
+
+# Rupee multipliers for the unit suffixes used across the catalog ("₹2.5L", "₹4.5 - 8 LPA")
+AMOUNT_UNITS = {
+    "k": 1e3,
+    "l": 1e5,
+    "lac": 1e5,
+    "lacs": 1e5,
+    "lakh": 1e5,
+    "lakhs": 1e5,
+    "lpa": 1e5,
+    "cr": 1e7,
+    "crore": 1e7,
+    "crores": 1e7,
+}
+
+# An amount with Indian or Western digit grouping and an optional unit suffix
+_AMOUNT = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*(lpa|lakhs?|lacs?|l|crores?|cr|k)?\b", re.IGNORECASE)
+_PERCENT = re.compile(r"(\d+(?:\.\d+)?)(?:\s*(?:-|–|to)\s*(\d+(?:\.\d+)?))?\s*%")
+
+
+def parse_amount_range(text: str) -> Optional[Tuple[float, float]]:
+    """Rupee (min, max) of '₹8,000 - ₹15,000 per year', '₹3.5 - 8 LPA' or '₹2.5L per year'.
+
+    A unit written once after a range ('3.5 - 8 LPA') applies to every
+    amount before it that has none.
+    """
+    amounts = []
+    pending = []
+    for digits, unit in _AMOUNT.findall(text or ""):
+        pending.append(float(digits.replace(",", "")))
+        if unit:
+            amounts.extend(value * AMOUNT_UNITS[unit.lower()] for value in pending)
+            pending = []
+    amounts.extend(pending)
+    return (min(amounts), max(amounts)) if amounts else None
+
+
+def parse_percent_range(text: str) -> Optional[Tuple[float, float]]:
+    """(min, max) percentage of '15% annually', '10-12%' or '13% (Faster than average)'"""
+    match = _PERCENT.search(text or "")
+    if match is None:
+        return None
+    low = float(match.group(1))
+    high = float(match.group(2)) if match.group(2) else low
+    return min(low, high), max(low, high)
+
+
+class RangeColumn:
+    """Parsed (min, max) of one text field for every row of a catalog, NaN where nothing parsed.
+
+    Bounds compare against the whole column at once and rows without a
+    value never satisfy one; sorting puts them last in either direction.
+    """
+
+    def __init__(self, texts: Iterable[Optional[str]], parse: Callable[[str], Optional[Tuple[float, float]]]):
+        low, high = [], []
+        for text in texts:
+            parsed = parse(str(text)) if text is not None else None
+            low.append(parsed[0] if parsed else math.nan)
+            high.append(parsed[1] if parsed else math.nan)
+        self.low = np.array(low, dtype=np.float64)
+        self.high = np.array(high, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.low)
+
+    def at_most(self, maximum: float) -> np.ndarray:
+        """Mask of rows whose range starts at or below ``maximum``"""
+        return self.low <= maximum
+
+    def at_least(self, minimum: float) -> np.ndarray:
+        """Mask of rows whose range reaches ``minimum`` or above"""
+        return self.high >= minimum
+
+
+def order_rows(rows: np.ndarray, values: np.ndarray, descending: bool = False) -> np.ndarray:
+    """``rows`` ordered by ``values`` (one per row of the catalog), ties by row, rows without a value last"""
+    keys = values[rows]
+    return rows[np.lexsort((rows, -keys if descending else keys))]
@@ -0,0 +1,95 @@
+"""
+Sampling profiler for CareerPro J&K backend processes
+Periodically snapshots every thread's stack and aggregates them as folded stacks for flame graphs
+"""
+
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Dict, List, Optional
+
+# Deepest stack recorded per sample; deeper frames are cut at the root end
+MAX_DEPTH = 128
+
+
+def _folded(frame: Optional[FrameType]) -> str:
+    names: List[str] = []
+    while frame is not None and len(names) < MAX_DEPTH:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class SamplingProfiler:
+    """Background thread sampling all thread stacks every ``interval`` seconds.
+
+    Costs nothing until started, and while running only reads interpreter
+    frames, so it can be switched on in a live process. Results are folded
+    stacks (``frame;frame;frame count`` per line), the input format of
+    flamegraph.pl and speedscope.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> bool:
+        """Start sampling; returns False if already running"""
+        with self._lock:
+            if self.running:
+                return False
+            self.samples = Counter()
+            self.sample_count = 0
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="careerpro-profiler", daemon=True)
+            self._thread.start()
+            return True
+
+    def stop(self) -> str:
+        """Stop sampling and return the folded stacks collected since ``start``"""
+        with self._lock:
+            if self._thread is not None:
+                self._stop.set()
+                self._thread.join()
+                self._thread = None
+            return self.folded()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        names: Dict[int, str] = {}
+        while not self._stop.wait(self.interval):
+            names.update({thread.ident: thread.name for thread in threading.enumerate()})
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    self.samples[names.get(thread_id, str(thread_id)) + ";" + _folded(frame)] += 1
+            self.sample_count += 1
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+    def install_signal_toggle(self, signum: int, output_dir: str) -> None:
+        """Let ``kill -<signum> <pid>`` start sampling, and a second signal write the results to ``output_dir``"""
+
+        def toggle(sig: int, frame: Optional[FrameType]) -> None:
+            if not self.running:
+                self.start()
+                return
+            # Joining the sampler inside a signal handler is fine: it only waits one interval
+            path = os.path.join(output_dir, f"careerpro-profile-{os.getpid()}-{int(time.time())}.folded")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self.stop())
+
+        signal.signal(signum, toggle)
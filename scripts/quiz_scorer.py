@@ -0,0 +1,84 @@
+"""
+Career quiz scoring for CareerPro J&K
+Turns quiz answers into a trait profile with one lookup into a precomputed answer x trait matrix
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Tuple, Union
+
+import numpy as np
+
+# Multiplier applied to a question's trait weights for each answer option,
+# from strongest agreement to strongest disagreement
+LIKERT_SCALE = (1.0, 0.5, 0.0, -0.5, -1.0)
+
+
+class QuizScorer:
+    """Precomputed (question, option) x trait weight matrix for the career quiz.
+
+    Row ``offsets[q] + o`` holds the trait weights of picking option ``o`` of
+    question ``q``, so scoring a submission is one fancy-indexed sum over the
+    chosen rows. Scores are divided by the best total each trait can reach and
+    negative totals are dropped, which leaves every trait in [0, 1].
+    """
+
+    def __init__(self, questions: Iterable[Dict[str, Any]], scale: Tuple[float, ...] = LIKERT_SCALE):
+        self.questions: List[Dict[str, Any]] = list(questions)
+        self.traits: List[str] = sorted({trait for question in self.questions for trait in question.get("traits", {})})
+        trait_columns = {trait: column for column, trait in enumerate(self.traits)}
+
+        self._question_rows: Dict[str, int] = {}
+        self._option_rows: Dict[Tuple[str, str], int] = {}
+        self._option_counts: Dict[str, int] = {}
+        rows: List[np.ndarray] = []
+        for question in self.questions:
+            question_id = str(question["id"])
+            options = question.get("options", [])
+            self._question_rows[question_id] = len(rows)
+            self._option_counts[question_id] = len(options)
+            weights = np.zeros(len(self.traits))
+            for trait, weight in question.get("traits", {}).items():
+                weights[trait_columns[trait]] = weight
+            # Questions with a different number of options spread the scale evenly
+            multipliers = scale if len(options) == len(scale) else np.linspace(scale[0], scale[-1], len(options))
+            for option, multiplier in zip(options, multipliers):
+                self._option_rows[(question_id, option.lower())] = len(rows)
+                rows.append(weights * multiplier)
+
+        self.weights = np.array(rows).reshape(len(rows), len(self.traits))
+        # Best reachable total per trait: the most favourable option of every question
+        best = np.zeros(len(self.traits))
+        for question_id, first in self._question_rows.items():
+            count = self._option_counts[question_id]
+            if count:
+                best += self.weights[first:first + count].max(axis=0).clip(min=0)
+        best[best == 0] = 1
+        self._best = best
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def answer_rows(self, answers: Mapping[Any, Union[str, int]]) -> List[int]:
+        """Matrix rows for ``{question_id: option text or index}``, raising ValueError on unknown answers"""
+        rows = []
+        for question_id, answer in answers.items():
+            question_id = str(question_id)
+            if question_id not in self._question_rows:
+                raise ValueError(f"Unknown quiz question: {question_id}")
+            if isinstance(answer, int) and not isinstance(answer, bool):
+                if not 0 <= answer < self._option_counts[question_id]:
+                    raise ValueError(f"Option {answer} out of range for question {question_id}")
+                rows.append(self._question_rows[question_id] + answer)
+                continue
+            row = self._option_rows.get((question_id, str(answer).lower()))
+            if row is None:
+                raise ValueError(f"Unknown option '{answer}' for question {question_id}")
+            rows.append(row)
+        return rows
+
+    def score(self, answers: Mapping[Any, Union[str, int]]) -> Dict[str, float]:
+        """Trait scores in (0, 1] for a submission; traits scoring zero or less are omitted"""
+        totals = self.weights[self.answer_rows(answers)].sum(axis=0) / self._best
+        return {
+            self.traits[column]: round(float(totals[column]), 4)
+            for column in np.flatnonzero(totals > 0)
+        }
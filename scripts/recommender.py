@@ -0,0 +1,200 @@
+"""
+Career recommendation scoring for CareerPro J&K
+Scores every career against a student's interests and skills in one matrix product
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from numeric_columns import RangeColumn, parse_amount_range, parse_percent_range
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# Relative weight of each kind of career feature; interest tags dominate,
+# descriptive words only break ties between otherwise similar careers
+INTEREST_WEIGHT = 1.0
+PATH_WEIGHT = 0.6
+SKILL_WEIGHT = 0.3
+TITLE_WEIGHT = 0.3
+
+# Career fields that are internal to scoring and not returned to clients
+INTERNAL_FIELDS = ("path", "interests")
+
+# Orders recommendations can be returned in: best match, or best paid / fastest growing among the matches
+SORT_BY = ("match", "salary", "growth")
+
+
+def _ranges(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Concatenation of ``arange(start, end)`` for every pair, without a Python loop"""
+    lengths = ends - starts
+    offsets = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths)
+    return offsets + np.arange(int(lengths.sum()))
+
+
+def tokenize(values: Iterable[str]) -> List[str]:
+    """Lowercased word tokens of every string in ``values``"""
+    return [token for value in values for token in _TOKEN.findall(str(value).lower())]
+
+
+class CareerScorer:
+    """Sparse career x term matrix over a vocabulary shared with student profiles.
+
+    Each career row holds IDF-weighted features from its interest tags, its
+    career path (the path name and its listed opportunities), its skills and
+    its title, normalised to unit length. The matrix is stored column-wise
+    (CSC), so scoring a profile only touches the careers sharing one of its
+    terms, and match percentages for every career come out of one weighted
+    ``bincount`` (cosine similarity).
+    """
+
+    def __init__(self, careers: Iterable[Dict[str, Any]], career_paths: Optional[Mapping[str, Dict[str, Any]]] = None):
+        self.careers: List[Dict[str, Any]] = list(careers)
+        career_paths = career_paths or {}
+        self.public = [
+            {key: value for key, value in career.items() if key not in INTERNAL_FIELDS}
+            for career in self.careers
+        ]
+        self.salaries = RangeColumn((career.get("salary_range") for career in self.careers), parse_amount_range)
+        self.growth = RangeColumn((career.get("growth_rate") for career in self.careers), parse_percent_range)
+
+        features: List[Dict[str, float]] = []
+        for career in self.careers:
+            weights: Dict[str, float] = {}
+
+            def add(tokens: Iterable[str], weight: float) -> None:
+                for token in tokens:
+                    weights[token] = max(weights.get(token, 0.0), weight)
+
+            add(tokenize(career.get("interests", [])), INTEREST_WEIGHT)
+            path_name = career.get("path")
+            if path_name:
+                path = career_paths.get(path_name, {})
+                add(tokenize([path_name]), PATH_WEIGHT)
+                add(tokenize(path.get("opportunities", [])), SKILL_WEIGHT)
+            add(tokenize(career.get("skills", [])), SKILL_WEIGHT)
+            add(tokenize([career.get("title", "")]), TITLE_WEIGHT)
+            features.append(weights)
+
+        # Group the (row, weight) entries by term
+        columns: Dict[str, List[Any]] = {}
+        for row, weights in enumerate(features):
+            for token, weight in weights.items():
+                entries = columns.setdefault(token, [[], []])
+                entries[0].append(row)
+                entries[1].append(weight)
+
+        self.vocabulary: Dict[str, int] = {token: column for column, token in enumerate(columns)}
+        lengths = np.array([len(rows) for rows, _ in columns.values()], dtype=np.int64)
+        self._indptr = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+        self._rows = np.array([row for rows, _ in columns.values() for row in rows], dtype=np.int32)
+        data = np.array([weight for _, weights in columns.values() for weight in weights], dtype=np.float32)
+
+        # Terms shared by many careers say less about any one of them
+        self.idf = (np.log((1 + len(self.careers)) / (1 + lengths)) + 1).astype(np.float32)
+        data *= np.repeat(self.idf, lengths)
+        norms = np.sqrt(np.bincount(self._rows, weights=data.astype(np.float64) ** 2, minlength=len(self.careers)))
+        norms[norms == 0] = 1
+        self._data = (data / norms[self._rows]).astype(np.float32)
+        # Weight given to profile terms the catalog has never seen
+        self.unknown_idf = float(np.log(1 + len(self.careers)) + 1)
+
+    def vectorize(self, interests: Iterable[str] = (), skills: Iterable[str] = ()) -> Dict[int, float]:
+        """Project a student profile onto the career vocabulary as a sparse unit vector"""
+        terms = [(token, INTEREST_WEIGHT) for token in tokenize(interests)]
+        terms += [(token, SKILL_WEIGHT) for token in tokenize(skills)]
+        return self._project(terms)
+
+    def vectorize_traits(self, traits: Mapping[str, float], skills: Iterable[str] = ()) -> Dict[int, float]:
+        """Like ``vectorize``, with each interest term weighted by a trait score such as a quiz result"""
+        terms = [(token, INTEREST_WEIGHT * score) for trait, score in traits.items() for token in tokenize([trait])]
+        terms += [(token, SKILL_WEIGHT) for token in tokenize(skills)]
+        return self._project(terms)
+
+    def _project(self, terms: Iterable[Tuple[str, float]]) -> Dict[int, float]:
+        vector: Dict[int, float] = {}
+        unknown = 0.0
+        for token, weight in terms:
+            column = self.vocabulary.get(token)
+            if column is None:
+                unknown += (weight * self.unknown_idf) ** 2
+            else:
+                vector[column] = max(vector.get(column, 0.0), weight * float(self.idf[column]))
+        norm = float(np.sqrt(sum(value * value for value in vector.values()) + unknown))
+        return {column: value / norm for column, value in vector.items()} if norm else vector
+
+    def scores(self, vector: Dict[int, float]) -> np.ndarray:
+        """Cosine similarity of every career with a sparse profile vector"""
+        return self.batch_scores([vector])[0]
+
+    def batch_scores(self, vectors: List[Dict[int, float]]) -> np.ndarray:
+        """Profile x career cosine similarities for a batch of sparse profile vectors.
+
+        The batch is multiplied against the career matrix as one sparse
+        product: every (profile, term) entry is expanded into the careers
+        that share the term and accumulated with a single ``bincount``.
+        """
+        careers = len(self.careers)
+        profiles = np.repeat(np.arange(len(vectors)), [len(vector) for vector in vectors])
+        columns = np.fromiter((column for vector in vectors for column in vector), dtype=np.int64, count=len(profiles))
+        values = np.fromiter((value for vector in vectors for value in vector.values()), dtype=np.float64, count=len(profiles))
+
+        starts, ends = self._indptr[columns], self._indptr[columns + 1]
+        lengths = ends - starts
+        picks = _ranges(starts, ends)
+        cells = np.repeat(profiles, lengths) * careers + self._rows[picks]
+        scores = np.bincount(cells, weights=self._data[picks] * np.repeat(values, lengths), minlength=len(vectors) * careers)
+        return scores.reshape(len(vectors), careers)
+
+    def top_k(
+        self, scores: np.ndarray, k: int, min_salary: Optional[float] = None, sort_by: str = "match"
+    ) -> List[Dict[str, Any]]:
+        """Best ``k`` careers with a non-zero score, highest match first.
+
+        ``min_salary`` keeps the careers whose salary range reaches it;
+        ``sort_by`` "salary" or "growth" orders the matches by the top of
+        their salary or growth range instead, ties by match.
+        """
+        if sort_by not in SORT_BY:
+            raise ValueError(f"Unknown sort_by: {sort_by}. Expected one of: {', '.join(SORT_BY)}")
+        if min_salary is None and sort_by == "match":
+            return self.batch_top_k(scores[np.newaxis, :], k)[0]
+        eligible = scores > 0
+        if min_salary is not None:
+            eligible &= self.salaries.at_least(min_salary)
+        rows = np.flatnonzero(eligible)
+        rows = rows[np.lexsort((rows, -scores[rows]))]
+        if sort_by != "match":
+            column = self.salaries if sort_by == "salary" else self.growth
+            # A stable sort keeps the match order among equal values
+            rows = rows[np.argsort(-column.high[rows], kind="stable")]
+        return [self._recommendation(row, float(scores[row])) for row in rows[:k].tolist()]
+
+    def _recommendation(self, row: int, score: float) -> Dict[str, Any]:
+        return {"title": self.public[row]["title"], "match_percentage": int(round(score * 100)), **self.public[row]}
+
+    def batch_top_k(self, scores: np.ndarray, k: int) -> List[List[Dict[str, Any]]]:
+        """``top_k`` for every row of a profile x career score matrix"""
+        k = min(k, scores.shape[1])
+        if k <= 0:
+            return [[] for _ in range(len(scores))]
+        best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top = np.take_along_axis(scores, best, axis=1)
+        order = np.argsort(-top, axis=1, kind="stable")
+        best = np.take_along_axis(best, order, axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        return [
+            [self._recommendation(row, score) for row, score in zip(rows, row_scores) if score > 0]
+            for rows, row_scores in zip(best.tolist(), top.tolist())
+        ]
+
+    def recommend(
+        self,
+        interests: Iterable[str] = (),
+        skills: Iterable[str] = (),
+        k: int = 5,
+        min_salary: Optional[float] = None,
+        sort_by: str = "match",
+    ) -> List[Dict[str, Any]]:
+        return self.top_k(self.scores(self.vectorize(interests, skills)), k, min_salary, sort_by)
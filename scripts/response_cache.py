@@ -0,0 +1,221 @@
+"""
+Pre-serialized response cache for CareerPro J&K catalog endpoints
+Stores encoded (and compressed) JSON bodies with strong ETags per endpoint and query
+"""
+
+import gzip
+import hashlib
+import json
+import math
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard library encoder produces the same bytes, only slower
+    orjson = None
+
+# Bodies smaller than this are not worth compressing
+MIN_COMPRESS_SIZE = 512
+
+
+# Match the standard encoder: non-string dict keys become strings, numpy values become numbers
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson is not None else 0
+
+# orjson 3.9+ embeds already-encoded JSON as is
+_Fragment = getattr(orjson, "Fragment", None)
+
+
+class PreEncoded(ABC):
+    """Base for objects that carry their own encoding in ``json``.
+
+    ``encode_json`` joins the stored bytes of a list of them without
+    encoding anything, and embeds them elsewhere in a body as orjson
+    fragments where supported, or via ``as_data`` otherwise.
+    """
+
+    __slots__ = ()
+    json: bytes
+
+    @abstractmethod
+    def as_data(self) -> Any:
+        """Plain data that encodes to ``json``"""
+
+
+def _encode_default(value: Any) -> Any:
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, PreEncoded):
+        return _Fragment(value.json) if _Fragment is not None else value.as_data()
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _finite(value: Any) -> Any:
+    """``value`` with NaN and infinite floats replaced by None, as orjson encodes them"""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    if isinstance(value, PreEncoded):
+        return _finite(value.as_data())
+    if hasattr(value, "tolist"):
+        return _finite(value.tolist())
+    return value
+
+
+def _dumps(content: Any) -> bytes:
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_encode_default
+    ).encode("utf-8")
+
+
+def encode_json(content: Any) -> bytes:
+    """Encode ``content`` as compact UTF-8 JSON, dates as ISO 8601 and NaN as null, using orjson when installed"""
+    if type(content) is list and content and all(isinstance(item, PreEncoded) for item in content):
+        return b"[" + b",".join([item.json for item in content]) + b"]"
+    if orjson is not None:
+        return orjson.dumps(content, default=_encode_default, option=_ORJSON_OPTIONS)
+    try:
+        return _dumps(content)
+    except ValueError:
+        # Only bodies holding NaN or infinity pay for the second pass
+        return _dumps(_finite(content))
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with ``encode_json``.
+
+    Returning one from an endpoint skips FastAPI's response-model validation
+    and ``jsonable_encoder`` pass, so use it only for data the server built
+    itself. The route's ``response_model`` still documents the body in the
+    OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
+
+
+class CachedBody:
+    """One encoded response body and its compressed variants, built on demand"""
+
+    def __init__(self, body: bytes, headers: Dict[str, str], version: Hashable):
+        self.body = body
+        self.headers = headers
+        self.version = version
+        self.etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        self._encoded: Dict[str, bytes] = {"identity": body}
+
+    def encoded(self, encoding: str) -> bytes:
+        if encoding not in self._encoded:
+            if encoding == "br":
+                self._encoded[encoding] = brotli.compress(self.body)
+            else:
+                self._encoded[encoding] = gzip.compress(self.body, mtime=0)
+        return self._encoded[encoding]
+
+    def etag_for(self, encoding: str) -> str:
+        # Each representation needs its own strong validator
+        return self.etag if encoding == "identity" else self.etag[:-1] + "-" + encoding + '"'
+
+
+def cache_key(path: str, query: str = "") -> Tuple[str, str]:
+    """Cache key for a path and raw query string; parameter order does not matter"""
+    return path, "&".join(sorted(query.split("&")))
+
+
+def _choose_encoding(accept_encoding: str, size: int) -> str:
+    if size < MIN_COMPRESS_SIZE:
+        return "identity"
+    accepted = {part.split(";")[0].strip().lower() for part in accept_encoding.split(",")}
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return "identity"
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any((tag[2:] if tag.startswith("W/") else tag) == etag for tag in candidates)
+
+
+class ResponseCache:
+    """Bounded LRU of encoded JSON responses keyed by path, query and data version.
+
+    ``version`` is called on every lookup; entries built for an older version
+    are rebuilt, so a knowledge-base reload invalidates the cache without any
+    explicit purge. ``clear`` is still available to free memory eagerly.
+    """
+
+    def __init__(self, version: Callable[[], Hashable], max_entries: int = 256):
+        self.version = version
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str], CachedBody]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get(
+        self,
+        key: Tuple[str, str],
+        build: Callable[[], Tuple[Any, Optional[Dict[str, str]]]],
+    ) -> CachedBody:
+        """Return the cached body for ``key``, calling ``build`` for (content, headers) on a miss"""
+        version = self.version()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        content, headers = build()
+        entry = CachedBody(encode_json(content), headers or {}, version)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def respond(
+        self,
+        request: Request,
+        build: Callable[[], Tuple[Any, Optional[Dict[str, str]]]],
+    ) -> Response:
+        """Serve ``request`` from the cache, answering 304 when the client's ETag is current"""
+        entry = self.get(cache_key(request.url.path, str(request.query_params)), build)
+
+        encoding = _choose_encoding(request.headers.get("accept-encoding", ""), len(entry.body))
+        etag = entry.etag_for(encoding)
+        headers = {**entry.headers, "ETag": etag, "Vary": "Accept-Encoding"}
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(content=entry.encoded(encoding), media_type="application/json", headers=headers)
@@ -9,31 +9,39 @@ import threading
 import requests
 from datetime import datetime
 
+def wait_until_ready(url="http://localhost:8000/ready", timeout=30.0, interval=0.2):
+    """Poll the readiness endpoint until the server has warmed up or the timeout expires"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(url, timeout=1).status_code == 200:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(interval)
+    return False
+
 def start_fastapi_server():
     """Start the FastAPI server in a separate process"""
     print("🚀 Starting CareerPro J&K FastAPI Backend...")
     try:
         # Start the FastAPI server
         process = subprocess.Popen([
-            "python", "scripts/fastapi_backend.py"
+            "python", "scripts/serve.py", "--workers", "1"
         ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         
-        # Wait for server to start
-        time.sleep(3)
+        # Wait until the server reports its caches are warm
+        if wait_until_ready():
+            print("✅ FastAPI server started successfully!")
+            print("📚 API Documentation: http://localhost:8000/docs")
+            return process
         
-        # Check if server is running
-        try:
-            response = requests.get("http://localhost:8000/health")
-            if response.status_code == 200:
-                print("✅ FastAPI server started successfully!")
-                print("📚 API Documentation: http://localhost:8000/docs")
-                return process
-            else:
-                print("❌ Server health check failed")
-                return None
-        except:
-            print("❌ Could not connect to server")
-            return None
+        if process.poll() is not None:
+            print("❌ Server exited during startup")
+        else:
+            print("❌ Server did not become ready in time")
+            process.terminate()
+        return None
             
     except Exception as e:
         print(f"❌ Error starting server: {e}")
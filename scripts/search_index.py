@@ -0,0 +1,174 @@
+"""
+Full-text search index for the CareerPro J&K knowledge base
+Keys every word of every record script-neutrally, ranks matches with BM25 and expands the last word as a prefix for typeahead
+"""
+
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from transliteration import prefix_keys, text_keys, token_key, tokenize
+
+# BM25 term-frequency saturation and document-length normalisation
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Each word of a record's name or title counts this many times
+TITLE_WEIGHT = 2.0
+
+# Vocabulary terms a trailing prefix may expand to; the most widespread are kept
+MAX_PREFIX_EXPANSIONS = 64
+
+# Fields naming a record, and fields holding links, contacts or coordinates rather than text
+TITLE_FIELDS = ("name", "title", "question")
+SKIPPED_FIELDS = frozenset({"website", "link", "url", "phone", "lat", "lng", "id"})
+
+def _collect_strings(value: Any, out: List[str]) -> None:
+    # Records are Mappings (CatalogRecord or dict) holding plain JSON values
+    if isinstance(value, str):
+        out.append(value)
+    elif isinstance(value, Mapping):
+        for key, item in value.items():
+            if key not in SKIPPED_FIELDS:
+                _collect_strings(item, out)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            if isinstance(item, str):
+                out.append(item)
+            else:
+                _collect_strings(item, out)
+
+
+def knowledge_base_documents(knowledge_base: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    """One search document per record: list sections by position, keyed sections (career_paths) by key"""
+    documents = []
+    for section in knowledge_base:
+        data = knowledge_base[section]
+        if isinstance(data, dict):
+            records = [(str(key), str(key), record) for key, record in data.items()]
+        elif isinstance(data, list):
+            records = [(str(i), "", record) for i, record in enumerate(data)]
+        else:
+            continue
+        for key, title, record in records:
+            if isinstance(record, Mapping):
+                title = next((record[field] for field in TITLE_FIELDS if isinstance(record.get(field), str)), title)
+            documents.append({"id": f"{section}-{key}", "section": section, "title": title, "record": record})
+    return documents
+
+
+def _term_frequencies(document: Dict[str, Any]) -> Counter:
+    record = document["record"]
+    if isinstance(record, Mapping):
+        record = {key: value for key, value in record.items() if key not in TITLE_FIELDS}
+    # One tokenizer pass over all of the record's text; terms are match keys, so any script finds them
+    texts: List[str] = []
+    _collect_strings(record, texts)
+    frequencies = Counter(text_keys("\n".join(texts)))
+    for term in text_keys(document["title"]):
+        frequencies[term] += TITLE_WEIGHT
+    return frequencies
+
+
+class SearchIndex:
+    """BM25 inverted index over search documents.
+
+    Terms are ``transliteration.token_key`` match keys of the words, for the
+    documents and queries alike, so "श्रीनगर" finds Srinagar and "kolej"
+    finds colleges.
+
+    Terms are kept sorted with their postings stored contiguously (doc ids
+    and precomputed BM25 weights, CSR style), so a query term is one slice
+    and a prefix is one bisected range of terms. Every query word adds its
+    weights to a per-document score array; the last word also matches the
+    longer terms that any of its ``prefix_keys`` start, contributing its best
+    expansion per document, so partial input ranks sensibly while the user
+    is typing.
+    """
+
+    def __init__(self, documents: Sequence[Dict[str, Any]], k1: float = BM25_K1, b: float = BM25_B):
+        self.documents = list(documents)
+        self.sections = sorted({document["section"] for document in self.documents})
+        codes = {section: code for code, section in enumerate(self.sections)}
+        self._doc_sections = np.array([codes[document["section"]] for document in self.documents], dtype=np.int32)
+
+        term_ids: Dict[str, int] = {}
+        posting_terms: List[int] = []
+        posting_docs: List[int] = []
+        posting_counts: List[float] = []
+        lengths = np.zeros(len(self.documents))
+        for doc, document in enumerate(self.documents):
+            frequencies = _term_frequencies(document)
+            lengths[doc] = sum(frequencies.values())
+            posting_terms.extend([term_ids.setdefault(term, len(term_ids)) for term in frequencies])
+            posting_docs.extend([doc] * len(frequencies))
+            posting_counts.extend(frequencies.values())
+
+        # Renumber terms in sorted order and group postings by term
+        self.terms = sorted(term_ids)
+        rank = np.empty(len(term_ids), dtype=np.int64)
+        rank[[term_ids[term] for term in self.terms]] = np.arange(len(self.terms))
+        rows = rank[np.array(posting_terms, dtype=np.int64)]
+        order = np.argsort(rows, kind="stable")
+        rows = rows[order]
+        self._docs = np.array(posting_docs, dtype=np.int32)[order]
+        counts = np.array(posting_counts, dtype=float)[order]
+        self._doc_freq = np.bincount(rows, minlength=len(self.terms))
+        self._offsets = np.concatenate(([0], np.cumsum(self._doc_freq)))
+        self._rows = {term: row for row, term in enumerate(self.terms)}
+
+        total = len(self.documents)
+        idf = np.log1p((total - self._doc_freq + 0.5) / (self._doc_freq + 0.5))
+        average_length = lengths.mean() if total else 0.0
+        norms = k1 * (1 - b + b * lengths / average_length) if average_length else np.full(total, k1)
+        self._weights = idf[rows] * counts * (k1 + 1) / (counts + norms[self._docs])
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def _postings(self, row: int) -> Tuple[np.ndarray, np.ndarray]:
+        start, end = self._offsets[row], self._offsets[row + 1]
+        return self._docs[start:end], self._weights[start:end]
+
+    def _prefix_rows(self, prefix: str) -> np.ndarray:
+        start = bisect_left(self.terms, prefix)
+        end = bisect_left(self.terms, prefix + "\U0010ffff", start)
+        if end - start <= MAX_PREFIX_EXPANSIONS:
+            return np.arange(start, end)
+        return start + np.argpartition(-self._doc_freq[start:end], MAX_PREFIX_EXPANSIONS)[:MAX_PREFIX_EXPANSIONS]
+
+    def search(
+        self, query: str, limit: int = 10, sections: Optional[Iterable[str]] = None, prefix: bool = True
+    ) -> List[Tuple[int, float]]:
+        """Best ``limit`` (document position, score) pairs for ``query``, highest score first"""
+        tokens = tokenize(query)
+        if not tokens or not self.documents:
+            return []
+        words = [token_key(token) for token in tokens]
+
+        scores = np.zeros(len(self.documents))
+        exact = words[:-1] if prefix else words
+        for term in set(exact):
+            row = self._rows.get(term)
+            if row is not None:
+                docs, weights = self._postings(row)
+                scores[docs] += weights
+        if prefix:
+            best = np.zeros(len(self.documents))
+            rows = [self._prefix_rows(key) for key in prefix_keys(tokens[-1])]
+            for row in np.unique(np.concatenate(rows)):
+                docs, weights = self._postings(row)
+                best[docs] = np.maximum(best[docs], weights)
+            scores += best
+
+        if sections is not None:
+            codes = [self.sections.index(section) for section in set(sections) if section in self.sections]
+            scores[~np.isin(self._doc_sections, codes)] = 0.0
+
+        matches = np.flatnonzero(scores > 0)
+        if len(matches) > limit:
+            matches = matches[np.argpartition(-scores[matches], limit - 1)[:limit]]
+        matches = matches[np.lexsort((matches, -scores[matches]))]
+        return [(int(doc), float(scores[doc])) for doc in matches]
@@ -0,0 +1,157 @@
+"""
+Production server launcher for CareerPro J&K FastAPI backend
+Preloads the knowledge base once, forks workers that share it copy-on-write, and drains gracefully
+
+Run from the scripts directory: python serve.py --workers 4 --port 8000
+"""
+
+import argparse
+import gc
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+from types import FrameType
+from typing import Dict, Optional
+
+import uvicorn
+
+from structured_logging import configure_logging
+
+logger = logging.getLogger("careerpro.serve")
+
+# Respawning a worker that keeps crashing is throttled to once per this many seconds
+RESPAWN_DELAY = 1.0
+
+
+class DrainingServer(uvicorn.Server):
+    """uvicorn server that fails readiness before it stops accepting connections.
+
+    On the first SIGTERM/SIGINT the backend's ``/ready`` flips to 503 so load
+    balancers stop routing new requests; after ``drain_seconds`` uvicorn's own
+    graceful shutdown closes the listener, waits for open requests and runs
+    the shutdown handlers. A second signal skips the remaining drain period.
+    """
+
+    def __init__(self, config: uvicorn.Config, readiness: Dict[str, bool], drain_seconds: float):
+        super().__init__(config)
+        self.readiness = readiness
+        self.drain_seconds = drain_seconds
+        self._drain_timer: Optional[threading.Timer] = None
+
+    def handle_exit(self, sig: int, frame: Optional[FrameType]) -> None:
+        self.readiness["draining"] = True
+        if self._drain_timer is not None or self.drain_seconds <= 0:
+            if self._drain_timer is not None:
+                self._drain_timer.cancel()
+            super().handle_exit(sig, frame)
+            return
+        logger.info(f"Worker {os.getpid()} draining for {self.drain_seconds}s before shutdown")
+        self._drain_timer = threading.Timer(self.drain_seconds, super().handle_exit, (sig, frame))
+        self._drain_timer.daemon = True
+        self._drain_timer.start()
+
+
+def preload():
+    """Import the app and warm its caches in this process, before any worker is forked"""
+    started = time.perf_counter()
+    import fastapi_backend
+
+    fastapi_backend.warm_caches()
+    logger.info(f"Preloaded knowledge base and indexes in {time.perf_counter() - started:.2f}s")
+    return fastapi_backend
+
+
+def run_worker(backend, config: uvicorn.Config, sock: Optional[socket.socket], drain_seconds: float) -> None:
+    server = DrainingServer(config, backend.SERVER_STATE, drain_seconds)
+    server.run(sockets=[sock] if sock is not None else None)
+
+
+def supervise(backend, config: uvicorn.Config, workers: int, drain_seconds: float) -> None:
+    """Fork ``workers`` children sharing one listening socket, respawning any that die unexpectedly"""
+    sock = config.bind_socket()
+    # Objects created so far are shared with the workers; keep the collector from touching their pages
+    gc.freeze()
+
+    children: Dict[int, float] = {}
+    stopping = False
+
+    def spawn() -> None:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            code = 0
+            try:
+                run_worker(backend, config, sock, drain_seconds)
+            except BaseException:
+                logger.exception(f"Worker {os.getpid()} crashed")
+                code = 1
+            # os._exit skips atexit, so flush the log writer explicitly
+            logging.shutdown()
+            os._exit(code)
+        children[pid] = time.monotonic()
+
+    def stop(sig: int, frame: Optional[FrameType]) -> None:
+        nonlocal stopping
+        # Forward every signal so a second Ctrl+C also cuts the workers' drain short
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM if sig == signal.SIGTERM else signal.SIGINT)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for _ in range(workers):
+        spawn()
+    logger.info(f"Started {workers} workers on {config.host}:{config.port}: {sorted(children)}")
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        started = children.pop(pid, None)
+        if started is None:
+            continue
+        if not stopping:
+            logger.warning(f"Worker {pid} exited with status {status}; restarting")
+            time.sleep(max(0.0, RESPAWN_DELAY - (time.monotonic() - started)))
+            spawn()
+    sock.close()
+    logger.info("All workers stopped")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the CareerPro J&K backend")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes (default: one per CPU)")
+    parser.add_argument("--drain-seconds", type=float, default=5.0, help="time /ready reports draining before the listener closes")
+    parser.add_argument("--graceful-timeout", type=float, default=30.0, help="longest wait for open requests at shutdown")
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+
+    configure_logging(args.log_level)
+    backend = preload()
+    config = uvicorn.Config(
+        backend.app,
+        host=args.host,
+        port=args.port,
+        log_level=args.log_level,
+        # Let uvicorn's loggers propagate to the root JSON handler instead of their own stream handlers
+        log_config=None,
+        timeout_graceful_shutdown=args.graceful_timeout,
+    )
+    if args.workers <= 1:
+        run_worker(backend, config, None, args.drain_seconds)
+    else:
+        supervise(backend, config, args.workers, args.drain_seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""
+Conversation session store for CareerPro J&K chat
+Keeps recent turns and context per user with bounded memory and TTL eviction
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Iterable, Optional, Tuple
+
+# (timestamp, role, text, intent); assistant turns may store only the intent
+Turn = Tuple[float, str, Optional[str], Optional[str]]
+
+# Rough per-turn bookkeeping cost on top of the stored text
+TURN_OVERHEAD_BYTES = 120
+SESSION_OVERHEAD_BYTES = 400
+
+# Encoded size a user's stored context may reach; larger updates are refused
+MAX_CONTEXT_BYTES = 16 * 1024
+
+
+class ContextTooLarge(ValueError):
+    """A context update would take a user's stored context past the store's limit"""
+
+
+def context_entry_size(name: str, value: Any) -> int:
+    """Encoded size of one context entry"""
+    return len(name) + len(json.dumps(value, default=str)) + 4
+
+
+def turn_to_dict(turn: Turn) -> Dict[str, Any]:
+    timestamp, role, text, intent = turn
+    return {"role": role, "text": text, "intent": intent, "timestamp": timestamp}
+
+
+class _Session:
+    __slots__ = ("turns", "context", "context_sizes", "context_size", "expires_at", "size")
+
+    def __init__(self, max_turns: int):
+        self.turns: Deque[Turn] = deque(maxlen=max_turns)
+        self.context: Dict[str, Any] = {}
+        # Encoded size of each context entry, so updates only measure what they change
+        self.context_sizes: Dict[str, int] = {}
+        self.context_size = 0
+        self.expires_at = 0.0
+        self.size = SESSION_OVERHEAD_BYTES
+
+
+class InMemorySessionStore:
+    """Per-process session store: a ring buffer of turns per user, kept in LRU order.
+
+    Sessions expire ``ttl`` seconds after their last write. Expired sessions
+    sit at the cold end of the LRU, so they are dropped as new writes come in
+    without any background sweeper. On top of that, the store evicts the least
+    recently used sessions whenever it holds more than ``max_sessions`` users
+    or an estimated ``max_bytes`` of turn text and context. Turn text is cut
+    to ``max_text_length`` characters and a user's context may not grow past
+    ``max_context_bytes``, so no single user can push everyone else out.
+    Only writes count as use; reads leave a session where it is.
+    """
+
+    def __init__(
+        self,
+        max_turns: int = 20,
+        ttl: float = 1800.0,
+        max_sessions: int = 100_000,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_text_length: int = 2000,
+        max_context_bytes: int = MAX_CONTEXT_BYTES,
+    ):
+        self.max_turns = max_turns
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.max_text_length = max_text_length
+        self.max_context_bytes = max_context_bytes
+        self.size = 0
+        self.evictions = 0
+        self._sessions: "OrderedDict[str, _Session]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _get(self, user_id: str, now: float) -> Optional[_Session]:
+        session = self._sessions.get(user_id)
+        if session is not None and session.expires_at <= now:
+            self._drop(user_id)
+            return None
+        return session
+
+    def _drop(self, user_id: str) -> None:
+        session = self._sessions.pop(user_id)
+        self.size -= session.size
+
+    def _evict(self, now: float) -> None:
+        # Expired sessions first, then least recently used until within limits
+        while self._sessions:
+            user_id, session = next(iter(self._sessions.items()))
+            if session.expires_at > now and len(self._sessions) <= self.max_sessions and self.size <= self.max_bytes:
+                break
+            self._drop(user_id)
+            self.evictions += 1
+
+    def _touch(self, user_id: str, now: float) -> _Session:
+        session = self._get(user_id, now)
+        if session is None:
+            session = self._sessions[user_id] = _Session(self.max_turns)
+            self.size += session.size
+        self._sessions.move_to_end(user_id)
+        session.expires_at = now + self.ttl
+        return session
+
+    def append_turns(self, user_id: str, turns: Iterable[Tuple[str, Optional[str], Optional[str]]]) -> None:
+        """Append (role, text, intent) turns to a user's history"""
+        now = time.time()
+        with self._lock:
+            session = self._touch(user_id, now)
+            for role, text, intent in turns:
+                if text is not None:
+                    text = text[:self.max_text_length]
+                turn = (now, role, text, intent)
+                # A full ring buffer drops its oldest turn to make room
+                if len(session.turns) == session.turns.maxlen:
+                    self._resize(session, -self._turn_size(session.turns[0]))
+                session.turns.append(turn)
+                self._resize(session, self._turn_size(turn))
+            self._evict(now)
+
+    def update_context(self, user_id: str, context: Dict[str, Any]) -> None:
+        """Merge ``context`` into the user's stored context.
+
+        Raises ContextTooLarge, storing nothing, if the merged context would
+        exceed ``max_context_bytes``.
+        """
+        sizes = {name: context_entry_size(name, value) for name, value in context.items()}
+        now = time.time()
+        with self._lock:
+            session = self._get(user_id, now)
+            stored = session.context_sizes if session is not None else {}
+            merged = (session.context_size if session is not None else 0) + sum(
+                size - stored.get(name, 0) for name, size in sizes.items()
+            )
+            if merged > self.max_context_bytes:
+                raise ContextTooLarge(f"Context would take {merged} bytes, more than the {self.max_context_bytes} allowed")
+            session = self._touch(user_id, now)
+            for name, size in sizes.items():
+                self._resize(session, size - session.context_sizes.get(name, 0))
+                session.context_sizes[name] = size
+            session.context.update(context)
+            session.context_size = merged
+            self._evict(now)
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """The user's turns and context, or None if there is no live session"""
+        with self._lock:
+            session = self._get(user_id, time.time())
+            if session is None:
+                return None
+            # Reading neither renews the TTL nor reorders, so expiry order stays LRU order
+            return {"turns": [turn_to_dict(turn) for turn in session.turns], "context": dict(session.context)}
+
+    def clear(self, user_id: str) -> bool:
+        with self._lock:
+            if user_id not in self._sessions:
+                return False
+            self._drop(user_id)
+            return True
+
+    def stats(self) -> Dict[str, int]:
+        return {"sessions": len(self._sessions), "bytes": self.size, "evictions": self.evictions}
+
+    @staticmethod
+    def _turn_size(turn: Turn) -> int:
+        return TURN_OVERHEAD_BYTES + len(turn[2] or "") + len(turn[3] or "")
+
+    def _resize(self, session: _Session, delta: int) -> None:
+        """Account for ``delta`` bytes gained or freed by a session, keeping the global total exact"""
+        session.size += delta
+        self.size += delta
+
+
+class RedisSessionStore:
+    """Session store backed by Redis or any server speaking its protocol.
+
+    Each user gets a capped list of turns and a context key, both expiring
+    after ``ttl`` seconds. The global memory cap is the server's own
+    ``maxmemory`` with an LRU eviction policy (e.g. ``allkeys-lru``).
+    """
+
+    def __init__(
+        self,
+        url: str,
+        max_turns: int = 20,
+        ttl: float = 1800.0,
+        max_text_length: int = 2000,
+        max_context_bytes: int = MAX_CONTEXT_BYTES,
+        prefix: str = "careerpro:session:",
+    ):
+        import redis  # optional dependency, only needed for this backend
+
+        self.client = redis.Redis.from_url(url)
+        self.max_turns = max_turns
+        self.ttl = int(ttl)
+        self.max_text_length = max_text_length
+        self.max_context_bytes = max_context_bytes
+        self.prefix = prefix
+
+    def append_turns(self, user_id: str, turns: Iterable[Tuple[str, Optional[str], Optional[str]]]) -> None:
+        now = time.time()
+        key = self.prefix + user_id + ":turns"
+        encoded = [
+            json.dumps((now, role, text[:self.max_text_length] if text is not None else None, intent), ensure_ascii=False)
+            for role, text, intent in turns
+        ]
+        pipe = self.client.pipeline()
+        pipe.rpush(key, *encoded)
+        pipe.ltrim(key, -self.max_turns, -1)
+        pipe.expire(key, self.ttl)
+        pipe.expire(self.prefix + user_id + ":context", self.ttl)
+        pipe.execute()
+
+    def update_context(self, user_id: str, context: Dict[str, Any]) -> None:
+        """Merge ``context`` into the user's stored context, raising ContextTooLarge past ``max_context_bytes``"""
+        key = self.prefix + user_id + ":context"
+        encoded = {name: json.dumps(value, default=str) for name, value in context.items()}
+        # Entries being replaced are measured server-side, so only the rest of the hash is counted
+        stored = self.client.hgetall(key)
+        merged = sum(len(name) + len(value) + 4 for name, value in encoded.items()) + sum(
+            len(name) + len(value) + 4 for name, value in stored.items() if name.decode() not in encoded
+        )
+        if merged > self.max_context_bytes:
+            raise ContextTooLarge(f"Context would take {merged} bytes, more than the {self.max_context_bytes} allowed")
+        pipe = self.client.pipeline()
+        pipe.hset(key, mapping=encoded)
+        pipe.expire(key, self.ttl)
+        pipe.expire(self.prefix + user_id + ":turns", self.ttl)
+        pipe.execute()
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        pipe = self.client.pipeline()
+        pipe.lrange(self.prefix + user_id + ":turns", 0, -1)
+        pipe.hgetall(self.prefix + user_id + ":context")
+        turns, context = pipe.execute()
+        if not turns and not context:
+            return None
+        return {
+            "turns": [turn_to_dict(tuple(json.loads(turn))) for turn in turns],
+            "context": {name.decode(): json.loads(value) for name, value in context.items()},
+        }
+
+    def clear(self, user_id: str) -> bool:
+        return bool(self.client.delete(self.prefix + user_id + ":turns", self.prefix + user_id + ":context"))
+
+    def stats(self) -> Dict[str, int]:
+        return {"bytes": int(self.client.info("memory").get("used_memory", 0))}
+
+
+def session_store_from_env():
+    """Build the session store selected by CAREERPRO_SESSION_BACKEND (memory or redis)"""
+    max_turns = int(os.environ.get("CAREERPRO_SESSION_MAX_TURNS", "20"))
+    ttl = float(os.environ.get("CAREERPRO_SESSION_TTL", "1800"))
+    max_context_bytes = int(os.environ.get("CAREERPRO_SESSION_MAX_CONTEXT_BYTES", str(MAX_CONTEXT_BYTES)))
+    if os.environ.get("CAREERPRO_SESSION_BACKEND", "memory") == "redis":
+        url = os.environ.get("CAREERPRO_REDIS_URL", "redis://localhost:6379/0")
+        return RedisSessionStore(url, max_turns=max_turns, ttl=ttl, max_context_bytes=max_context_bytes)
+    return InMemorySessionStore(
+        max_turns=max_turns,
+        ttl=ttl,
+        max_context_bytes=max_context_bytes,
+        max_sessions=int(os.environ.get("CAREERPRO_SESSION_MAX_SESSIONS", "100000")),
+        max_bytes=int(os.environ.get("CAREERPRO_SESSION_MAX_BYTES", str(64 * 1024 * 1024))),
+    )
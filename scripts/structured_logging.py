@@ -0,0 +1,193 @@
+"""
+Non-blocking structured logging for CareerPro J&K backend
+Log calls only enqueue records; a background thread formats them as JSON lines and writes in batches
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import IO, Dict, List, Optional
+
+# Attributes every LogRecord has (plus uvicorn's ANSI-coloured duplicate of the message);
+# anything else was passed through ``extra=`` and is logged as a field
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName", "color_message"}
+
+# Records written per batch, and the longest a record waits for its batch to fill
+BATCH_SIZE = 256
+FLUSH_INTERVAL = 0.2
+
+DROP_POLICIES = ("newest", "oldest")
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: timestamp, level, logger, message, extra fields and traceback"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "pid": record.process,
+        }
+        for name, value in vars(record).items():
+            if name not in _RECORD_ATTRIBUTES:
+                entry[name] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of records per level; levels without a rate are always kept"""
+
+    def __init__(self, rates: Dict[int, float]):
+        super().__init__()
+        self.rates = rates
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = self.rates.get(record.levelno)
+        return rate is None or random.random() < rate
+
+
+class AsyncBatchingHandler(logging.Handler):
+    """Handler that never blocks the caller.
+
+    ``emit`` puts the raw record on a bounded queue and returns; formatting
+    and I/O happen on a writer thread that drains the queue in batches and
+    writes each batch with a single call. When the queue is full the record
+    is discarded (``drop="newest"``) or the oldest queued record is evicted
+    to make room (``drop="oldest"``), and ``dropped`` counts the losses.
+    The writer is restarted in forked children, whose copy of the parent's
+    thread would otherwise never run.
+    """
+
+    def __init__(
+        self,
+        stream: IO[str],
+        max_queue: int = 10_000,
+        drop: str = "newest",
+        batch_size: int = BATCH_SIZE,
+        flush_interval: float = FLUSH_INTERVAL,
+    ):
+        super().__init__()
+        if drop not in DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy: {drop}")
+        self.stream = stream
+        self.max_queue = max_queue
+        self.drop = drop
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.written = 0
+        self._start()
+        os.register_at_fork(after_in_child=self._start)
+        atexit.register(self.close)
+
+    def _start(self) -> None:
+        self._queue: "queue.Queue[Optional[logging.LogRecord]]" = queue.Queue(self.max_queue)
+        self._writer = threading.Thread(target=self._run, name="careerpro-log-writer", daemon=True)
+        self._writer.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            if self.drop == "oldest":
+                try:
+                    self._queue.get_nowait()
+                    self._queue.put_nowait(record)
+                except (queue.Empty, queue.Full):
+                    pass
+            self.dropped += 1
+
+    def _run(self) -> None:
+        records = self._queue
+        while True:
+            record = records.get()
+            if record is None:
+                return
+            batch: List[logging.LogRecord] = [record]
+            deadline = time.monotonic() + self.flush_interval
+            closing = False
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                try:
+                    record = records.get(timeout=timeout) if timeout > 0 else records.get_nowait()
+                except queue.Empty:
+                    break
+                if record is None:
+                    closing = True
+                    break
+                batch.append(record)
+            self._write(batch)
+            if closing:
+                return
+
+    def _write(self, batch: List[logging.LogRecord]) -> None:
+        lines = []
+        for record in batch:
+            try:
+                lines.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+        try:
+            self.stream.write("\n".join(lines) + "\n")
+            self.stream.flush()
+            self.written += len(lines)
+        except Exception:
+            self.dropped += len(lines)
+
+    def close(self) -> None:
+        """Write out everything queued so far and stop the writer"""
+        if self._writer.is_alive():
+            # Wait for room rather than dropping the sentinel, so no queued record is lost
+            self._queue.put(None)
+            self._writer.join(timeout=5)
+        super().close()
+
+
+def parse_sample_rates(spec: str) -> Dict[int, float]:
+    """Parse "DEBUG=0.01,INFO=0.1" into {level number: fraction kept}"""
+    rates = {}
+    for part in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, rate = part.partition("=")
+        level = logging.getLevelName(name.strip().upper())
+        if not isinstance(level, int):
+            raise ValueError(f"Unknown log level: {name}")
+        rates[level] = float(rate)
+    return rates
+
+
+def configure_logging(level: Optional[str] = None) -> AsyncBatchingHandler:
+    """Route the root logger through an AsyncBatchingHandler configured from CAREERPRO_LOG_* variables"""
+    root = logging.getLogger()
+    for existing in root.handlers:
+        if isinstance(existing, AsyncBatchingHandler):
+            if level:
+                root.setLevel(level.upper())
+            return existing
+
+    path = os.environ.get("CAREERPRO_LOG_FILE")
+    handler = AsyncBatchingHandler(
+        open(path, "a", encoding="utf-8") if path else sys.stderr,
+        max_queue=int(os.environ.get("CAREERPRO_LOG_QUEUE_SIZE", "10000")),
+        drop=os.environ.get("CAREERPRO_LOG_DROP", "newest"),
+    )
+    handler.setFormatter(JsonFormatter())
+    rates = parse_sample_rates(os.environ.get("CAREERPRO_LOG_SAMPLE", ""))
+    if rates:
+        handler.addFilter(SamplingFilter(rates))
+
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel((level or os.environ.get("CAREERPRO_LOG_LEVEL", "INFO")).upper())
+    return handler
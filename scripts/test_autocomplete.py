@@ -0,0 +1,65 @@
+"""
+Tests for the CareerPro J&K typeahead index and GET /autocomplete
+Word-start completion, ranking and completion in either script from Devanagari or Romanized Hindi prefixes
+"""
+
+import pytest
+
+from autocomplete import PrefixIndex, lookup_keys
+
+
+@pytest.fixture(scope="module")
+def prefix_index():
+    return PrefixIndex([
+        ("Government Medical College, Srinagar", "college"),
+        ("Medical Merit Scholarship", "scholarship"),
+        ("MBBS", "course"),
+        ("MBBS", "course"),
+        ("Mechanical Engineering", "course"),
+        ("उपलब्ध छात्रवृत्तियां", "suggestion"),
+        ("जम्मू-कश्मीर के इंजीनियरिंग कॉलेज", "suggestion"),
+    ])
+
+
+def test_completes_any_word_start_best_first(prefix_index):
+    assert prefix_index.complete("med") == [("Medical Merit Scholarship", "scholarship"), ("Government Medical College, Srinagar", "college")]
+    assert prefix_index.complete("m", kinds=("course",)) == [("MBBS", "course"), ("Mechanical Engineering", "course")]
+    assert prefix_index.complete("  ") == []
+
+
+@pytest.mark.parametrize("typed", ["छात्रवृ", "छात्रवृत्ति", "chhatravr", "chatravriti"])
+def test_devanagari_and_romanized_prefixes_complete_hindi_entries(prefix_index, typed):
+    assert prefix_index.complete(typed) == [("उपलब्ध छात्रवृत्तियां", "suggestion")]
+
+
+@pytest.mark.parametrize("typed", ["कॉलेज", "kolej", "colle"])
+def test_either_script_completes_the_other(prefix_index, typed):
+    assert ("Government Medical College, Srinagar", "college") in prefix_index.complete(typed)
+    assert ("जम्मू-कश्मीर के इंजीनियरिंग कॉलेज", "suggestion") in prefix_index.complete(typed)
+
+
+def test_partly_typed_last_word_tries_every_key_it_can_grow_into(prefix_index):
+    # "eng" keys to "eng" but "engineering" to "enjiniring"
+    assert lookup_keys("mechanical eng") == ["mecanikal eng", "mecanikal enj"]
+    assert prefix_index.complete("mechanical eng") == [("Mechanical Engineering", "course")]
+    assert ("जम्मू-कश्मीर के इंजीनियरिंग कॉलेज", "suggestion") in prefix_index.complete("इंजी")
+
+
+@pytest.mark.parametrize("q", ["कॉलेज", "छात्रवृत्ति", "chhatravr", "kolej"])
+def test_endpoint_completes_hindi_prefixes(client, q):
+    response = client.get("/autocomplete", params={"q": q})
+    assert response.status_code == 200
+    completions = response.json()
+    assert completions
+    assert all(completion["type"] in {"college", "course", "district", "scholarship", "exam", "suggestion"} for completion in completions)
+
+
+def test_endpoint_offers_phrases_in_both_languages(client):
+    texts = [completion["text"] for completion in client.get("/autocomplete", params={"q": "छात्रवृत्ति", "limit": 50}).json()]
+    assert "उपलब्ध छात्रवृत्तियां" in texts
+    english = [completion["text"] for completion in client.get("/autocomplete", params={"q": "schol", "limit": 50}).json()]
+    assert "Merit-based scholarships" in english
+
+
+def test_endpoint_rejects_unknown_types(client):
+    assert client.get("/autocomplete", params={"q": "med", "type": "planet"}).status_code == 400
@@ -0,0 +1,72 @@
+"""
+Tests for CareerPro J&K POST /recommendations/batch
+NDJSON framing of the streamed results, per-line errors and the body and cohort caps
+"""
+
+import json
+
+import pytest
+
+import fastapi_backend as backend
+
+PROFILES = [
+    {"user_id": "a", "interests": ["technology"], "skills": ["programming"]},
+    {"user_id": "b", "interests": ["healthcare"], "skills": []},
+    {"user_id": "c", "interests": ["teaching"], "skills": ["communication"]},
+]
+
+
+def _lines(response):
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.text.endswith("\n")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_json_array_gets_one_line_per_profile_in_order(client):
+    response = client.post("/recommendations/batch", params={"top_k": 2}, json=PROFILES)
+    assert response.status_code == 200
+    lines = _lines(response)
+    assert [(line["index"], line["user_id"]) for line in lines] == [(0, "a"), (1, "b"), (2, "c")]
+    for line, profile in zip(lines, PROFILES):
+        single = client.post("/recommendations", json={**profile, "top_k": 2}).json()["recommendations"]
+        assert line["recommendations"] == single
+
+
+def test_ndjson_lines_fail_one_at_a_time(client):
+    body = "\n".join([json.dumps(PROFILES[0]), "{not json", "", "[1, 2]", json.dumps(PROFILES[1])]) + "\n"
+    response = client.post(
+        "/recommendations/batch", content=body.encode(), headers={"Content-Type": "application/x-ndjson"}
+    )
+    assert response.status_code == 200
+    lines = _lines(response)
+    assert [line["index"] for line in lines] == [0, 1, 2, 3]
+    assert "recommendations" in lines[0] and "recommendations" in lines[3]
+    assert lines[1]["error"].startswith("Invalid JSON")
+    assert lines[2] == {"index": 2, "user_id": None, "error": "Each profile must be a JSON object"}
+
+
+def test_cohorts_larger_than_a_batch_stream_in_order(client, monkeypatch):
+    monkeypatch.setattr(backend, "RECOMMENDATION_BATCH_SIZE", 2)
+    cohort = [{**PROFILES[number % 3], "user_id": str(number)} for number in range(7)]
+    lines = _lines(client.post("/recommendations/batch", json=cohort))
+    assert [line["user_id"] for line in lines] == [str(number) for number in range(7)]
+    assert [line["index"] for line in lines] == list(range(7))
+
+
+def test_empty_cohort(client):
+    response = client.post("/recommendations/batch", json=[])
+    assert response.status_code == 200
+    assert response.content == b""
+
+
+@pytest.mark.parametrize("body", [b"{not json", b'{"profiles": []}'])
+def test_body_must_be_an_array(client, body):
+    response = client.post("/recommendations/batch", content=body, headers={"Content-Type": "application/json"})
+    assert response.status_code == 400
+
+
+def test_caps(client, monkeypatch):
+    monkeypatch.setattr(backend, "MAX_BATCH_PROFILES", 2)
+    assert client.post("/recommendations/batch", json=PROFILES).status_code == 413
+    monkeypatch.setattr(backend, "MAX_BATCH_BODY_BYTES", 64)
+    assert client.post("/recommendations/batch", json=PROFILES[:1] * 2).status_code == 413
@@ -0,0 +1,67 @@
+"""
+Tests for CareerPro J&K streaming chat
+Server-Sent Events and WebSocket frames arrive in the same order as /chat's fields and end with `done`
+"""
+
+import json
+from datetime import datetime
+
+import fastapi_backend as backend
+
+EVENTS = ["response", "suggestions", "resources", "done"]
+
+
+def _sse_events(response):
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = []
+    for block in response.text.split("\n\n"):
+        if block:
+            event, data = block.split("\n")
+            assert event.startswith("event: ") and data.startswith("data: ")
+            events.append((event[len("event: "):], json.loads(data[len("data: "):])))
+    return events
+
+
+def _check_matches_chat(client, events, message, language="english"):
+    assert [event for event, _ in events] == EVENTS
+    merged = {key: value for _, data in events for key, value in data.items()}
+    whole = client.post("/chat", json={"message": message, "user_id": "whole", "language": language}).json()
+    assert {key: merged[key] for key in ("response", "suggestions", "resources")} == {
+        key: whole[key] for key in ("response", "suggestions", "resources")
+    }
+    datetime.fromisoformat(events[-1][1]["timestamp"])
+
+
+def test_sse_post(client):
+    response = client.post("/chat/stream", json={"message": "Tell me about colleges", "user_id": "sse-post"})
+    assert response.status_code == 200
+    events = _sse_events(response)
+    _check_matches_chat(client, events, "Tell me about colleges")
+    assert events[0][1]["response"] == backend.CHAT_RESPONSES["english"]["college_info"]
+
+
+def test_sse_get_in_hindi(client):
+    params = {"message": "छात्रवृत्ति", "user_id": "sse-get", "language": "hindi"}
+    events = _sse_events(client.get("/chat/stream", params=params))
+    _check_matches_chat(client, events, "छात्रवृत्ति", language="hindi")
+    assert events[0][1]["response"] == backend.CHAT_RESPONSES["hindi"]["scholarship_info"]
+
+
+def test_websocket_answers_each_message_in_order(client):
+    with client.websocket_connect("/chat/ws") as websocket:
+        for message in ["hello", "entrance exam dates"]:
+            websocket.send_text(json.dumps({"message": message, "user_id": "ws"}))
+            events = [json.loads(websocket.receive_text()) for _ in EVENTS]
+            _check_matches_chat(client, [(frame["event"], frame["data"]) for frame in events], message)
+
+
+def test_websocket_reports_invalid_messages_and_keeps_going(client):
+    with client.websocket_connect("/chat/ws") as websocket:
+        websocket.send_text(json.dumps({"message": "hello"}))
+        error = json.loads(websocket.receive_text())
+        assert error["event"] == "error"
+        assert error["data"]["detail"][0]["loc"] == ["user_id"]
+
+        websocket.send_text(json.dumps({"message": "hello", "user_id": "ws-retry"}))
+        frames = [json.loads(websocket.receive_text()) for _ in EVENTS]
+        assert [frame["event"] for frame in frames] == EVENTS
@@ -0,0 +1,133 @@
+"""
+Tests for the CareerPro J&K college index and GET /colleges
+Filters and sorts are checked against a scan of the same catalog; cursor pages must add up to the full list
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from college_index import CollegeIndex, decode_cursor, encode_cursor
+
+DISTRICTS = ["Srinagar", "Jammu", "Baramulla", "Anantnag"]
+COURSES = ["B.Tech CSE", "B.Sc.", "MBBS", "B.Com", "B.A."]
+FEES = ["₹8,000 - ₹15,000 per year", "₹45,000 per year", "Free", None]
+
+
+@pytest.fixture(scope="module")
+def colleges():
+    rng = random.Random(7)
+    return [
+        {
+            "name": f"College {row}",
+            "district": rng.choice(DISTRICTS),
+            "courses": rng.sample(COURSES, 2),
+            "rating": rng.choice([None, 3.5, 4.0, 4.2, 4.5]),
+            "fees": rng.choice(FEES),
+        }
+        for row in range(300)
+    ]
+
+
+@pytest.fixture(scope="module")
+def college_index(colleges):
+    return CollegeIndex(colleges)
+
+
+def _pages(index, rows, sort, limit):
+    names, cursor = [], None
+    while True:
+        page, cursor = index.page(rows, limit=limit, cursor=cursor, sort=sort)
+        names.extend(college["name"] for college in page)
+        if cursor is None:
+            return names
+
+
+def test_filters_match_a_scan(colleges, college_index):
+    rows = college_index.query(district="Srinagar", course="b.tech", min_rating=4.0, max_fee=20000)
+    expected = [
+        row for row, college in enumerate(colleges)
+        if college["district"] == "Srinagar"
+        and "B.Tech CSE" in college["courses"]
+        and college["rating"] is not None and college["rating"] >= 4.0
+        and college_index.fees.low[row] <= 20000
+    ]
+    assert rows == expected
+
+
+def test_no_filters_returns_catalog_order(colleges, college_index):
+    assert college_index.query() == list(range(len(colleges)))
+
+
+def test_district_in_devanagari_and_misspelt(college_index):
+    srinagar = college_index.query(district="Srinagar")
+    assert srinagar
+    assert college_index.query(district="श्रीनगर") == srinagar
+    assert college_index.query(district="Srinagr") == srinagar
+
+
+@pytest.mark.parametrize("sort", ["fee", "-fee", "rating", "-rating"])
+def test_sort_puts_missing_values_last(college_index, sort):
+    rows = college_index.query(sort=sort)
+    values = (college_index.fees.low if "fee" in sort else college_index.ratings)[rows]
+    present = values[~np.isnan(values)]
+    assert np.isnan(values[len(present):]).all()
+    assert list(present) == sorted(present, reverse=sort.startswith("-"))
+
+
+def test_unknown_sort(college_index):
+    with pytest.raises(ValueError, match="Unknown sort"):
+        college_index.query(sort="name")
+
+
+@pytest.mark.parametrize("sort", [None, "fee", "-fee", "rating", "-rating"])
+def test_cursor_pages_cover_every_row_once(colleges, college_index, sort):
+    rows = college_index.query(max_fee=50000, sort=sort)
+    assert _pages(college_index, rows, sort, limit=7) == [colleges[row]["name"] for row in rows]
+
+
+def test_offset_and_limit(colleges, college_index):
+    page, cursor = college_index.page(college_index.query(), limit=5, offset=10)
+    assert [college["name"] for college in page] == [college["name"] for college in colleges[10:15]]
+    assert decode_cursor(cursor) == 14
+
+
+def test_cursor_round_trip_and_rejection(college_index):
+    assert decode_cursor(encode_cursor(123)) == 123
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor("not a cursor!")
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        college_index.page(college_index.query(sort="fee"), cursor=encode_cursor(10**6), sort="fee")
+
+
+def _names(response):
+    return [college["name"] for college in response.json()]
+
+
+@pytest.mark.parametrize("sort", [None, "fee", "-fee", "rating", "-rating"])
+def test_endpoint_cursor_pages_add_up_to_the_full_list(client, sort):
+    params = {"sort": sort} if sort else {}
+    everything = client.get("/colleges", params=params)
+    assert everything.status_code == 200
+
+    names, cursor = [], None
+    while True:
+        page = client.get("/colleges", params={**params, "limit": 1, **({"cursor": cursor} if cursor else {})})
+        assert page.status_code == 200
+        assert page.headers["X-Total-Count"] == str(len(everything.json()))
+        names.extend(_names(page))
+        cursor = page.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    assert names == _names(everything)
+
+
+def test_endpoint_sort_order(client):
+    ratings = [college["rating"] for college in client.get("/colleges", params={"sort": "-rating"}).json()]
+    assert ratings == sorted(ratings, reverse=True)
+
+
+@pytest.mark.parametrize("params", [{"sort": "name"}, {"cursor": "%%%"}, {"cursor": "OTk5OTk", "sort": "fee"}])
+def test_endpoint_rejects_bad_sort_or_cursor(client, params):
+    assert client.get("/colleges", params=params).status_code == 400
@@ -186,6 +186,8 @@ def main():
     print("   python scripts/fastapi_backend.py")
     print("\n📚 API Documentation available at:")
     print("   http://localhost:8000/docs")
+    print("\n⏱️  For throughput and latency numbers, run the load test:")
+    print("   python scripts/load_test.py --base-url http://localhost:8000")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,60 @@
+"""
+Tests for the CareerPro J&K geo index and GET /colleges/nearby
+Nearest and radius queries are checked against a haversine scan of the same points
+"""
+
+import math
+import random
+
+import pytest
+
+from geo_index import EARTH_RADIUS_KM, GeoIndex
+
+
+def _haversine_km(lat1, lng1, lat2, lng2):
+    lat1, lng1, lat2, lng2 = map(math.radians, (lat1, lng1, lat2, lng2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+@pytest.fixture(scope="module")
+def points():
+    rng = random.Random(3)
+    return [(row * 2, rng.uniform(-80, 80), rng.uniform(-180, 180)) for row in range(500)]
+
+
+def test_nearest_matches_a_scan(points):
+    index = GeoIndex(points)
+    for lat, lng in [(34.08, 74.8), (0.0, 179.9), (-45.0, -170.0)]:
+        expected = sorted(points, key=lambda point: _haversine_km(lat, lng, point[1], point[2]))[:5]
+        found = index.nearest(lat, lng, 5)
+        assert [row for row, _ in found] == [row for row, _, _ in expected]
+        for (_, km), (_, plat, plng) in zip(found, expected):
+            assert km == pytest.approx(_haversine_km(lat, lng, plat, plng), rel=1e-6)
+
+
+def test_within_and_allowed_rows(points):
+    index = GeoIndex(points)
+    allowed = {row for row, _, _ in points[::3]}
+    found = index.within(10.0, 20.0, 3000, allowed=allowed)
+    expected = {row for row, lat, lng in points if row in allowed and _haversine_km(10.0, 20.0, lat, lng) <= 3000}
+    assert {row for row, _ in found} == expected
+    assert [km for _, km in found] == sorted(km for _, km in found)
+
+
+def test_empty():
+    assert GeoIndex([]).nearest(0, 0, 3) == []
+    assert GeoIndex([]).within(0, 0, 10) == []
+
+
+def test_endpoint_nearest_first(client):
+    response = client.get("/colleges/nearby", params={"lat": 34.08, "lng": 74.8, "k": 3})
+    assert response.status_code == 200
+    colleges = response.json()
+    assert 1 <= len(colleges) <= 3
+    assert [college["distance"] for college in colleges] == sorted(college["distance"] for college in colleges)
+
+
+@pytest.mark.parametrize("params", [{"lat": 91, "lng": 0}, {"lat": 0, "lng": 0, "k": 0}, {"lat": 0, "lng": 0, "radius_km": 0}])
+def test_endpoint_rejects_out_of_range_parameters(client, params):
+    assert client.get("/colleges/nearby", params=params).status_code == 422
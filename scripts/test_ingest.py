@@ -0,0 +1,129 @@
+"""
+Tests for CareerPro J&K catalog ingestion and POST /admin/ingest
+Row validation, error reporting and upserts into the dict and SQLite knowledge-base sources
+"""
+
+import io
+import json
+
+import pytest
+
+import fastapi_backend as backend
+from catalog_models import JKScholarship
+from ingest import dedupe_key, ingest, read_rows
+from knowledge_base import DictSource, SQLiteSource, write_sqlite
+
+EXISTING = {
+    "name": "Merit Scholarship",
+    "eligibility": "12th pass",
+    "amount": "₹10,000",
+    "deadline": "March 2025",
+    "website": "https://merit.example",
+}
+
+CSV = """name,eligibility,amount,deadline,website,courses
+Merit  scholarship!,Graduates,"₹12,000",April 2025,https://merit.example,B.A.; B.Sc. ;
+Girls Scholarship,12th pass,"₹5,000","January 15, 2025",https://girls.example,
+Bad Date,12th pass,"₹1",someday,https://bad.example,
+Girls Scholarship,12th pass,"₹6,000","January 20, 2025",https://girls.example,
+,12th pass,"₹1",May 2025,https://blank.example,
+"""
+
+
+@pytest.fixture(params=["dict", "sqlite"])
+def source(request, tmp_path):
+    data = {"scholarships": [dict(EXISTING)]}
+    if request.param == "dict":
+        return DictSource(data)
+    path = str(tmp_path / "kb.db")
+    write_sqlite(path, data)
+    return SQLiteSource(path)
+
+
+def test_dedupe_key_ignores_case_and_punctuation():
+    assert dedupe_key({"name": "Merit  Scholarship!"}) == dedupe_key({"name": "merit scholarship"})
+
+
+def test_csv_rows_are_validated_and_upserted(source):
+    rows = read_rows(io.StringIO(CSV), "csv", JKScholarship)
+    report = ingest(source, "scholarships", rows, chunk_size=2)
+
+    assert report["rows"] == 5
+    assert report["invalid"] == 2
+    assert report["duplicates"] == 1
+    assert (report["inserted"], report["updated"]) == (1, 1)
+    assert [error["line"] for error in report["errors"]] == [4, 6]
+    assert "deadline" in report["errors"][0]["error"]
+
+    records = source.load_section("scholarships")
+    assert [record["name"] for record in records] == ["Merit  scholarship!", "Girls Scholarship"]
+    assert records[0]["courses"] == ["B.A.", "B.Sc."]
+    # A name repeated in the file keeps its last row
+    assert records[1]["deadline"] == "January 20, 2025"
+
+
+def test_ndjson_rows(source):
+    lines = "\n".join([json.dumps({**EXISTING, "name": "New Scholarship"}), "", "{not json", json.dumps({"name": "x"})])
+    report = ingest(source, "scholarships", read_rows(io.StringIO(lines), "ndjson", JKScholarship))
+    assert (report["rows"], report["inserted"], report["invalid"]) == (3, 1, 2)
+    assert [error["line"] for error in report["errors"]] == [3, 4]
+    assert len(source.load_section("scholarships")) == 2
+
+
+def test_nothing_is_written_when_ingestion_fails(source):
+    def rows():
+        yield 1, {**EXISTING, "name": "Written First"}
+        raise OSError("upload interrupted")
+
+    with pytest.raises(OSError):
+        ingest(source, "scholarships", rows(), chunk_size=1)
+    assert [record["name"] for record in source.load_section("scholarships")] == ["Merit Scholarship"]
+
+
+def test_unknown_section_and_format(source):
+    with pytest.raises(ValueError, match="Unknown section"):
+        ingest(source, "careers", [])
+    with pytest.raises(ValueError, match="Unknown format"):
+        read_rows(io.StringIO(""), "xml", JKScholarship)
+
+
+UPLOAD = (
+    "name,eligibility,amount,deadline,website\n"
+    "Test Ingest Scholarship,12th pass,\"₹1,000\",May 2025,https://ingest.example\n"
+    "Bad Row,12th pass,\"₹1\",someday,https://bad.example\n"
+)
+
+
+def _upload(client, headers=None, **params):
+    return client.post("/admin/ingest", params={"section": "scholarships", **params}, content=UPLOAD, headers=headers)
+
+
+def test_endpoint_hidden_without_a_configured_token(client, monkeypatch):
+    monkeypatch.setattr(backend, "ADMIN_TOKEN", None)
+    assert _upload(client).status_code == 404
+
+
+def test_endpoint_needs_the_admin_token(client, admin_headers):
+    assert _upload(client).status_code == 401
+    response = _upload(client, headers={"Authorization": "Bearer nope"})
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+
+
+def test_endpoint_refuses_the_built_in_data(client, admin_headers):
+    assert _upload(client, headers=admin_headers).status_code == 409
+
+
+@pytest.mark.parametrize("params", [{"section": "careers"}, {"format": "xml"}])
+def test_endpoint_unknown_section_or_format(client, admin_headers, sqlite_knowledge_base, params):
+    assert _upload(client, headers=admin_headers, **params).status_code == 400
+
+
+def test_endpoint_valid_rows_land_and_invalid_ones_are_reported(client, admin_headers, sqlite_knowledge_base):
+    response = _upload(client, headers=admin_headers)
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["inserted"], report["invalid"]) == (1, 1)
+    assert report["errors"][0]["line"] == 3
+    names = [scholarship["name"] for scholarship in client.get("/scholarships").json()]
+    assert "Test Ingest Scholarship" in names
@@ -0,0 +1,178 @@
+"""
+Tests for the CareerPro J&K deadline notification scheduler
+Audience matching against a scan, reminders due per day, resuming a failed run without re-sending, and the state file
+"""
+
+import io
+import json
+import random
+from datetime import date
+
+import pytest
+
+from notification_scheduler import (
+    FileSink,
+    MemorySink,
+    NotificationScheduler,
+    SubscriberIndex,
+    load_sent,
+    save_sent,
+)
+from timeline_index import TimelineIndex, timeline_events
+
+DISTRICTS = ["Srinagar", "Jammu", "Baramulla", "Anantnag"]
+COURSES = ["B.Tech CSE", "B.Sc.", "MBBS", "B.Com", "B.A."]
+
+KNOWLEDGE_BASE = {
+    "scholarships": [
+        {"name": "J&K Merit Scholarship", "eligibility": "12th pass", "deadline": "January 15, 2025", "website": "https://merit.example"},
+        {"name": "Chief Minister's Scholarship", "deadline": "February 28, 2025"},
+    ],
+    "entrance_exams": [
+        {"name": "NEET", "for": "Medical Admissions", "registration_deadline": "January 11, 2025", "exam_date": "May 2025"},
+    ],
+}
+
+# Seven days before the merit scholarship's deadline and three before NEET registration closes
+TODAY = date(2025, 1, 8)
+
+
+class FailingSink(MemorySink):
+    """Accept ``limit`` batches, then fail like a push service going down"""
+
+    def __init__(self, limit):
+        super().__init__()
+        self.limit = limit
+
+    def send(self, notification, user_ids):
+        if len(self.batches) == self.limit:
+            raise ConnectionError("sink unavailable")
+        super().send(notification, user_ids)
+
+
+@pytest.fixture
+def subscribers():
+    subscribers = SubscriberIndex()
+    for number in range(10):
+        subscribers.subscribe(f"user{number}")
+    subscribers.subscribe("exams-only", types=["exam"])
+    return subscribers
+
+
+def _scheduler(subscribers, sink, **options):
+    return NotificationScheduler(TimelineIndex(timeline_events(KNOWLEDGE_BASE)), subscribers, sink, batch_size=4, **options)
+
+
+def _recipients(sink):
+    return [(notification["id"], user_id) for notification, user_ids in sink.batches for user_id in user_ids]
+
+
+def test_subscriber_match_matches_a_scan():
+    rng = random.Random(11)
+    index = SubscriberIndex()
+    preferences = {}
+    for number in range(300):
+        user = f"user{number}"
+        preferences[user] = (
+            rng.sample(["exam", "scholarship"], rng.randrange(3)),
+            rng.sample(DISTRICTS, rng.randrange(3)),
+            rng.sample(COURSES, rng.randrange(3)),
+        )
+        index.subscribe(user, *preferences[user])
+    index.unsubscribe("user0")
+    del preferences["user0"]
+
+    def wants(wanted, values):
+        return not wanted or any(value.casefold() in {item.casefold() for item in wanted} for value in values)
+
+    for kind, district, courses in [("exam", "Jammu", ["MBBS"]), ("scholarship", None, []), ("exam", "Srinagar", ["B.Sc.", "B.A."])]:
+        expected = {
+            user for user, (types, districts, wanted_courses) in preferences.items()
+            if wants(types, [kind]) and (district is None or wants(districts, [district]))
+            and (not courses or wants(wanted_courses, courses))
+        }
+        assert {index.user_ids[row] for row in index.match(kind, district, courses)} == expected
+
+
+def test_event_ids_follow_names_not_positions():
+    ids = {event["id"] for event in timeline_events(KNOWLEDGE_BASE)}
+    reordered = {**KNOWLEDGE_BASE, "scholarships": KNOWLEDGE_BASE["scholarships"][::-1]}
+    assert {event["id"] for event in timeline_events(reordered)} == ids
+    assert "scholarship-j-k-merit-scholarship" in ids
+    assert "exam-neet-registration" in ids
+
+
+def test_tick_sends_due_reminders_in_batches(subscribers):
+    sink = MemorySink()
+    scheduler = _scheduler(subscribers, sink)
+    assert scheduler.tick(TODAY) == {"events": 2, "notifications": 21, "batches": 6}
+
+    recipients = _recipients(sink)
+    merit = [user for tag, user in recipients if tag == "scholarship-j-k-merit-scholarship-7days"]
+    neet = [user for tag, user in recipients if tag == "exam-neet-registration-3days"]
+    assert sorted(merit) == sorted(f"user{number}" for number in range(10))
+    assert "exams-only" in neet and len(neet) == 11
+    assert all(len(user_ids) <= 4 for _, user_ids in sink.batches)
+    assert scheduler.sent == {
+        "scholarship-j-k-merit-scholarship-7days": "2025-01-15",
+        "exam-neet-registration-3days": "2025-01-11",
+    }
+    assert scheduler.delivered == {}
+
+    # A second run the same day finds nothing left to send
+    assert scheduler.tick(TODAY) == {"events": 0, "notifications": 0, "batches": 0}
+    assert len(sink.batches) == 6
+
+
+def test_nothing_due_between_reminder_days(subscribers):
+    sink = MemorySink()
+    assert _scheduler(subscribers, sink).tick(date(2025, 1, 9)) == {"events": 0, "notifications": 0, "batches": 0}
+
+
+def test_failed_run_resumes_with_only_the_users_it_missed(subscribers, tmp_path):
+    failing = FailingSink(limit=4)
+    scheduler = _scheduler(subscribers, failing)
+    with pytest.raises(ConnectionError):
+        scheduler.tick(TODAY)
+    state = str(tmp_path / "sent.json")
+    save_sent(state, scheduler.sent, scheduler.delivered)
+
+    sink = MemorySink()
+    sent, delivered = load_sent(state, TODAY)
+    assert sent.keys() == scheduler.sent.keys()
+    resumed = _scheduler(subscribers, sink, sent=sent, delivered=delivered)
+    resumed.tick(TODAY)
+
+    first, second = _recipients(failing), _recipients(sink)
+    assert not set(first) & set(second)
+    everyone = MemorySink()
+    _scheduler(subscribers, everyone).tick(TODAY)
+    assert sorted(first + second) == sorted(_recipients(everyone))
+    assert resumed.delivered == {}
+
+
+def test_state_file_round_trip_and_pruning(tmp_path):
+    path = str(tmp_path / "sent.json")
+    assert load_sent(path, TODAY) == ({}, {})
+    save_sent(path, {"old-7days": "2024-12-31", "new-7days": "2025-01-15", "half-3days": "2025-01-11"}, {"half-3days": {"b", "a"}})
+    assert json.loads(open(path, encoding="utf-8").read())["delivered"] == {"half-3days": ["a", "b"]}
+    assert load_sent(path, TODAY) == ({"new-7days": "2025-01-15", "half-3days": "2025-01-11"}, {"half-3days": {"a", "b"}})
+    assert load_sent(path, date(2025, 1, 12)) == ({"new-7days": "2025-01-15"}, {})
+    assert not (tmp_path / "sent.json.tmp").exists()
+
+
+def test_state_files_holding_only_tags_still_load(tmp_path):
+    path = tmp_path / "sent.json"
+    path.write_text(json.dumps({"old-7days": "2024-12-31", "new-7days": "2025-01-15"}), encoding="utf-8")
+    assert load_sent(str(path), TODAY) == ({"new-7days": "2025-01-15"}, {})
+
+
+def test_file_sink_writes_one_line_per_recipient():
+    stream = io.BytesIO()
+    sink = FileSink(stream)
+    notification = {"id": "scholarship-x-7days", "title": "छात्रवृत्ति", "priority": "normal"}
+    sink.send(notification, ["a", "b"])
+    sink.send(notification, [])
+    sink.close()
+    lines = [json.loads(line) for line in stream.getvalue().decode().splitlines()]
+    assert lines == [{"userId": "a", **notification}, {"userId": "b", **notification}]
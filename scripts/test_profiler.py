@@ -0,0 +1,46 @@
+"""
+Tests for the CareerPro J&K sampling profiler and GET /debug/profile
+The endpoint is an operator route: it needs both CAREERPRO_PROFILER=1 and the admin token
+"""
+
+import pytest
+
+import fastapi_backend as backend
+from profiler import SamplingProfiler
+
+PARAMS = {"seconds": 0.05, "interval_ms": 1}
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    profiler = SamplingProfiler()
+    monkeypatch.setattr(backend, "PROFILER", profiler)
+    return profiler
+
+
+def test_needs_the_admin_token(client, admin_headers, profiler):
+    response = client.get("/debug/profile", params=PARAMS)
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+    assert client.get("/debug/profile", params=PARAMS, headers={"Authorization": "Bearer nope"}).status_code == 401
+    assert not profiler.running
+
+
+def test_hidden_without_a_configured_token(client, monkeypatch, profiler):
+    monkeypatch.setattr(backend, "ADMIN_TOKEN", None)
+    assert client.get("/debug/profile", params=PARAMS).status_code == 404
+
+
+def test_hidden_unless_the_profiler_is_enabled(client, admin_headers, monkeypatch):
+    monkeypatch.setattr(backend, "PROFILER", None)
+    assert client.get("/debug/profile", params=PARAMS, headers=admin_headers).status_code == 404
+
+
+def test_returns_folded_stacks(client, admin_headers, profiler):
+    response = client.get("/debug/profile", params=PARAMS, headers=admin_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    for line in response.text.splitlines():
+        stack, _, count = line.rpartition(" ")
+        assert stack and int(count) > 0
+    assert not profiler.running
@@ -0,0 +1,108 @@
+"""
+Tests for CareerPro J&K quiz scoring and POST /quiz/submit
+The answer x trait matrix is checked against a loop that adds up each answer's trait weights one at a time
+"""
+
+import random
+
+import pytest
+
+from fastapi_backend import DEFAULT_RECOMMENDATIONS
+from knowledge_base import BUILTIN_KNOWLEDGE_BASE
+from quiz_scorer import LIKERT_SCALE, QuizScorer
+
+QUESTIONS = BUILTIN_KNOWLEDGE_BASE["quiz_questions"]
+
+
+@pytest.fixture(scope="module")
+def quiz_scorer():
+    return QuizScorer(QUESTIONS)
+
+
+def _loop_scores(questions, answers):
+    """Trait scores the way the quiz page added them up, one answer at a time"""
+    by_id = {str(question["id"]): question for question in questions}
+    totals, best = {}, {}
+    for question in questions:
+        for trait, weight in question["traits"].items():
+            best[trait] = best.get(trait, 0.0) + max(weight * multiplier for multiplier in LIKERT_SCALE if weight * multiplier >= 0)
+    for question_id, answer in answers.items():
+        question = by_id[str(question_id)]
+        option = answer if isinstance(answer, int) else [text.lower() for text in question["options"]].index(answer.lower())
+        for trait, weight in question["traits"].items():
+            totals[trait] = totals.get(trait, 0.0) + weight * LIKERT_SCALE[option]
+    return {trait: round(total / (best[trait] or 1), 4) for trait, total in totals.items() if total > 0}
+
+
+def _ranking(scores):
+    return sorted(scores, key=lambda trait: (-scores[trait], trait))
+
+
+def test_scores_and_ranking_match_the_per_answer_loop(quiz_scorer):
+    rng = random.Random(13)
+    for _ in range(200):
+        answered = rng.sample(QUESTIONS, rng.randrange(1, len(QUESTIONS) + 1))
+        answers = {
+            str(question["id"]): rng.choice([rng.randrange(len(question["options"])), rng.choice(question["options"])])
+            for question in answered
+        }
+        expected = _loop_scores(QUESTIONS, answers)
+        scores = quiz_scorer.score(answers)
+        assert scores == pytest.approx(expected, abs=1e-4)
+        assert _ranking(scores) == _ranking(expected)
+        assert all(0 < score <= 1 for score in scores.values())
+
+
+def test_text_and_index_answers_agree(quiz_scorer):
+    question = QUESTIONS[0]
+    for index, option in enumerate(question["options"]):
+        by_index = quiz_scorer.score({question["id"]: index})
+        assert quiz_scorer.score({str(question["id"]): option.upper()}) == by_index
+
+
+def test_strongest_agreement_everywhere_scores_one(quiz_scorer):
+    scores = quiz_scorer.score({question["id"]: 0 for question in QUESTIONS})
+    positive = {trait for question in QUESTIONS for trait, weight in question["traits"].items() if weight > 0}
+    assert all(scores[trait] > 0 for trait in positive)
+    assert max(scores.values()) == 1.0
+
+
+@pytest.mark.parametrize("answers, message", [
+    ({"99": 0}, "Unknown quiz question"),
+    ({"1": 5}, "out of range"),
+    ({"1": -1}, "out of range"),
+    ({"1": "Maybe"}, "Unknown option"),
+    ({"1": True}, "Unknown option"),
+])
+def test_unknown_answers(quiz_scorer, answers, message):
+    with pytest.raises(ValueError, match=message):
+        quiz_scorer.score(answers)
+
+
+def test_submit_with_text_and_index_answers(client):
+    answers = {"1": "Strongly Agree", "2": 0, "3": "strongly prefer independent"}
+    response = client.post("/quiz/submit", json={"userId": "quiz-user", "answers": answers, "top_k": 3})
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["userId"], body["answeredQuestions"], body["totalQuestions"]) == ("quiz-user", 3, len(QUESTIONS))
+    assert body["traits"] == pytest.approx(_loop_scores(QUESTIONS, {"1": 0, "2": 0, "3": 4}), abs=1e-4)
+    recommendations = body["recommendations"]
+    assert 1 <= len(recommendations) <= 3
+    assert recommendations[0]["title"] == "Software Developer"
+    matches = [career["match_percentage"] for career in recommendations]
+    assert matches == sorted(matches, reverse=True)
+
+
+@pytest.mark.parametrize("answers", [{"99": 0}, {"1": "Maybe"}, {"1": 7}])
+def test_submit_rejects_unknown_questions_and_options(client, answers):
+    response = client.post("/quiz/submit", json={"answers": answers})
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("top_k, status", [(None, 200), (1, 200), (0, 422), (10**6, 422), (True, 422), ("3", 422)])
+def test_submit_top_k(client, top_k, status):
+    body = {"answers": {"1": 0}, **({} if top_k is None else {"top_k": top_k})}
+    response = client.post("/quiz/submit", json=body)
+    assert response.status_code == status
+    if status == 200:
+        assert 1 <= len(response.json()["recommendations"]) <= (top_k or DEFAULT_RECOMMENDATIONS)
@@ -0,0 +1,22 @@
+"""
+Tests for CareerPro J&K POST /recommendations
+Request validation of the vectorized career scorer's endpoint
+"""
+
+import pytest
+
+
+@pytest.mark.parametrize("top_k, status", [(3, 200), (True, 422), (0, 422), ("3", 422)])
+def test_top_k(client, top_k, status):
+    response = client.post("/recommendations", json={"interests": ["technology"], "skills": [], "top_k": top_k})
+    assert response.status_code == status
+    if status == 200:
+        recommendations = response.json()["recommendations"]
+        assert 1 <= len(recommendations) <= top_k
+        assert recommendations[0]["title"] == "Software Developer"
+
+
+@pytest.mark.parametrize("min_salary, status", [(0, 200), (-1, 422), (False, 422)])
+def test_min_salary(client, min_salary, status):
+    response = client.post("/recommendations", json={"interests": ["technology"], "min_salary": min_salary})
+    assert response.status_code == status
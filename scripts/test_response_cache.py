@@ -0,0 +1,37 @@
+"""
+Tests for the CareerPro J&K pre-serialized response cache
+Strong ETags per encoding, 304 answers and query-order-insensitive cache keys, through GET /colleges
+"""
+
+from response_cache import cache_key
+
+
+def test_matching_etag_gets_304(client):
+    first = client.get("/colleges", params={"district": "Srinagar"})
+    etag = first.headers["ETag"]
+    again = client.get("/colleges", params={"district": "Srinagar"}, headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["ETag"] == etag
+
+
+def test_stale_or_weak_etags(client):
+    etag = client.get("/colleges").headers["ETag"]
+    assert client.get("/colleges", headers={"If-None-Match": '"stale"'}).status_code == 200
+    assert client.get("/colleges", headers={"If-None-Match": f'"stale", W/{etag}'}).status_code == 304
+
+
+def test_each_encoding_has_its_own_etag(client):
+    identity = client.get("/colleges", headers={"Accept-Encoding": "identity"})
+    gzipped = client.get("/colleges", headers={"Accept-Encoding": "gzip"})
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    assert gzipped.json() == identity.json()
+    assert gzipped.headers["ETag"] != identity.headers["ETag"]
+    stale = client.get("/colleges", headers={"Accept-Encoding": "gzip", "If-None-Match": identity.headers["ETag"]})
+    assert stale.status_code == 200
+
+
+def test_query_parameter_order_shares_an_entry(client):
+    assert cache_key("/colleges", "b=2&a=1") == cache_key("/colleges", "a=1&b=2")
+    etag = client.get("/colleges?district=Jammu&min_rating=4").headers["ETag"]
+    assert client.get("/colleges?min_rating=4&district=Jammu", headers={"If-None-Match": etag}).status_code == 304
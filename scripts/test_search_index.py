@@ -0,0 +1,79 @@
+"""
+Tests for the CareerPro J&K search index and GET /search
+BM25 ranking, typeahead prefixes and matching across Devanagari, Romanized Hindi and English spellings
+"""
+
+import pytest
+
+from search_index import SearchIndex, knowledge_base_documents
+from transliteration import tokenize
+
+
+@pytest.fixture(scope="module")
+def search_index():
+    return SearchIndex(knowledge_base_documents({
+        "colleges": [
+            {"name": "Government Medical College", "district": "Srinagar", "website": "https://medical.example"},
+            {"name": "Engineering College", "district": "Jammu", "courses": ["B.Tech"]},
+        ],
+        "scholarships": [{"name": "Medical Merit Scholarship", "eligibility": "MBBS students"}],
+    }))
+
+
+def _docs(results):
+    return [doc for doc, _ in results]
+
+
+def test_title_match_ranks_first(search_index):
+    results = search_index.search("medical college")
+    assert _docs(results)[0] == 0
+    assert [score for _, score in results] == sorted((score for _, score in results), reverse=True)
+
+
+def test_last_word_matches_as_prefix(search_index):
+    assert _docs(search_index.search("engin")) == [1]
+    assert search_index.search("engin", prefix=False) == []
+
+
+def test_sections_filter(search_index):
+    assert search_index.sections == ["colleges", "scholarships"]
+    assert _docs(search_index.search("medical", sections=["scholarships"])) == [2]
+
+
+def test_skipped_fields_are_not_searched(search_index):
+    assert search_index.search("example", prefix=False) == []
+
+
+def test_tokenize_folds_case_and_compatibility_forms():
+    assert tokenize("Ｂ.Tech, MBBS—Srinagar") == ["b", "tech", "mbbs", "srinagar"]
+    assert tokenize("कॉलेजों में") == ["कॉलेजों", "में"]
+
+
+@pytest.mark.parametrize("query, english, docs", [
+    ("श्रीनगर", "srinagar", {0}),
+    ("Shrinagar", "srinagar", {0}),
+    ("कॉलेज", "college", {0, 1}),
+    ("kolej", "college", {0, 1}),
+    ("kolej जम्मू", "college jammu", {0, 1}),
+])
+def test_hindi_and_romanized_queries_find_english_records(search_index, query, english, docs):
+    results = search_index.search(query, prefix=False)
+    assert set(_docs(results)) == docs
+    assert results == search_index.search(english, prefix=False)
+
+
+@pytest.mark.parametrize("typed", ["eng", "engi", "Engineering c", "कॉले", "colle", "k"])
+def test_partly_typed_words_complete_across_key_folds(search_index, typed):
+    # "eng" keys to "eng" while "engineering" keys to "enjiniring"; "c" and "k" both start "kolej"
+    assert 1 in _docs(search_index.search(typed))
+
+
+def test_devanagari_prefix(search_index):
+    assert 0 in _docs(search_index.search("श्रीन"))
+
+
+def test_endpoint_searches_in_either_script(client):
+    english = client.get("/search", params={"q": "Srinagar", "prefix": False})
+    assert english.status_code == 200
+    assert english.json()
+    assert client.get("/search", params={"q": "श्रीनगर", "prefix": False}).json() == english.json()
@@ -0,0 +1,127 @@
+"""
+Tests for the CareerPro J&K in-memory session store and the /chat/sessions routes
+TTL expiry, LRU and byte-budget eviction, and the per-user context cap
+"""
+
+import types
+
+import pytest
+
+import session_store
+from session_store import SESSION_OVERHEAD_BYTES, ContextTooLarge, InMemorySessionStore, context_entry_size
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(session_store, "time", types.SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+def _turn(text="hello"):
+    return [("user", text, None)]
+
+
+def test_turns_are_kept_in_a_ring_buffer(clock):
+    store = InMemorySessionStore(max_turns=3)
+    for number in range(5):
+        store.append_turns("u", _turn(f"message {number}"))
+    assert [turn["text"] for turn in store.get("u")["turns"]] == ["message 2", "message 3", "message 4"]
+    # The byte count follows the three turns kept, not the five appended
+    assert store.size == SESSION_OVERHEAD_BYTES + sum(store._turn_size((0, "user", f"message {n}", None)) for n in (2, 3, 4))
+
+
+def test_text_is_truncated(clock):
+    store = InMemorySessionStore(max_text_length=5)
+    store.append_turns("u", _turn("x" * 100))
+    assert store.get("u")["turns"][0]["text"] == "xxxxx"
+
+
+def test_sessions_expire_after_their_last_write(clock):
+    store = InMemorySessionStore(ttl=60)
+    store.append_turns("u", _turn())
+    clock[0] += 59
+    assert store.get("u") is not None
+    # Reading does not renew the session
+    clock[0] += 2
+    assert store.get("u") is None
+    assert len(store) == 0 and store.size == 0
+
+
+def test_least_recently_written_session_is_evicted_first(clock):
+    store = InMemorySessionStore(max_sessions=2)
+    store.append_turns("a", _turn())
+    store.append_turns("b", _turn())
+    store.get("a")
+    store.append_turns("c", _turn())
+    assert store.get("a") is None
+    assert store.get("b") is not None and store.get("c") is not None
+    assert store.stats()["evictions"] == 1
+
+
+def test_expired_sessions_go_before_live_ones(clock):
+    store = InMemorySessionStore(ttl=60, max_sessions=2)
+    store.append_turns("old", _turn())
+    clock[0] += 30
+    store.append_turns("live", _turn())
+    clock[0] += 31
+    store.append_turns("new", _turn())
+    assert store.get("old") is None
+    assert store.get("live") is not None and store.get("new") is not None
+
+
+def test_byte_budget_evicts_until_within_limit(clock):
+    store = InMemorySessionStore(max_bytes=3000)
+    for user in "abcdef":
+        store.append_turns(user, _turn("x" * 500))
+    assert store.size <= 3000
+    assert store.get("f") is not None
+    assert store.get("a") is None
+
+
+def test_context_is_merged_and_sized_incrementally(clock):
+    store = InMemorySessionStore()
+    store.update_context("u", {"stream": "science", "traits": [1, 2]})
+    store.update_context("u", {"stream": "arts"})
+    assert store.get("u")["context"] == {"stream": "arts", "traits": [1, 2]}
+    session = store._sessions["u"]
+    assert session.context_size == context_entry_size("stream", "arts") + context_entry_size("traits", [1, 2])
+    assert store.size == SESSION_OVERHEAD_BYTES + session.context_size
+
+
+def test_oversized_context_is_refused_without_storing_anything(clock):
+    store = InMemorySessionStore(max_context_bytes=100)
+    store.append_turns("other", _turn())
+    with pytest.raises(ContextTooLarge):
+        store.update_context("u", {"notes": "x" * 1000})
+    assert store.get("u") is None
+    store.update_context("u", {"notes": "short"})
+    with pytest.raises(ContextTooLarge):
+        store.update_context("u", {"more": "x" * 90})
+    assert store.get("u")["context"] == {"notes": "short"}
+    assert store.get("other") is not None
+
+
+def test_clear(clock):
+    store = InMemorySessionStore()
+    store.append_turns("u", _turn())
+    assert store.clear("u") is True
+    assert store.clear("u") is False
+    assert store.size == 0
+
+
+def test_session_routes_need_the_admin_token(client, admin_headers):
+    client.post("/chat", json={"message": "Hello", "user_id": "session-route-user"})
+    assert client.get("/chat/sessions/session-route-user").status_code == 401
+    session = client.get("/chat/sessions/session-route-user", headers=admin_headers)
+    assert session.status_code == 200
+    assert session.json()["turns"][0]["text"] == "Hello"
+    assert client.delete("/chat/sessions/session-route-user", headers=admin_headers).json() == {"deleted": True}
+    assert client.get("/chat/sessions/session-route-user", headers=admin_headers).status_code == 404
+
+
+def test_oversized_context_is_413(client):
+    response = client.post(
+        "/chat", json={"message": "Hello", "user_id": "session-big-context", "context": {"notes": "x" * 100_000}}
+    )
+    assert response.status_code == 413
@@ -0,0 +1,96 @@
+"""
+Tests for the CareerPro J&K timeline index and GET /timeline
+Window, type and eligibility filters are checked against a scan of the same events
+"""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from timeline_index import TimelineIndex, parse_date_range
+
+
+@pytest.fixture(scope="module")
+def events():
+    rng = random.Random(5)
+    events = []
+    for number in range(200):
+        start = date(2025, 1, 1) + timedelta(days=rng.randrange(365))
+        end = start + timedelta(days=rng.choice([0, 0, 3, 30]))
+        events.append({
+            "id": str(number),
+            "type": rng.choice(["deadline", "exam", "scholarship"]),
+            "date": start.isoformat(),
+            "endDate": end.isoformat(),
+            "eligibility": [rng.choice(["12th pass", "Graduate"])],
+        })
+    return events
+
+
+def test_window_matches_a_scan(events):
+    index = TimelineIndex(events)
+    start, end = date(2025, 3, 1), date(2025, 3, 31)
+    found = index.query(start=start, end=end, types=["deadline"], eligibility="graduate")
+    expected = [
+        event for event in events
+        if event["date"] <= end.isoformat() and event["endDate"] >= start.isoformat()
+        and event["type"] == "deadline" and "Graduate" in event["eligibility"]
+    ]
+    assert sorted(event["id"] for event in found) == sorted(event["id"] for event in expected)
+    assert [event["date"] for event in found] == sorted(event["date"] for event in found)
+
+
+def test_open_ended_windows(events):
+    index = TimelineIndex(events)
+    assert len(index.query()) == len(events)
+    cutoff = date(2025, 6, 1)
+    assert {event["id"] for event in index.query(start=cutoff)} == {
+        event["id"] for event in events if event["endDate"] >= cutoff.isoformat()
+    }
+    assert {event["id"] for event in index.query(end=cutoff)} == {
+        event["id"] for event in events if event["date"] <= cutoff.isoformat()
+    }
+
+
+def test_parse_date_range():
+    assert parse_date_range("January 15, 2025") == (date(2025, 1, 15), date(2025, 1, 15))
+    assert parse_date_range("February 2025") == (date(2025, 2, 1), date(2025, 2, 28))
+    assert parse_date_range("sometime soon") is None
+
+
+def _titles(response):
+    assert response.status_code == 200
+    return [event["title"] for event in response.json()]
+
+
+def test_endpoint_window(client):
+    everything = client.get("/timeline").json()
+    assert [event["date"] for event in everything] == sorted(event["date"] for event in everything)
+    assert {event["status"] for event in everything} <= {"upcoming", "ongoing", "past"}
+
+    # "January 2025" spans the whole month, so it overlaps a window starting mid-month
+    titles = _titles(client.get("/timeline", params={"start": "2025-01-10", "end": "2025-01-31"}))
+    assert titles == ["JEE Main", "J&K Merit Scholarship Deadline"]
+
+
+def test_endpoint_type_filter(client):
+    assert _titles(client.get("/timeline", params={"type": "deadline"})) == [
+        "JEE Main Registration Deadline", "NEET Registration Deadline"
+    ]
+    both = _titles(client.get("/timeline", params=[("type", "exam"), ("type", "scholarship")]))
+    assert both == ["JEE Main", "J&K Merit Scholarship Deadline", "Chief Minister's Scholarship Deadline", "NEET"]
+
+
+def test_endpoint_eligibility_filter(client):
+    assert _titles(client.get("/timeline", params={"eligibility": "medical"})) == [
+        "NEET Registration Deadline", "NEET"
+    ]
+    assert _titles(client.get("/timeline", params={"eligibility": "WEAKER", "type": "scholarship"})) == [
+        "Chief Minister's Scholarship Deadline"
+    ]
+
+
+def test_endpoint_rejects_inverted_window(client):
+    assert client.get("/timeline", params={"start": "2025-02-01", "end": "2025-01-01"}).status_code == 400
+    assert client.get("/timeline", params={"start": "soon"}).status_code == 422
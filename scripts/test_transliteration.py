@@ -0,0 +1,92 @@
+"""
+Unit tests for CareerPro J&K script-neutral matching
+Token keys across Devanagari, Romanized and English spellings, prefix keys, fuzzy correction and intent classification
+"""
+
+import pytest
+
+from intent_classifier import IntentClassifier
+from transliteration import FuzzyIndex, edit_distance, prefix_keys, text_keys, token_key, transliterate
+
+
+@pytest.mark.parametrize("devanagari, latin", [("नमस्ते", "namaste"), ("कॉलेज", "kolej"), ("ज़िला", "zilaa")])
+def test_transliterate(devanagari, latin):
+    assert transliterate(devanagari) == latin
+
+
+@pytest.mark.parametrize("spellings", [
+    ("नमस्ते", "namaste", "Namaste"),
+    ("छात्रवृत्ति", "chhatravritti", "chatravriti"),
+    ("naukaree", "naukari"),
+    ("wazifa", "vazifa"),
+    ("college", "कॉलेज", "kolej", "colege"),
+    ("engineering", "enginiring"),
+])
+def test_spellings_share_one_key(spellings):
+    assert len({" ".join(text_keys(spelling)) for spelling in spellings}) == 1
+
+
+def test_digits_survive():
+    assert token_key("१२") == "12"
+    assert text_keys("B.Tech 2025") == ["b", "tec", "2025"]
+
+
+@pytest.mark.parametrize("typed, keys", [("eng", ["eng", "enj"]), ("c", ["c", "k"]), ("ch", ["c"]), ("कॉले", ["kol"]), ("छात्रवृ", ["catravr"])])
+def test_prefix_keys_cover_every_word_the_prefix_can_grow_into(typed, keys):
+    assert prefix_keys(typed) == keys
+
+
+def test_edit_distance_counts_transpositions_once():
+    assert edit_distance("college", "colege") == 1
+    assert edit_distance("college", "cllooege") == 3
+    assert edit_distance("abcd", "abdc") == 1
+
+
+class TestFuzzyIndex:
+    @pytest.fixture
+    def index(self):
+        return FuzzyIndex(["srinagar", "anantnag", "scholarship", "b2025"])
+
+    def test_corrects_within_the_allowed_edits(self, index):
+        assert index.correct("srinagr") == "srinagar"
+        assert index.correct("scolarshp") == "scholarship"
+
+    def test_short_keys_and_identifiers_are_exact(self, index):
+        assert index.correct("jamu") == "jamu"
+        assert index.correct("b2026") == "b2026"
+
+    def test_too_distant_keys_are_left_alone(self, index):
+        assert index.correct("baramulla") == "baramulla"
+
+
+class TestIntentClassifier:
+    @pytest.fixture
+    def classifier(self):
+        return IntentClassifier({
+            "greeting": ["hi", "namaste"],
+            "scholarship_info": ["scholarship", "छात्रवृत्ति", "financial aid"],
+            "college_info": ["college", "कॉलेज"],
+        })
+
+    @pytest.mark.parametrize("message, intent", [
+        ("Hi there", "greeting"),
+        ("namastey", "greeting"),
+        ("Tell me about colleges", "college_info"),
+        ("कॉलेजों के बारे में", "college_info"),
+        ("colege kaha hai", "college_info"),
+        ("kolej kaha hai", "college_info"),
+        ("chatravriti kab milegi", "scholarship_info"),
+        ("any financial aid for colleges?", "scholarship_info"),
+        ("financial planning", "default"),
+        ("scholarships", "scholarship_info"),
+        ("something else", "default"),
+    ])
+    def test_classify(self, classifier, message, intent):
+        assert classifier.classify(message) == intent
+
+    def test_earlier_intents_win(self, classifier):
+        assert classifier.classify("hi, which college has a scholarship?") == "greeting"
+
+    def test_normalize(self, classifier):
+        # "college", the misspelt "colege" and कॉलेज share one key
+        assert classifier.normalize("Colege, kaha?") == classifier.normalize("college kaha") == classifier.normalize("कॉलेज kaha") == " kolej kaha "
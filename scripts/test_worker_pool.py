@@ -0,0 +1,85 @@
+"""
+Tests for the CareerPro J&K worker pools
+Admission control, inline execution of cheap calls, the CPU-time average and the busy answer it leads to
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+import fastapi_backend as backend
+from worker_pool import PoolSaturated, WorkerPool
+
+
+@pytest.fixture
+def pool():
+    pool = WorkerPool("test", workers=1, queue_size=1, inline_seconds=0.0)
+    yield pool
+    pool.shutdown()
+
+
+def test_runs_calls_in_the_executor(pool):
+    thread = asyncio.run(pool.run(lambda: threading.current_thread().name))
+    assert thread.startswith("careerpro-test")
+    assert pool.stats()["completed"] == 1
+    assert pool.pending == 0
+
+
+def test_rejects_calls_beyond_workers_plus_queue(pool):
+    release = threading.Event()
+
+    async def main():
+        running = [asyncio.ensure_future(pool.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(PoolSaturated) as rejected:
+            await pool.run(lambda: None)
+        release.set()
+        await asyncio.gather(*running)
+        return rejected.value
+
+    rejected = asyncio.run(main())
+    assert rejected.retry_after >= 1
+    assert pool.stats()["rejected"] == 1
+    assert pool.pending == 0
+
+
+def test_cheap_calls_run_inline_once_measured():
+    pool = WorkerPool("inline", workers=1, queue_size=1, inline_seconds=10.0)
+    try:
+        main_thread = threading.current_thread().name
+        first = asyncio.run(pool.run(lambda: threading.current_thread().name))
+        second = asyncio.run(pool.run(lambda: threading.current_thread().name))
+        assert first != main_thread
+        assert second == main_thread
+        assert pool.stats()["inline"] is True
+    finally:
+        pool.shutdown()
+
+
+def test_failed_tasks_stay_out_of_the_average(pool):
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(pool.run(fail))
+    assert pool.completed == 1
+    assert pool._measured == 0
+    assert pool.stats()["inline"] is False
+
+
+def test_unknown_kind():
+    with pytest.raises(ValueError, match="Unknown worker pool kind"):
+        WorkerPool("bad", kind="fiber")
+
+
+def test_saturated_endpoint_answers_with_retry_after(client, monkeypatch):
+    pool = backend.WORKER_POOLS["recommendations"]
+
+    async def saturated(*args):
+        raise PoolSaturated(pool, retry_after=2)
+
+    monkeypatch.setattr(pool, "run", saturated)
+    response = client.post("/recommendations", json={"interests": ["technology"]})
+    assert response.status_code == pool.status_code
+    assert response.headers["Retry-After"] == "2"
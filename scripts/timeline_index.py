@@ -0,0 +1,166 @@
+"""
+Timeline index for CareerPro J&K deadlines and exam dates
+Parses free-text dates from the knowledge base once and answers date-window queries by bisection
+"""
+
+import calendar
+import logging
+import re
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from transliteration import tokenize
+
+logger = logging.getLogger(__name__)
+
+# Formats tried in order; month-only dates cover the whole month
+_DAY_FORMATS = ("%B %d, %Y", "%b %d, %Y", "%d %B %Y", "%d %b %Y", "%Y-%m-%d", "%d/%m/%Y")
+_MONTH_FORMATS = ("%B %Y", "%b %Y", "%Y-%m")
+_SPACES = re.compile(r"\s+")
+
+# Record fields that restrict who an event concerns, copied onto its events when present
+AUDIENCE_FIELDS = ("district", "courses")
+
+
+def parse_date_range(text: str) -> Optional[Tuple[date, date]]:
+    """Parse "January 15, 2025" or "May 2025" into an inclusive (start, end) date range"""
+    text = _SPACES.sub(" ", str(text).strip().rstrip("."))
+    for fmt in _DAY_FORMATS:
+        try:
+            day = datetime.strptime(text, fmt).date()
+            return day, day
+        except ValueError:
+            pass
+    for fmt in _MONTH_FORMATS:
+        try:
+            first = datetime.strptime(text, fmt).date()
+            return first, first.replace(day=calendar.monthrange(first.year, first.month)[1])
+        except ValueError:
+            pass
+    return None
+
+
+def record_slug(record: Mapping[str, Any]) -> str:
+    """Stable id part for a record: the words of its name, which identify it within its section (see ingest.dedupe_key)"""
+    return "-".join(tokenize(str(record["name"])))
+
+
+def timeline_events(knowledge_base: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    """Timeline events for every scholarship deadline, exam registration deadline and exam date.
+
+    Event ids come from the record's section and name, not its position,
+    so they survive reordering or replacing the catalog.
+    """
+    events: List[Dict[str, Any]] = []
+
+    def add(event_id: str, text: str, record: Mapping[str, Any], **event: Any) -> None:
+        parsed = parse_date_range(text)
+        if parsed is None:
+            logger.warning(f"Skipping timeline event {event_id}: unrecognised date '{text}'")
+            return
+        start, end = parsed
+        audience = {field: record[field] for field in AUDIENCE_FIELDS if record.get(field)}
+        event = {"id": event_id, "name": record["name"], **event, **audience, "date": start.isoformat()}
+        if end != start:
+            event["endDate"] = end.isoformat()
+        events.append(event)
+
+    for scholarship in knowledge_base.get("scholarships", []):
+        if scholarship.get("deadline"):
+            add(
+                f"scholarship-{record_slug(scholarship)}",
+                scholarship["deadline"],
+                scholarship,
+                title=f"{scholarship['name']} Deadline",
+                type="scholarship",
+                amount=scholarship.get("amount"),
+                eligibility=[scholarship["eligibility"]] if scholarship.get("eligibility") else [],
+                link=scholarship.get("website"),
+            )
+
+    for exam in knowledge_base.get("entrance_exams", []):
+        eligibility = [exam["for"]] if exam.get("for") else []
+        if exam.get("registration_deadline"):
+            add(
+                f"exam-{record_slug(exam)}-registration",
+                exam["registration_deadline"],
+                exam,
+                title=f"{exam['name']} Registration Deadline",
+                type="deadline",
+                eligibility=eligibility,
+                link=exam.get("website"),
+            )
+        if exam.get("exam_date"):
+            add(
+                f"exam-{record_slug(exam)}",
+                exam["exam_date"],
+                exam,
+                title=exam["name"],
+                type="exam",
+                eligibility=eligibility,
+                link=exam.get("website"),
+            )
+    return events
+
+
+class TimelineIndex:
+    """Events sorted by start date, queried for overlap with a date window.
+
+    An event [start, end] overlaps the window [A, B] when start <= B and
+    end >= A. Since no event lasts longer than the longest one indexed, every
+    overlapping event starts within [A - longest, B], so a query is two
+    bisections plus a check of that slice rather than a scan of all events.
+    Parsed dates are kept as ordinals so comparisons are plain integers.
+    """
+
+    def __init__(self, events: Iterable[Dict[str, Any]]):
+        entries = []
+        for event in events:
+            start = date.fromisoformat(event["date"]).toordinal()
+            end = date.fromisoformat(event.get("endDate", event["date"])).toordinal()
+            entries.append((start, end, event))
+        entries.sort(key=lambda entry: (entry[0], entry[1]))
+
+        self.events: List[Dict[str, Any]] = [event for _, _, event in entries]
+        self._starts: List[int] = [start for start, _, _ in entries]
+        self._ends: List[int] = [end for _, end, _ in entries]
+        self._eligibility: List[str] = [" ".join(event.get("eligibility", [])).lower() for event in self.events]
+        self._longest = max((end - start for start, end, _ in entries), default=0)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def query(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        types: Optional[Iterable[str]] = None,
+        eligibility: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Events overlapping [start, end] in date order, optionally limited by type and eligibility text"""
+        low = start.toordinal() if start else None
+        high = end.toordinal() if end else None
+        first = 0 if low is None else bisect_left(self._starts, low - self._longest)
+        last = len(self._starts) if high is None else bisect_right(self._starts, high)
+
+        types = set(types) if types else None
+        eligibility = eligibility.lower() if eligibility else None
+        return [
+            self.events[i]
+            for i in range(first, last)
+            if (low is None or self._ends[i] >= low)
+            and (types is None or self.events[i]["type"] in types)
+            and (eligibility is None or eligibility in self._eligibility[i])
+        ]
+
+
+def event_status(event: Dict[str, Any], today: date) -> str:
+    """Whether an event is upcoming, ongoing or past as of ``today``"""
+    start = date.fromisoformat(event["date"])
+    end = date.fromisoformat(event.get("endDate", event["date"]))
+    if today < start:
+        return "upcoming"
+    if today <= end:
+        return "ongoing"
+    return "past"
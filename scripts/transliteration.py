@@ -0,0 +1,209 @@
+"""
+Script-neutral token keys for CareerPro J&K matching
+Folds Devanagari, Romanized Hindi and English spellings of a word to one Latin key and corrects misspelt keys against a known vocabulary
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Set
+
+# Distinct tokens whose keys are remembered, shared by every caller
+TOKEN_CACHE_SIZE = 65536
+
+# Key lengths from which one and then two edits are corrected; shorter keys must match exactly
+FUZZY_MIN_LENGTHS = (5, 9)
+
+# A word starts with a letter or digit of any script and continues through combining marks,
+# so Devanagari vowel signs, nukta and virama stay inside it; the danda (।, ॥) separates words
+_WORD = re.compile(r"[^\W_][\w\u0300-\u036f\u0900-\u0963\u0966-\u097f\u200c\u200d]*")
+
+_VIRAMA = "\u094d"
+_NUKTA = "\u093c"
+
+_CONSONANTS = {
+    "क": "k", "ख": "kh", "ग": "g", "घ": "gh", "ङ": "n",
+    "च": "ch", "छ": "chh", "ज": "j", "झ": "jh", "ञ": "n",
+    "ट": "t", "ठ": "th", "ड": "d", "ढ": "dh", "ण": "n",
+    "त": "t", "थ": "th", "द": "d", "ध": "dh", "न": "n",
+    "प": "p", "फ": "ph", "ब": "b", "भ": "bh", "म": "m",
+    "य": "y", "र": "r", "ल": "l", "ळ": "l", "व": "v",
+    "श": "sh", "ष": "sh", "स": "s", "ह": "h",
+}
+
+# Consonants whose sound changes with a nukta (ज़ is z, ड़ is r); the rest keep their sound
+_NUKTA_CONSONANTS = {"क": "q", "ख": "kh", "ग": "g", "ज": "z", "ड": "r", "ढ": "rh", "फ": "f"}
+
+_VOWEL_SIGNS = {
+    "ा": "aa", "ि": "i", "ी": "ii", "ु": "u", "ू": "uu", "ृ": "ri", "ॄ": "ri",
+    "े": "e", "ै": "ai", "ो": "o", "ौ": "au", "ॉ": "o", "ॅ": "e", "ॆ": "e", "ॊ": "o",
+}
+
+_VOWELS = {
+    "अ": "a", "आ": "aa", "इ": "i", "ई": "ii", "उ": "u", "ऊ": "uu", "ऋ": "ri",
+    "ए": "e", "ऐ": "ai", "ओ": "o", "औ": "au", "ऑ": "o", "ऍ": "e", "ऎ": "e", "ऒ": "o",
+}
+
+# Chandrabindu and anusvara both nasalize; visarga is a breathy h
+_SIGNS = {"ँ": "n", "ं": "n", "ः": "h", "ॐ": "om"}
+
+# Romanized Hindi has no fixed spelling: "chhatravritti" and "chatravriti", "naukaree" and
+# "naukari", "vazifa" and "wazifa" are the same word. Both scripts are folded after
+# transliteration, so a Devanagari keyword also matches its Romanized spellings.
+_LONG_VOWELS = re.compile(r"ee|oo")
+# English loanwords are written as they sound in Hindi: a hard c is k, a soft g is j and a
+# final silent e is dropped, so "college" and कॉलेज ("kolej") share a key
+_HARD_C = re.compile(r"c(?![hiey])")
+_SOFT_G = re.compile(r"g(?=[eiy])")
+_SILENT_E = re.compile(r"(?<=\w[aeiou][^aeiou])e$")
+_LETTER_FOLDS = str.maketrans({"w": "v", "z": "j", "q": "k", "f": "p"})
+_ASPIRATES = re.compile(r"([bcdgjkprst])h+")
+_DOUBLED = re.compile(r"(.)\1+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Case-folded words of ``text``, NFKC-normalised so composed and decomposed spellings match"""
+    return _WORD.findall(unicodedata.normalize("NFKC", text).casefold())
+
+
+def transliterate(token: str) -> str:
+    """Latin spelling of a Devanagari token; Latin letters lose their accents and other characters pass through.
+
+    Consonants carry the inherent "a" unless a vowel sign or virama follows,
+    except at the end of a word of more than one letter, where Hindi drops it
+    (नमस्ते is "namaste", कॉलेज is "kolej").
+    """
+    out: List[str] = []
+    pending = False
+    # NFD splits nukta letters (क़) and accented Latin letters into base + mark
+    chars = unicodedata.normalize("NFD", token)
+    for i, char in enumerate(chars):
+        consonant = _CONSONANTS.get(char)
+        if consonant is not None:
+            if pending:
+                out.append("a")
+            if i + 1 < len(chars) and chars[i + 1] == _NUKTA:
+                consonant = _NUKTA_CONSONANTS.get(char, consonant)
+            out.append(consonant)
+            pending = True
+        elif char in _VOWEL_SIGNS:
+            out.append(_VOWEL_SIGNS[char])
+            pending = False
+        elif char == _VIRAMA:
+            pending = False
+        elif unicodedata.combining(char) or char in "\u200c\u200d\u093d":
+            # Nuktas were folded into their consonant; Latin accents, joiners and avagraha are dropped
+            continue
+        else:
+            if pending:
+                out.append("a")
+                pending = False
+            if char in _VOWELS:
+                out.append(_VOWELS[char])
+            elif char in _SIGNS:
+                out.append(_SIGNS[char])
+            else:
+                digit = unicodedata.decimal(char, None)
+                out.append(char if digit is None else str(digit))
+    if pending and len(out) == 1:
+        out.append("a")
+    return "".join(out)
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def token_key(token: str) -> str:
+    """Match key of one token from ``tokenize``: transliterated, then with Romanized spelling variants folded"""
+    key = _LONG_VOWELS.sub(lambda match: "i" if match.group() == "ee" else "u", transliterate(token))
+    key = _SOFT_G.sub("j", _HARD_C.sub("k", key))
+    key = _ASPIRATES.sub(r"\1", key.translate(_LETTER_FOLDS))
+    return _SILENT_E.sub("", _DOUBLED.sub(r"\1", key))
+
+
+def text_keys(text: str) -> List[str]:
+    """Match keys of the words of ``text``, in order"""
+    return [token_key(token) for token in tokenize(text)]
+
+
+def prefix_keys(token: str) -> List[str]:
+    """Keys that the keys of words starting with ``token`` start with.
+
+    A word's key can fold letters its start alone cannot: "eng" keys to "eng"
+    but "engineering" to "enjiniring", and "c" to "k" but "chief" to "cief".
+    So the keys the token takes when a hard or a soft vowel follows are
+    tried too, minus that vowel; keys extending another one are dropped.
+    """
+    keys = {token_key(token)} | {token_key(token + vowel)[:-1] for vowel in "ai"}
+    return sorted(key for key in keys if not any(other != key and key.startswith(other) for other in keys))
+
+
+def _deletions(key: str, edits: int) -> Iterator[str]:
+    """``key`` and every string made from it by deleting up to ``edits`` characters"""
+    level = {key}
+    yield key
+    for _ in range(edits):
+        level = {variant[:i] + variant[i + 1:] for variant in level for i in range(len(variant))}
+        yield from level
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Insertions, deletions, substitutions and adjacent transpositions turning ``a`` into ``b``"""
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class FuzzyIndex:
+    """A vocabulary of match keys that corrects misspelt keys to their nearest member.
+
+    Every key is filed under all the strings made by deleting up to its
+    allowed number of characters (symmetric delete), so a lookup only
+    generates the deletions of the query and checks the few keys sharing
+    one, instead of measuring its distance to the whole vocabulary. Keys
+    are allowed more edits the longer they are (``FUZZY_MIN_LENGTHS``);
+    keys containing digits are identifiers and are never corrected.
+    Corrections are cached per key.
+    """
+
+    def __init__(self, keys: Iterable[str], cache_size: int = TOKEN_CACHE_SIZE):
+        self.keys: Set[str] = {key for key in keys if key}
+        self._deletes: Dict[str, Set[str]] = {}
+        for key in self.keys:
+            for variant in _deletions(key, self.max_edits(key)):
+                self._deletes.setdefault(variant, set()).add(key)
+        self.correct = lru_cache(maxsize=cache_size)(self._correct)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.keys
+
+    @staticmethod
+    def max_edits(key: str) -> int:
+        if any(char.isdigit() for char in key):
+            return 0
+        return sum(len(key) >= length for length in FUZZY_MIN_LENGTHS)
+
+    def _correct(self, key: str) -> str:
+        """The vocabulary key nearest to ``key`` within the edits both allow, or ``key`` itself"""
+        edits = self.max_edits(key)
+        if key in self.keys or not edits:
+            return key
+        candidates: Set[str] = set()
+        for variant in _deletions(key, edits):
+            candidates.update(self._deletes.get(variant, ()))
+        best, best_distance = key, edits + 1
+        # Sorted so that ties always go to the same key
+        for candidate in sorted(candidates):
+            distance = edit_distance(key, candidate)
+            if distance < best_distance and distance <= self.max_edits(candidate):
+                best, best_distance = candidate, distance
+        return best
@@ -0,0 +1,156 @@
+"""
+Bounded worker pools for CareerPro J&K CPU-heavy endpoints
+Runs handlers off the event loop and sheds load with Retry-After once a pool's queue is full
+"""
+
+import asyncio
+import math
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Weight of the newest task in the running average of task durations
+DURATION_SMOOTHING = 0.1
+
+
+def _timed(func: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[Any, float]:
+    """Call ``func`` and report the CPU time it used.
+
+    CPU time rather than wall time, so waiting for the GIL while the event
+    loop is busy does not make a cheap task look expensive.
+    """
+    started = time.thread_time()
+    return func(*args, **kwargs), time.thread_time() - started
+
+
+class PoolSaturated(Exception):
+    """Raised when a pool already has as many tasks as it can run and queue"""
+
+    def __init__(self, pool: "WorkerPool", retry_after: int):
+        super().__init__(f"Worker pool '{pool.name}' is saturated")
+        self.pool = pool
+        self.retry_after = retry_after
+
+
+class WorkerPool:
+    """A thread or process pool that admits at most ``workers + queue_size`` tasks.
+
+    ``run`` hands a call to the executor and awaits it without blocking the
+    event loop. Calls whose average CPU time stays under ``inline_seconds``
+    are run directly on the loop instead, since for sub-millisecond work the
+    hop to another thread (and the GIL handoff back) costs more than it
+    saves; they switch to the executor as soon as the average grows. When
+    the pool is full the call is rejected straight away with
+    ``PoolSaturated`` instead of queueing without bound, and the suggested
+    retry delay is the time the current backlog should take to drain. Process
+    pools need module-level functions and picklable arguments, and each
+    worker process keeps its own copy of the indexes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        workers: int = 4,
+        queue_size: int = 16,
+        kind: str = "thread",
+        status_code: int = 503,
+        inline_seconds: float = 0.001,
+    ):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown worker pool kind: {kind}")
+        self.name = name
+        self.workers = workers
+        self.queue_size = queue_size
+        self.kind = kind
+        self.status_code = status_code
+        self.inline_seconds = inline_seconds
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.average_seconds = 0.0
+        # Tasks whose duration went into the average
+        self._measured = 0
+        self._executor: Executor = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"careerpro-{name}")
+            if kind == "thread"
+            else ProcessPoolExecutor(max_workers=workers)
+        )
+        self._lock = threading.Lock()
+
+    def _admit(self) -> None:
+        with self._lock:
+            if self.pending >= self.workers + self.queue_size:
+                self.rejected += 1
+                backlog_seconds = self.average_seconds * self.pending / self.workers
+                raise PoolSaturated(self, max(1, math.ceil(backlog_seconds)))
+            self.pending += 1
+
+    def _finish(self, elapsed: Optional[float]) -> None:
+        """Free a task's slot and fold its CPU time into the average, unless it is unknown (None)"""
+        with self._lock:
+            self.pending -= 1
+            self.completed += 1
+            if elapsed is None:
+                return
+            self._measured += 1
+            if self._measured == 1:
+                self.average_seconds = elapsed
+            else:
+                self.average_seconds += DURATION_SMOOTHING * (elapsed - self.average_seconds)
+
+    def _task_done(self, future: Future) -> None:
+        # A task that raised in the executor never reported its CPU time; counting it as zero
+        # would drag the average down until a failing endpoint ran inline on the event loop
+        failed = future.cancelled() or future.exception() is not None
+        self._finish(None if failed else future.result()[1])
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``func(*args, **kwargs)`` in the pool, raising PoolSaturated if it is full"""
+        self._admit()
+        if self._measured and self.average_seconds < self.inline_seconds:
+            started = time.thread_time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._finish(time.thread_time() - started)
+        try:
+            future = self._executor.submit(_timed, func, args, kwargs)
+        except BaseException:
+            with self._lock:
+                self.pending -= 1
+            raise
+        # The slot is freed when the task finishes, not when an await is cancelled
+        future.add_done_callback(self._task_done)
+        result, _ = await asyncio.wrap_future(future)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "pending": self.pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "average_ms": round(self.average_seconds * 1000, 3),
+            "inline": bool(self._measured) and self.average_seconds < self.inline_seconds,
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+def worker_pool_from_env(
+    name: str, workers: int = 4, queue_size: int = 16, kind: str = "thread", inline_ms: float = 1.0
+) -> WorkerPool:
+    """Build a pool, letting CAREERPRO_POOL_<NAME>_WORKERS, _QUEUE, _KIND and _INLINE_MS override the defaults"""
+    prefix = "CAREERPRO_POOL_" + name.upper().replace("-", "_")
+    return WorkerPool(
+        name,
+        workers=int(os.environ.get(prefix + "_WORKERS", str(workers))),
+        queue_size=int(os.environ.get(prefix + "_QUEUE", str(queue_size))),
+        kind=os.environ.get(prefix + "_KIND", kind),
+        inline_seconds=float(os.environ.get(prefix + "_INLINE_MS", str(inline_ms))) / 1000,
+    )